@@ -1,3 +1,10 @@
-from .ocr import process_pdf
+__all__ = ['process_pdf', 'process_batch', 'iter_pdf_pages']
 
-__all__ = ['process_pdf']
\ No newline at end of file
+
+def __getattr__(name: str) -> object:
+    # Import the OCR module on first use, so `import bangla_pdf_ocr` stays cheap.
+    if name in __all__:
+        from . import ocr
+
+        return getattr(ocr, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
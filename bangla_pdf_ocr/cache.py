@@ -0,0 +1,192 @@
+import os
+import sys
+import time
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    import sqlite3
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# Default upper bound for the text stored in the cache (bytes).
+DEFAULT_CACHE_SIZE: int = 512 * 1024 * 1024
+# Least recently used entries read at a time while evicting.
+EVICTION_BATCH: int = 64
+
+
+def default_cache_dir() -> Path:
+    """Return the per-user cache directory for bangla-pdf-ocr."""
+    if sys.platform.startswith("win"):
+        base: Path = Path(os.environ.get("LOCALAPPDATA", Path.home() / "AppData/Local"))
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Caches"
+    else:
+        base = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    return base / "bangla-pdf-ocr"
+
+
+class PageCache:
+    """
+    Content-addressed store of page OCR results with LRU eviction.
+
+    Entries are keyed by a hash of the rasterized page bytes and the settings
+    that affect recognition, and kept in a SQLite database that can be shared
+    by threads and worker processes. When the stored text grows past
+    ``max_bytes`` the least recently used entries are evicted.
+
+    Attributes:
+        path (Path): Location of the SQLite database.
+        max_bytes (int): Size cap for the stored text.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        max_bytes: int = DEFAULT_CACHE_SIZE,
+    ) -> None:
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+        self.path: Path = Path(path) if path else default_cache_dir() / "pages.sqlite"
+        self.max_bytes: int = max_bytes
+        self._local: threading.local = threading.local()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as connection:
+            # One writer at a time, so the running total starts from an exact sum.
+            connection.execute("BEGIN IMMEDIATE")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS pages ("
+                " key TEXT PRIMARY KEY,"
+                " text TEXT NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " last_used REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS pages_last_used ON pages (last_used)"
+            )
+            # The total size of the stored text, kept up to date by triggers
+            # so writes do not have to sum the whole table.
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS totals ("
+                " name TEXT PRIMARY KEY,"
+                " value INTEGER NOT NULL)"
+            )
+            connection.execute(
+                "CREATE TRIGGER IF NOT EXISTS pages_insert AFTER INSERT ON pages"
+                " BEGIN UPDATE totals SET value = value + new.size"
+                " WHERE name = 'size'; END"
+            )
+            connection.execute(
+                "CREATE TRIGGER IF NOT EXISTS pages_update AFTER UPDATE OF size ON pages"
+                " BEGIN UPDATE totals SET value = value + new.size - old.size"
+                " WHERE name = 'size'; END"
+            )
+            connection.execute(
+                "CREATE TRIGGER IF NOT EXISTS pages_delete AFTER DELETE ON pages"
+                " BEGIN UPDATE totals SET value = value - old.size"
+                " WHERE name = 'size'; END"
+            )
+            connection.execute(
+                "INSERT OR IGNORE INTO totals (name, value)"
+                " SELECT 'size', COALESCE(SUM(size), 0) FROM pages"
+            )
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Connections cannot cross process boundaries; workers open their own.
+        state: Dict[str, Any] = self.__dict__.copy()
+        del state["_local"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._local = threading.local()
+
+    def _connect(self) -> "sqlite3.Connection":
+        """Return this thread's connection to the cache database."""
+        connection: Optional["sqlite3.Connection"] = getattr(
+            self._local, "connection", None
+        )
+        if connection is None:
+            # Imported here so that runs without a cache never load sqlite3.
+            import sqlite3
+
+            connection = sqlite3.connect(str(self.path), timeout=30)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    @staticmethod
+    def make_key(image_bytes: bytes, **settings: Any) -> str:
+        """
+        Build a cache key from page image bytes and recognition settings.
+
+        Args:
+            image_bytes (bytes): The rasterized page.
+            **settings: Options that change the OCR result (language, DPI,
+                Tesseract configuration, ...).
+
+        Returns:
+            str: A hex SHA-256 digest.
+        """
+        digest = hashlib.sha256(image_bytes)
+        for name in sorted(settings):
+            digest.update(f"\0{name}={settings[name]!r}".encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached text for a key, or None on a miss."""
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT text FROM pages WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            connection.execute(
+                "UPDATE pages SET last_used = ? WHERE key = ?", (time.time(), key)
+            )
+        return row[0]
+
+    def put(self, key: str, text: str) -> None:
+        """Store the text for a key and evict old entries past the size cap."""
+        size: int = len(text.encode("utf-8"))
+        with self._connect() as connection:
+            # An upsert rather than INSERT OR REPLACE, whose implicit delete
+            # would not fire the trigger that keeps the total size.
+            connection.execute(
+                "INSERT INTO pages (key, text, size, last_used) VALUES (?, ?, ?, ?)"
+                " ON CONFLICT (key) DO UPDATE SET text = excluded.text,"
+                " size = excluded.size, last_used = excluded.last_used",
+                (key, text, size, time.time()),
+            )
+            self._evict(connection)
+
+    def _evict(self, connection: "sqlite3.Connection") -> None:
+        """Delete least recently used entries until the cache fits its cap."""
+        total: int = connection.execute(
+            "SELECT value FROM totals WHERE name = 'size'"
+        ).fetchone()[0]
+        evicted: int = 0
+        while total > self.max_bytes:
+            oldest: List[Tuple[str, int]] = connection.execute(
+                "SELECT key, size FROM pages ORDER BY last_used LIMIT ?",
+                (EVICTION_BATCH,),
+            ).fetchall()
+            if not oldest:
+                break
+            for key, size in oldest:
+                if total <= self.max_bytes:
+                    break
+                connection.execute("DELETE FROM pages WHERE key = ?", (key,))
+                total -= size
+                evicted += 1
+        if evicted:
+            logger.info(f"Evicted {evicted} entries from the page cache")
+
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+        with self._connect() as connection:
+            connection.execute("DELETE FROM pages")
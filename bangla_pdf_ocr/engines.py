@@ -0,0 +1,729 @@
+import io
+import os
+import sys
+import ctypes
+import ctypes.util
+import hashlib
+import logging
+import subprocess
+import threading
+import time
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+
+if TYPE_CHECKING:
+    import PIL.Image
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# A page image: a file on disk, or the encoded image itself held in memory.
+PageImage = Union[Path, bytes]
+
+# Page segmentation modes and OCR engine modes accepted by Tesseract 4 and 5.
+PAGE_SEG_MODES: range = range(14)
+ENGINE_MODES: range = range(4)
+# Tesseract's OEM_DEFAULT, used by the library backends when no mode is set.
+DEFAULT_ENGINE_MODE: int = 3
+# Variables that stop Tesseract from loading its word lists (--no-dictionary).
+NO_DICTIONARY_VARIABLES: Tuple[Tuple[str, str], ...] = (
+    ("load_system_dawg", "0"),
+    ("load_freq_dawg", "0"),
+)
+
+
+class TesseractConfig(NamedTuple):
+    """
+    Tesseract options that change how pages are recognized.
+
+    Build one with :func:`make_tesseract_config`, which checks the values.
+    Variables are applied after the config files, so they override them.
+
+    Attributes:
+        psm (Optional[int]): Page segmentation mode, e.g. 4 for a single
+            column of text or 6 for one uniform block. None keeps
+            Tesseract's default (3, fully automatic).
+        oem (Optional[int]): OCR engine mode: 0 legacy, 1 LSTM only, 2 both,
+            3 default. None keeps the default.
+        variables (Tuple[Tuple[str, str], ...]): Tesseract parameters, as
+            set with ``-c NAME=VALUE``.
+        config_files (Tuple[str, ...]): Tesseract config files, by path or
+            by the name of a file in tessdata/configs.
+        tessdata_dir (Optional[str]): Directory the model is loaded from.
+            None uses Tesseract's default.
+    """
+
+    psm: Optional[int] = None
+    oem: Optional[int] = None
+    variables: Tuple[Tuple[str, str], ...] = ()
+    config_files: Tuple[str, ...] = ()
+    tessdata_dir: Optional[str] = None
+
+    def options(self) -> List[str]:
+        """Command-line options for the model directory, modes and variables."""
+        options: List[str] = []
+        if self.tessdata_dir is not None:
+            options += ["--tessdata-dir", self.tessdata_dir]
+        if self.psm is not None:
+            options += ["--psm", str(self.psm)]
+        if self.oem is not None:
+            options += ["--oem", str(self.oem)]
+        for name, value in self.variables:
+            options += ["-c", f"{name}={value}"]
+        return options
+
+    def settings(self) -> Dict[str, Any]:
+        """
+        Describe the configuration for reports and cache keys.
+
+        Config files that exist on disk are listed with a digest of their
+        contents, so editing one invalidates the cached pages.
+        """
+        files: List[str] = []
+        for name in self.config_files:
+            try:
+                digest: str = hashlib.sha256(Path(name).read_bytes()).hexdigest()
+            except OSError:
+                files.append(name)
+            else:
+                files.append(f"{name}@{digest[:16]}")
+        return {
+            "psm": self.psm,
+            "oem": self.oem,
+            "variables": dict(self.variables),
+            "config_files": files,
+            "tessdata_dir": self.tessdata_dir,
+        }
+
+
+def parse_variables(
+    variables: Union[Mapping[str, Any], Iterable[Union[str, Tuple[str, Any]]]],
+) -> Tuple[Tuple[str, str], ...]:
+    """
+    Normalize Tesseract variables to ``(name, value)`` string pairs.
+
+    Args:
+        variables: A mapping, ``(name, value)`` pairs or ``"NAME=VALUE"``
+            strings.
+
+    Returns:
+        Tuple[Tuple[str, str], ...]: The variables, in order.
+
+    Raises:
+        ValueError: If an entry has no name or is not ``NAME=VALUE``.
+    """
+    items: Iterable[Any] = (
+        variables.items() if isinstance(variables, Mapping) else variables
+    )
+    pairs: List[Tuple[str, str]] = []
+    for item in items:
+        if isinstance(item, str):
+            name, separator, value = item.partition("=")
+            if not separator:
+                raise ValueError(
+                    f"Tesseract variable '{item}' must be given as NAME=VALUE"
+                )
+        else:
+            name, value = item
+        name = name.strip()
+        if not name or "=" in name or any(char.isspace() for char in name):
+            raise ValueError(f"Invalid Tesseract variable name '{name}'")
+        pairs.append((name, str(value)))
+    return tuple(pairs)
+
+
+def make_tesseract_config(
+    psm: Optional[int] = None,
+    oem: Optional[int] = None,
+    variables: Union[Mapping[str, Any], Iterable[Union[str, Tuple[str, Any]]]] = (),
+    config_files: Sequence[str] = (),
+    tessdata_dir: Optional[str] = None,
+) -> TesseractConfig:
+    """
+    Check Tesseract options and build a :class:`TesseractConfig`.
+
+    Args:
+        psm (Optional[int]): Page segmentation mode, 0 to 13.
+        oem (Optional[int]): OCR engine mode, 0 to 3.
+        variables: Tesseract parameters, see :func:`parse_variables`.
+        config_files (Sequence[str]): Tesseract config file paths or names.
+        tessdata_dir (Optional[str]): Directory to load the model from.
+
+    Returns:
+        TesseractConfig: The configuration.
+
+    Raises:
+        ValueError: If a mode is out of range, a variable is malformed or
+            the tessdata directory does not exist.
+    """
+    if psm is not None and psm not in PAGE_SEG_MODES:
+        raise ValueError(
+            f"psm must be between {PAGE_SEG_MODES[0]} and {PAGE_SEG_MODES[-1]}"
+        )
+    if oem is not None and oem not in ENGINE_MODES:
+        raise ValueError(
+            f"oem must be between {ENGINE_MODES[0]} and {ENGINE_MODES[-1]}"
+        )
+    if isinstance(config_files, str):
+        config_files = [config_files]
+    if tessdata_dir is not None and not Path(tessdata_dir).is_dir():
+        raise ValueError(f"tessdata directory not found: {tessdata_dir}")
+    return TesseractConfig(
+        psm,
+        oem,
+        parse_variables(variables),
+        tuple(str(name) for name in config_files),
+        None if tessdata_dir is None else str(tessdata_dir),
+    )
+
+
+def normalize_text(text: str) -> str:
+    """
+    Give recognized text the same ending whichever backend produced it.
+
+    The tesseract command line ends each page with a form feed, the batch
+    backend splits its output on them and the library backends add none, so
+    trailing form feeds and whitespace are dropped and non-empty text ends
+    with a single newline.
+    """
+    text = text.rstrip()
+    return f"{text}\n" if text else ""
+
+
+class OCREngineError(RuntimeError):
+    """Raised when an OCR engine cannot be loaded or fails on a page."""
+
+
+class OCREngine:
+    """Base class for OCR backends that turn a page image into text."""
+
+    name: str = ""
+    # True if recognize_batch is cheaper than calling recognize per page.
+    batched: bool = False
+
+    @classmethod
+    def is_available(cls, tesseract_path: Optional[str] = None) -> bool:
+        """Return True if the backend can be used on this system."""
+        raise NotImplementedError
+
+    def recognize(self, image: PageImage) -> str:
+        """Return the text recognized in an image file or in-memory image."""
+        raise NotImplementedError
+
+    def recognize_batch(self, images: List[PageImage]) -> List[str]:
+        """Return the text recognized in each image, in order."""
+        return [self.recognize(image) for image in images]
+
+    def close(self) -> None:
+        """Release any resources held by the engine."""
+
+
+class SubprocessEngine(OCREngine):
+    """
+    Run the ``tesseract`` executable once per page.
+
+    Attributes:
+        tesseract_path (str): Path to the Tesseract executable.
+        language (str): The language for OCR processing.
+        config (TesseractConfig): Page segmentation mode, engine mode,
+            variables and config files.
+        omp_thread_limit (Optional[int]): OMP_THREAD_LIMIT set in the
+            environment of every tesseract process; None inherits it.
+    """
+
+    name: str = "subprocess"
+
+    def __init__(
+        self,
+        tesseract_path: str,
+        language: str,
+        config: TesseractConfig = TesseractConfig(),
+        omp_thread_limit: Optional[int] = None,
+    ) -> None:
+        self.tesseract_path: str = tesseract_path
+        self.language: str = language
+        self.config: TesseractConfig = config
+        self.omp_thread_limit: Optional[int] = omp_thread_limit
+
+    @classmethod
+    def is_available(cls, tesseract_path: Optional[str] = None) -> bool:
+        """The subprocess engine only needs the executable found by OCRProcessor."""
+        return True
+
+    def run_tesseract(
+        self, source: str, arguments: List[str], data: Optional[bytes] = None
+    ) -> str:
+        """
+        Run tesseract on an image file, or on ``data`` when source is "stdin".
+
+        The engine's configuration comes first, so ``arguments`` override
+        its variables; config files go last, as tesseract expects.
+
+        Args:
+            source (str): Image or list file path, or "stdin".
+            arguments (List[str]): Extra command-line options.
+            data (Optional[bytes]): Image piped to tesseract's standard input.
+
+        Returns:
+            str: The recognized text.
+        """
+        try:
+            result: subprocess.CompletedProcess = subprocess.run(
+                [
+                    self.tesseract_path,
+                    source,
+                    "stdout",
+                    "-l",
+                    self.language,
+                    *self.config.options(),
+                    *arguments,
+                    *self.config.config_files,
+                ],
+                input=data,
+                capture_output=True,
+                check=True,
+                env=(
+                    None
+                    if self.omp_thread_limit is None
+                    else {**os.environ, "OMP_THREAD_LIMIT": str(self.omp_thread_limit)}
+                ),
+            )
+        except subprocess.CalledProcessError as e:
+            e.stderr = e.stderr.decode("utf-8", errors="replace")
+            raise
+        return result.stdout.decode("utf-8")
+
+    def recognize(self, image: PageImage) -> str:
+        """Return the text Tesseract recognizes in an image file or buffer."""
+        if isinstance(image, bytes):
+            return self.run_tesseract("stdin", [], image)
+        return self.run_tesseract(str(image), [])
+
+
+class BatchEngine(SubprocessEngine):
+    """
+    Run one ``tesseract`` process for a whole batch of pages.
+
+    Tesseract accepts a text file listing image paths, or a multi-page TIFF,
+    and recognizes all pages with a single model load, separating the
+    pages' text with form feeds. Image files are passed as a list file; a
+    batch holding in-memory images is piped to tesseract as one
+    uncompressed multi-page TIFF. Single pages still go through
+    ``recognize``.
+    """
+
+    name: str = "batch"
+    batched: bool = True
+
+    def recognize_batch(self, images: List[PageImage]) -> List[str]:
+        """Return the text recognized in each image, in order."""
+        if len(images) == 1:
+            return [self.recognize(images[0])]
+        arguments: List[str] = ["-c", "page_separator=\f"]
+        if any(isinstance(image, bytes) for image in images):
+            output: str = self.run_tesseract(
+                "stdin", arguments, multipage_tiff(images)
+            )
+        else:
+            list_file: Path = Path(images[0]).with_name(f"{Path(images[0]).name}.list")
+            list_file.write_text(
+                "".join(f"{image}\n" for image in images), encoding="utf-8"
+            )
+            try:
+                output = self.run_tesseract(str(list_file), arguments)
+            finally:
+                try:
+                    os.remove(list_file)
+                except FileNotFoundError:
+                    pass
+        # Every page's text is followed by the separator.
+        texts: List[str] = output.split("\f")
+        if texts and not texts[-1].strip():
+            texts.pop()
+        if len(texts) != len(images):
+            raise OCREngineError(
+                f"Tesseract returned {len(texts)} pages for {len(images)} images"
+            )
+        return texts
+
+
+def open_image(image: PageImage) -> "PIL.Image.Image":
+    """Open a page image file or in-memory image with Pillow."""
+    from PIL import Image
+
+    return Image.open(io.BytesIO(image) if isinstance(image, bytes) else image)
+
+
+def multipage_tiff(images: List[PageImage]) -> bytes:
+    """Combine page images into one uncompressed multi-page TIFF."""
+    frames: List["PIL.Image.Image"] = [open_image(image) for image in images]
+    output: io.BytesIO = io.BytesIO()
+    frames[0].save(output, format="TIFF", save_all=True, append_images=frames[1:])
+    return output.getvalue()
+
+
+def _load_library(candidates: List[str], search_dir: Optional[Path]) -> ctypes.CDLL:
+    """Load the first shared library that can be found from a list of names."""
+    names: List[str] = []
+    for candidate in candidates:
+        found: Optional[str] = ctypes.util.find_library(candidate)
+        if found:
+            names.append(found)
+    names.extend(candidates)
+    if search_dir is not None:
+        names = [str(search_dir / name) for name in candidates] + names
+
+    for name in names:
+        try:
+            return ctypes.CDLL(name)
+        except OSError:
+            continue
+    raise OCREngineError(f"Could not load any of: {', '.join(candidates)}")
+
+
+def _string_array(values: Sequence[str]) -> "ctypes.Array[ctypes.c_char_p]":
+    """Encode strings as a C ``char**`` array for the Tesseract C API."""
+    return (ctypes.c_char_p * max(len(values), 1))(
+        *(value.encode("utf-8") for value in values)
+    )
+
+
+class CAPIEngine(OCREngine):
+    """
+    Keep one initialized Tesseract API handle and reuse it for every page.
+
+    The handle is created through the Tesseract C API with ctypes, so the
+    traineddata model is loaded once per engine instead of once per page.
+    Instances are not thread-safe; use :func:`get_engine` to get one per thread.
+
+    Attributes:
+        tesseract_path (str): Path to the Tesseract executable, used to locate
+            the shared libraries on Windows.
+        language (str): The language for OCR processing.
+        config (TesseractConfig): Page segmentation mode, engine mode,
+            variables and config files, applied when the handle is created.
+    """
+
+    name: str = "capi"
+
+    _TESSERACT_NAMES: List[str] = [
+        "tesseract",
+        "libtesseract.so.5",
+        "libtesseract.so.4",
+        "libtesseract.dylib",
+        "libtesseract-5.dll",
+        "libtesseract-4.dll",
+    ]
+    _LEPTONICA_NAMES: List[str] = [
+        "leptonica",
+        "lept",
+        "libleptonica.so.6",
+        "liblept.so.5",
+        "libleptonica.dylib",
+        "liblept.dylib",
+        "libleptonica-6.dll",
+        "liblept-5.dll",
+    ]
+    _libraries: Optional[Tuple[ctypes.CDLL, ctypes.CDLL]] = None
+    _libraries_lock: threading.Lock = threading.Lock()
+
+    def __init__(
+        self,
+        tesseract_path: str,
+        language: str,
+        config: TesseractConfig = TesseractConfig(),
+    ) -> None:
+        self.tesseract_path: str = tesseract_path
+        self.language: str = language
+        self.config: TesseractConfig = config
+        self._tesseract, self._leptonica = self.load_libraries(
+            Path(tesseract_path).parent if tesseract_path else None
+        )
+        self._handle: Optional[int] = self._tesseract.TessBaseAPICreate()
+        # Variables such as load_system_dawg only take effect at initialization.
+        configs: "ctypes.Array[ctypes.c_char_p]" = _string_array(config.config_files)
+        names: "ctypes.Array[ctypes.c_char_p]" = _string_array(
+            [name for name, _ in config.variables]
+        )
+        values: "ctypes.Array[ctypes.c_char_p]" = _string_array(
+            [value for _, value in config.variables]
+        )
+        datapath: Optional[bytes] = (
+            None if config.tessdata_dir is None else os.fsencode(config.tessdata_dir)
+        )
+        if self._tesseract.TessBaseAPIInit4(
+            self._handle,
+            datapath,
+            language.encode("utf-8"),
+            DEFAULT_ENGINE_MODE if config.oem is None else config.oem,
+            configs,
+            len(config.config_files),
+            names,
+            values,
+            len(config.variables),
+            0,
+        ):
+            self._tesseract.TessBaseAPIDelete(self._handle)
+            self._handle = None
+            raise OCREngineError(
+                f"Tesseract could not load language '{language}' "
+                f"with the given configuration"
+            )
+        if config.psm is not None:
+            self._tesseract.TessBaseAPISetPageSegMode(self._handle, config.psm)
+        logger.info(f"Initialized Tesseract C API engine for '{language}'")
+
+    @classmethod
+    def load_libraries(
+        cls, search_dir: Optional[Path] = None
+    ) -> Tuple[ctypes.CDLL, ctypes.CDLL]:
+        """Load libtesseract and leptonica once per process and declare signatures."""
+        with cls._libraries_lock:
+            if cls._libraries is not None:
+                return cls._libraries
+            if not sys.platform.startswith("win"):
+                search_dir = None
+            tesseract: ctypes.CDLL = _load_library(cls._TESSERACT_NAMES, search_dir)
+            leptonica: ctypes.CDLL = _load_library(cls._LEPTONICA_NAMES, search_dir)
+
+            tesseract.TessBaseAPICreate.restype = ctypes.c_void_p
+            tesseract.TessBaseAPIInit4.argtypes = [
+                ctypes.c_void_p,
+                ctypes.c_char_p,
+                ctypes.c_char_p,
+                ctypes.c_int,
+                ctypes.POINTER(ctypes.c_char_p),
+                ctypes.c_int,
+                ctypes.POINTER(ctypes.c_char_p),
+                ctypes.POINTER(ctypes.c_char_p),
+                ctypes.c_size_t,
+                ctypes.c_int,
+            ]
+            tesseract.TessBaseAPIInit4.restype = ctypes.c_int
+            tesseract.TessBaseAPISetPageSegMode.argtypes = [
+                ctypes.c_void_p,
+                ctypes.c_int,
+            ]
+            tesseract.TessBaseAPISetPageSegMode.restype = None
+            tesseract.TessBaseAPISetImage2.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+            tesseract.TessBaseAPISetImage2.restype = None
+            tesseract.TessBaseAPIGetUTF8Text.argtypes = [ctypes.c_void_p]
+            tesseract.TessBaseAPIGetUTF8Text.restype = ctypes.c_void_p
+            tesseract.TessDeleteText.argtypes = [ctypes.c_void_p]
+            tesseract.TessDeleteText.restype = None
+            for function in ("TessBaseAPIClear", "TessBaseAPIEnd", "TessBaseAPIDelete"):
+                getattr(tesseract, function).argtypes = [ctypes.c_void_p]
+                getattr(tesseract, function).restype = None
+
+            leptonica.pixRead.argtypes = [ctypes.c_char_p]
+            leptonica.pixRead.restype = ctypes.c_void_p
+            leptonica.pixReadMem.argtypes = [ctypes.c_char_p, ctypes.c_size_t]
+            leptonica.pixReadMem.restype = ctypes.c_void_p
+            leptonica.pixDestroy.argtypes = [ctypes.POINTER(ctypes.c_void_p)]
+            leptonica.pixDestroy.restype = None
+
+            cls._libraries = (tesseract, leptonica)
+            return cls._libraries
+
+    @classmethod
+    def is_available(cls, tesseract_path: Optional[str] = None) -> bool:
+        """Return True if the Tesseract and Leptonica libraries can be loaded."""
+        try:
+            cls.load_libraries(Path(tesseract_path).parent if tesseract_path else None)
+        except (OCREngineError, AttributeError):
+            return False
+        return True
+
+    def recognize(self, image: PageImage) -> str:
+        """Return the text Tesseract recognizes in an image file or buffer."""
+        if self._handle is None:
+            raise OCREngineError("Engine has been closed")
+        pix: ctypes.c_void_p = ctypes.c_void_p(
+            self._leptonica.pixReadMem(image, len(image))
+            if isinstance(image, bytes)
+            else self._leptonica.pixRead(os.fsencode(image))
+        )
+        source: str = "in-memory image" if isinstance(image, bytes) else str(image)
+        if not pix.value:
+            raise OCREngineError(f"Leptonica could not read {source}")
+        try:
+            self._tesseract.TessBaseAPISetImage2(self._handle, pix)
+            text_pointer: Optional[int] = self._tesseract.TessBaseAPIGetUTF8Text(
+                self._handle
+            )
+            if not text_pointer:
+                raise OCREngineError(f"Tesseract returned no text for {source}")
+            try:
+                return ctypes.string_at(text_pointer).decode("utf-8")
+            finally:
+                self._tesseract.TessDeleteText(text_pointer)
+        finally:
+            self._tesseract.TessBaseAPIClear(self._handle)
+            self._leptonica.pixDestroy(ctypes.byref(pix))
+
+    def close(self) -> None:
+        """Release the Tesseract API handle."""
+        if self._handle is not None:
+            self._tesseract.TessBaseAPIEnd(self._handle)
+            self._tesseract.TessBaseAPIDelete(self._handle)
+            self._handle = None
+
+    def __del__(self) -> None:
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+class TesserocrEngine(OCREngine):
+    """
+    Keep one ``tesserocr.PyTessBaseAPI`` handle and reuse it for every page.
+
+    Requires the optional ``tesserocr`` package.
+
+    Attributes:
+        tesseract_path (str): Path to the Tesseract executable (unused).
+        language (str): The language for OCR processing.
+        config (TesseractConfig): Page segmentation mode, engine mode,
+            variables and config files, applied when the handle is created.
+    """
+
+    name: str = "tesserocr"
+
+    def __init__(
+        self,
+        tesseract_path: str,
+        language: str,
+        config: TesseractConfig = TesseractConfig(),
+    ) -> None:
+        try:
+            import tesserocr
+        except ImportError as e:
+            raise OCREngineError(
+                "The tesserocr backend requires the 'tesserocr' package."
+            ) from e
+        self.tesseract_path: str = tesseract_path
+        self.language: str = language
+        self.config: TesseractConfig = config
+        options: Dict[str, Any] = {}
+        if config.tessdata_dir is not None:
+            options["path"] = config.tessdata_dir
+        if config.psm is not None:
+            options["psm"] = config.psm
+        if config.oem is not None:
+            options["oem"] = config.oem
+        if config.config_files:
+            options["configs"] = list(config.config_files)
+        if config.variables:
+            options["variables"] = dict(config.variables)
+        try:
+            self._api = tesserocr.PyTessBaseAPI(lang=language, **options)
+        except RuntimeError as e:
+            raise OCREngineError(str(e)) from e
+        logger.info(f"Initialized tesserocr engine for '{language}'")
+
+    @classmethod
+    def is_available(cls, tesseract_path: Optional[str] = None) -> bool:
+        """Return True if the tesserocr package is installed."""
+        try:
+            import tesserocr  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    def recognize(self, image: PageImage) -> str:
+        """Return the text Tesseract recognizes in an image file or buffer."""
+        if isinstance(image, bytes):
+            self._api.SetImage(open_image(image))
+        else:
+            self._api.SetImageFile(str(image))
+        try:
+            return self._api.GetUTF8Text()
+        finally:
+            self._api.Clear()
+
+    def close(self) -> None:
+        """Release the Tesseract API handle."""
+        self._api.End()
+
+
+ENGINES: Dict[str, Type[OCREngine]] = {
+    SubprocessEngine.name: SubprocessEngine,
+    BatchEngine.name: BatchEngine,
+    CAPIEngine.name: CAPIEngine,
+    TesserocrEngine.name: TesserocrEngine,
+}
+
+_local: threading.local = threading.local()
+
+
+def get_engine(
+    backend: str,
+    tesseract_path: str,
+    language: str,
+    config: TesseractConfig = TesseractConfig(),
+    omp_thread_limit: Optional[int] = None,
+) -> OCREngine:
+    """
+    Return the calling thread's engine for a backend, creating it on first use.
+
+    Engines are cached per thread (and therefore per worker), so a warm
+    Tesseract handle is reused across pages and across PDFs processed by the
+    same worker.
+
+    Args:
+        backend (str): One of the names in ``ENGINES``.
+        tesseract_path (str): Path to the Tesseract executable.
+        language (str): The language for OCR processing.
+        config (TesseractConfig): Tesseract options; engines with different
+            options are cached separately.
+        omp_thread_limit (Optional[int]): OMP_THREAD_LIMIT for the tesseract
+            processes of the subprocess and batch backends. Library backends
+            read the variable once, when libtesseract starts OpenMP, so it
+            has to be in the environment before that.
+
+    Returns:
+        OCREngine: The engine instance for this thread.
+    """
+    engines: Optional[
+        Dict[Tuple[str, str, str, TesseractConfig, Optional[int]], OCREngine]
+    ] = getattr(_local, "engines", None)
+    if engines is None:
+        engines = _local.engines = {}
+    key: Tuple[str, str, str, TesseractConfig, Optional[int]] = (
+        backend,
+        tesseract_path,
+        language,
+        config,
+        omp_thread_limit,
+    )
+    engine: Optional[OCREngine] = engines.get(key)
+    if engine is None:
+        if backend not in ENGINES:
+            raise ValueError(
+                f"Unknown OCR backend '{backend}'. Choose from: {', '.join(ENGINES)}"
+            )
+        started: float = time.monotonic()
+        engine_class: Type[OCREngine] = ENGINES[backend]
+        if issubclass(engine_class, SubprocessEngine):
+            engine = engine_class(tesseract_path, language, config, omp_thread_limit)
+        else:
+            engine = engine_class(tesseract_path, language, config)
+        engines[key] = engine
+        logger.info(
+            f"Created {backend} engine for '{language}' "
+            f"in {time.monotonic() - started:.2f}s"
+        )
+    return engine
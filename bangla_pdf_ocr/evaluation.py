@@ -0,0 +1,214 @@
+import re
+import unicodedata
+from typing import Dict, Hashable, List, NamedTuple, Optional, Sequence, Tuple
+
+PAGE_MARKER: "re.Pattern[str]" = re.compile(r"^--- Page (\d+) ---$", re.MULTILINE)
+# Zero width non-joiner and joiner shape the preceding cluster.
+JOINERS: str = "\u200c\u200d"
+# Canonical combining class of viramas (hasanta, U+09CD, in Bengali).
+VIRAMA_CLASS: int = 9
+
+
+class ErrorRates(NamedTuple):
+    """Character and word error counts of OCR output against a reference."""
+
+    character_errors: int
+    characters: int
+    word_errors: int
+    words: int
+
+    @property
+    def cer(self) -> float:
+        """Character error rate: edits per reference grapheme cluster."""
+        return self.character_errors / self.characters if self.characters else 0.0
+
+    @property
+    def wer(self) -> float:
+        """Word error rate: edits per reference word."""
+        return self.word_errors / self.words if self.words else 0.0
+
+
+def normalize_text(text: str) -> str:
+    """
+    Prepare text for comparison.
+
+    Applies NFC, so precomposed and decomposed spellings of the same letter
+    (e.g. the Bengali nukta forms) compare equal, and collapses every run
+    of whitespace into one space, so line breaks and layout do not count
+    as errors.
+    """
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def graphemes(text: str) -> List[str]:
+    """
+    Split text into user-perceived characters (grapheme clusters).
+
+    A cluster is a base character followed by its combining marks (vowel
+    signs, nukta, candrabindu), joiners, and, after a virama, the next
+    letter, so a conjunct such as ক্ষ counts as one character as in the
+    extended grapheme clusters of Unicode 15.1. One wrong vowel sign is then
+    one error, not a run of code point errors.
+
+    Args:
+        text (str): Text to split, normally NFC-normalized.
+
+    Returns:
+        List[str]: The grapheme clusters.
+    """
+    clusters: List[str] = []
+    for char in text:
+        if clusters and (
+            unicodedata.category(char) in ("Mn", "Mc", "Me")
+            or char in JOINERS
+            or (
+                unicodedata.combining(clusters[-1][-1]) == VIRAMA_CLASS
+                and unicodedata.category(char) == "Lo"
+            )
+        ):
+            clusters[-1] += char
+        else:
+            clusters.append(char)
+    return clusters
+
+
+def edit_distance(first: Sequence[Hashable], second: Sequence[Hashable]) -> int:
+    """
+    Levenshtein distance between two sequences.
+
+    Uses Myers' bit-parallel algorithm (in Hyyrö's formulation): the column
+    of the dynamic programming matrix for the shorter sequence is kept as
+    two bit vectors in Python integers, so every element of the longer
+    sequence is handled with a few whole-column integer operations. Memory
+    is linear and the running time O(n * m / word size), which keeps full
+    books fast.
+
+    Args:
+        first (Sequence[Hashable]): Characters, graphemes or words.
+        second (Sequence[Hashable]): The sequence to compare with.
+
+    Returns:
+        int: Minimum number of insertions, deletions and substitutions.
+    """
+    if len(first) < len(second):
+        first, second = second, first
+    length: int = len(second)
+    if not length:
+        return len(first)
+    # Bit i of masks[symbol] is set where second[i] == symbol.
+    masks: Dict[Hashable, int] = {}
+    for index, symbol in enumerate(second):
+        masks[symbol] = masks.get(symbol, 0) | (1 << index)
+    all_bits: int = (1 << length) - 1
+    last_bit: int = 1 << (length - 1)
+    positive: int = all_bits  # vertical deltas of +1
+    negative: int = 0  # vertical deltas of -1
+    distance: int = length
+    for symbol in first:
+        match: int = masks.get(symbol, 0)
+        vertical: int = match | negative
+        horizontal: int = (((match & positive) + positive) ^ positive) | match
+        horizontal_positive: int = negative | ~(horizontal | positive)
+        horizontal_negative: int = positive & horizontal
+        if horizontal_positive & last_bit:
+            distance += 1
+        elif horizontal_negative & last_bit:
+            distance -= 1
+        # The top row of the matrix grows by one per column.
+        horizontal_positive = (horizontal_positive << 1) | 1
+        horizontal_negative <<= 1
+        positive = horizontal_negative | ~(vertical | horizontal_positive)
+        positive &= all_bits
+        negative = horizontal_positive & vertical & all_bits
+    return distance
+
+
+def error_rates(hypothesis: str, reference: str) -> ErrorRates:
+    """
+    Compare OCR output with reference text.
+
+    Both texts are normalized with :func:`normalize_text`; characters are
+    counted as grapheme clusters and words are separated by whitespace.
+
+    Args:
+        hypothesis (str): OCR output.
+        reference (str): Correct text.
+
+    Returns:
+        ErrorRates: Error counts; see its ``cer`` and ``wer`` properties.
+    """
+    hypothesis = normalize_text(hypothesis)
+    reference = normalize_text(reference)
+    reference_words: List[str] = reference.split()
+    return ErrorRates(
+        edit_distance(graphemes(hypothesis), graphemes(reference)),
+        len(graphemes(reference)),
+        edit_distance(hypothesis.split(), reference_words),
+        len(reference_words),
+    )
+
+
+def split_pages(text: str) -> Dict[int, str]:
+    """Split text in the output file format ("--- Page N ---") into pages."""
+    parts: List[str] = PAGE_MARKER.split(text)
+    return {int(number): body for number, body in zip(parts[1::2], parts[2::2])}
+
+
+def compare_documents(hypothesis: str, reference: str) -> ErrorRates:
+    """
+    Compare an output file with a reference in the same page format.
+
+    Pages are matched by number. When the output has more pages than the
+    reference, as for a PDF replicated for benchmarking, page ``n`` is
+    compared with reference page ``(n - 1) % pages + 1``; repeated pages
+    with identical text are only compared once. Pages missing from the
+    output count as deleted. Texts without page markers are compared whole.
+
+    Args:
+        hypothesis (str): Contents of an output file.
+        reference (str): Reference text, e.g. ``data/Freedom Fight.txt``.
+
+    Returns:
+        ErrorRates: Error counts summed over all pages.
+    """
+    reference_pages: Dict[int, str] = split_pages(reference)
+    hypothesis_pages: Dict[int, str] = split_pages(hypothesis)
+    if not reference_pages or not hypothesis_pages:
+        return error_rates(hypothesis, reference)
+    page_count: int = max(reference_pages)
+    for page_num in reference_pages:
+        hypothesis_pages.setdefault(page_num, "")
+    known: Dict[Tuple[int, str], ErrorRates] = {}
+    totals: List[int] = [0, 0, 0, 0]
+    for page_num, text in sorted(hypothesis_pages.items()):
+        source_page: int = (page_num - 1) % page_count + 1
+        key: Tuple[int, str] = (source_page, normalize_text(text))
+        if key not in known:
+            known[key] = error_rates(text, reference_pages.get(source_page, ""))
+        totals = [total + count for total, count in zip(totals, known[key])]
+    return ErrorRates(*totals)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Print the CER and WER of an output file against a reference file."""
+    import argparse
+
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description="Character and word error rate of OCR output"
+    )
+    parser.add_argument("hypothesis", help="OCR output text file")
+    parser.add_argument("reference", help="Reference text file")
+    args: argparse.Namespace = parser.parse_args(argv)
+    with open(args.hypothesis, encoding="utf-8") as file:
+        hypothesis: str = file.read()
+    with open(args.reference, encoding="utf-8") as file:
+        reference: str = file.read()
+    rates: ErrorRates = compare_documents(hypothesis, reference)
+    print(
+        f"CER {rates.cer:.2%} ({rates.character_errors}/{rates.characters} "
+        f"characters), WER {rates.wer:.2%} ({rates.word_errors}/{rates.words} words)"
+    )
+
+
+if __name__ == "__main__":
+    main()
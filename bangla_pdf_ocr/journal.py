@@ -0,0 +1,113 @@
+import os
+import json
+import logging
+from pathlib import Path
+from typing import IO, Any, Dict, Optional, Tuple
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class PageJournal:
+    """
+    Append-only record of finished pages, used to resume interrupted runs.
+
+    The journal is a JSON Lines file next to the output file. The first line
+    describes the job (input PDF, its size and modification time, and the OCR
+    settings); every following line holds one finished page. Lines are flushed
+    and synced as they are written, so a killed process loses at most the
+    page it was writing.
+
+    Attributes:
+        path (Path): Location of the journal file.
+        header (Dict[str, Any]): Job description the journal must match.
+    """
+
+    def __init__(self, path: Path, header: Dict[str, Any]) -> None:
+        self.path: Path = path
+        self.header: Dict[str, Any] = header
+        self._file: Optional[IO[str]] = None
+        self._valid_length: int = 0
+
+    @staticmethod
+    def path_for(output_file: Path) -> Path:
+        """Return the journal path used for an output file."""
+        return output_file.with_name(output_file.name + ".journal")
+
+    def load(self) -> Dict[int, Tuple[str, Dict[str, Any]]]:
+        """
+        Read the pages already recorded for this job.
+
+        Returns:
+            Dict[int, Tuple[str, Dict[str, Any]]]: (text, metadata) by page
+            number. Empty if there is no journal or it belongs to another job.
+        """
+        pages: Dict[int, Tuple[str, Dict[str, Any]]] = {}
+        self._valid_length = 0
+        try:
+            with open(self.path, "rb") as file:
+                header_line: bytes = file.readline()
+                if not header_line.endswith(b"\n"):
+                    return pages
+                if json.loads(header_line.decode("utf-8")) != self.header:
+                    logger.warning(
+                        f"Journal {self.path} belongs to a different job; starting over"
+                    )
+                    return pages
+                offset: int = len(header_line)
+                for line in file:
+                    # A line without a newline was cut off mid-write.
+                    if not line.endswith(b"\n"):
+                        break
+                    try:
+                        entry: Dict[str, Any] = json.loads(line.decode("utf-8"))
+                    except ValueError:
+                        break
+                    try:
+                        pages[entry["page"]] = (entry["text"], entry["metadata"])
+                    except (KeyError, TypeError):
+                        # Valid JSON that is not a page entry; skip it.
+                        logger.warning(f"Ignoring malformed entry in {self.path}")
+                    offset += len(line)
+                self._valid_length = offset
+        except FileNotFoundError:
+            return pages
+        except ValueError:
+            logger.warning(f"Journal {self.path} is unreadable; starting over")
+            return pages
+        return pages
+
+    def open(self, resume: bool) -> None:
+        """Open the journal for writing, keeping valid entries when resuming."""
+        if resume and self._valid_length:
+            # Drop a partially written last line before appending.
+            with open(self.path, "r+b") as file:
+                file.truncate(self._valid_length)
+            self._file = open(self.path, "a", encoding="utf-8", newline="\n")
+        else:
+            self._file = open(self.path, "w", encoding="utf-8", newline="\n")
+            self._write(self.header)
+
+    def record(self, page_num: int, text: str, metadata: Dict[str, Any]) -> None:
+        """Append one finished page."""
+        self._write({"page": page_num, "text": text, "metadata": metadata})
+
+    def _write(self, entry: Dict[str, Any]) -> None:
+        if self._file is None:
+            raise ValueError("Journal is not open")
+        self._file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        """Close the journal file, keeping it on disk."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def remove(self) -> None:
+        """Close and delete the journal once the output has been written."""
+        self.close()
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
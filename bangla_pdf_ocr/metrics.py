@@ -0,0 +1,399 @@
+import os
+import math
+import logging
+import threading
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from http.server import HTTPServer
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# Content type of the Prometheus text exposition format.
+CONTENT_TYPE: str = "text/plain; version=0.0.4; charset=utf-8"
+# Page latencies range from a cached lookup to a dense page at high DPI.
+PAGE_SECONDS_BUCKETS: Tuple[float, ...] = (
+    0.01,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+def _format_labels(names: Tuple[str, ...], values: Tuple[str, ...]) -> str:
+    if not names:
+        return ""
+    escaped: List[str] = [
+        '{}="{}"'.format(
+            name,
+            value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"'),
+        )
+        for name, value in zip(names, values)
+    ]
+    return "{" + ",".join(escaped) + "}"
+
+
+class Metric:
+    """
+    Base class of the metric types: a name, help text and label names.
+
+    Values are kept per combination of label values and updated under a
+    lock, so metrics can be fed from any thread.
+    """
+
+    type: str = ""
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()
+    ) -> None:
+        self.name: str = name
+        self.documentation: str = documentation
+        self.labelnames: Tuple[str, ...] = labelnames
+        self._lock: threading.Lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"{self.name} takes labels {', '.join(self.labelnames) or 'none'}"
+            )
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def samples(self) -> List[Tuple[str, str, float]]:
+        """Return (name suffix, formatted labels, value) for every series."""
+        raise NotImplementedError
+
+    def render(self) -> str:
+        """Render the metric in the Prometheus text format."""
+        lines: List[str] = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type}",
+        ]
+        lines += [
+            f"{self.name}{suffix}{labels} {_format_value(value)}"
+            for suffix, labels, value in self.samples()
+        ]
+        return "\n".join(lines) + "\n"
+
+
+class Counter(Metric):
+    """A value that only goes up, e.g. pages processed."""
+
+    type = "counter"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        if not labelnames:
+            self._values[()] = 0.0
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Add a non-negative amount to the series selected by ``labels``."""
+        if amount < 0:
+            raise ValueError("Counters can only be incremented")
+        key: Tuple[str, ...] = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        """Return the current value of a series."""
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> List[Tuple[str, str, float]]:
+        with self._lock:
+            return [
+                ("_total", _format_labels(self.labelnames, key), value)
+                for key, value in sorted(self._values.items())
+            ]
+
+
+class Gauge(Metric):
+    """A value that goes up and down, e.g. pages waiting for OCR."""
+
+    type = "gauge"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        if not labelnames:
+            self._values[()] = 0.0
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Add an amount to the series selected by ``labels``."""
+        key: Tuple[str, ...] = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        """Subtract an amount from the series selected by ``labels``."""
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: str) -> None:
+        """Set the series selected by ``labels`` to a value."""
+        key: Tuple[str, ...] = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def value(self, **labels: str) -> float:
+        """Return the current value of a series."""
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> List[Tuple[str, str, float]]:
+        with self._lock:
+            return [
+                ("", _format_labels(self.labelnames, key), value)
+                for key, value in sorted(self._values.items())
+            ]
+
+
+class Histogram(Metric):
+    """Observations counted into cumulative buckets, e.g. page latencies."""
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Tuple[str, ...] = (),
+        buckets: Tuple[float, ...] = PAGE_SECONDS_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets: Tuple[float, ...] = tuple(sorted(buckets)) + (math.inf,)
+        # Per series: observations per bucket (not cumulative), sum.
+        self._counts: Dict[Tuple[str, ...], List[int]] = {}
+        self._sums: Dict[Tuple[str, ...], float] = {}
+        if not labelnames:
+            self._counts[()] = [0] * len(self.buckets)
+            self._sums[()] = 0.0
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Record one observation in the series selected by ``labels``."""
+        key: Tuple[str, ...] = self._key(labels)
+        index: int = next(
+            index for index, bound in enumerate(self.buckets) if value <= bound
+        )
+        with self._lock:
+            counts: List[int] = self._counts.setdefault(key, [0] * len(self.buckets))
+            counts[index] += 1
+            self._sums[key] = self._sums.get(key, 0.0) + value
+
+    def samples(self) -> List[Tuple[str, str, float]]:
+        names: Tuple[str, ...] = self.labelnames + ("le",)
+        samples: List[Tuple[str, str, float]] = []
+        with self._lock:
+            for key, counts in sorted(self._counts.items()):
+                cumulative: int = 0
+                for bound, count in zip(self.buckets, counts):
+                    cumulative += count
+                    samples.append(
+                        (
+                            "_bucket",
+                            _format_labels(names, key + (_format_value(bound),)),
+                            cumulative,
+                        )
+                    )
+                labels: str = _format_labels(self.labelnames, key)
+                samples.append(("_sum", labels, self._sums[key]))
+                samples.append(("_count", labels, cumulative))
+        return samples
+
+
+class MetricsRegistry:
+    """A set of metrics that are rendered together."""
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, Metric] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def register(self, metric: Metric) -> Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric {metric.name} is already registered")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        with self._lock:
+            metrics: List[Metric] = list(self._metrics.values())
+        return "".join(metric.render() for metric in metrics)
+
+
+REGISTRY: MetricsRegistry = MetricsRegistry()
+
+PAGES: Counter = REGISTRY.register(
+    Counter(
+        "bangla_pdf_ocr_pages",
+        "Pages processed, by where their text came from.",
+        ("source",),
+    )
+)
+PAGES_FAILED: Counter = REGISTRY.register(
+    Counter("bangla_pdf_ocr_pages_failed", "Pages that could not be processed.")
+)
+PAGES_RETRIED: Counter = REGISTRY.register(
+    Counter(
+        "bangla_pdf_ocr_pages_retried",
+        "Pages recognized again on their own after their batch failed.",
+    )
+)
+DOCUMENTS: Counter = REGISTRY.register(
+    Counter(
+        "bangla_pdf_ocr_documents",
+        "PDFs finished, by outcome (ok, incomplete, failed).",
+        ("status",),
+    )
+)
+RASTER_SECONDS: Histogram = REGISTRY.register(
+    Histogram(
+        "bangla_pdf_ocr_page_raster_seconds",
+        "Time spent rendering or extracting one page image.",
+    )
+)
+OCR_SECONDS: Histogram = REGISTRY.register(
+    Histogram(
+        "bangla_pdf_ocr_page_ocr_seconds",
+        "Time spent recognizing one page, including cache lookups.",
+    )
+)
+PREPROCESS_SECONDS: Histogram = REGISTRY.register(
+    Histogram(
+        "bangla_pdf_ocr_page_preprocess_seconds",
+        "Time spent cleaning up one page image before OCR.",
+    )
+)
+QUEUE_WAIT_SECONDS: Histogram = REGISTRY.register(
+    Histogram(
+        "bangla_pdf_ocr_page_queue_wait_seconds",
+        "Time a rendered page waited before an OCR worker picked it up.",
+    )
+)
+QUEUE_DEPTH: Gauge = REGISTRY.register(
+    Gauge(
+        "bangla_pdf_ocr_queue_depth",
+        "Rendered pages waiting to be handed to the OCR workers.",
+    )
+)
+OCR_TASKS_IN_FLIGHT: Gauge = REGISTRY.register(
+    Gauge(
+        "bangla_pdf_ocr_ocr_tasks_in_flight",
+        "Page batches submitted to the OCR worker pool and not finished yet.",
+    )
+)
+WORKERS: Gauge = REGISTRY.register(
+    Gauge("bangla_pdf_ocr_workers", "Size of the OCR worker pools that are open.")
+)
+DOCUMENTS_IN_PROGRESS: Gauge = REGISTRY.register(
+    Gauge("bangla_pdf_ocr_documents_in_progress", "PDFs being processed.")
+)
+
+
+def observe_page(metadata: Dict[str, Any]) -> None:
+    """Count a finished page and record its stage timings."""
+    if "error" in metadata:
+        PAGES_FAILED.inc()
+    else:
+        PAGES.inc(
+            source="cache" if metadata.get("cached") else metadata.get("source", "ocr")
+        )
+    if metadata.get("retries"):
+        PAGES_RETRIED.inc()
+    timings: Dict[str, float] = metadata.get("timings", {})
+    for stage, histogram in (
+        ("raster", RASTER_SECONDS),
+        ("preprocess", PREPROCESS_SECONDS),
+        ("ocr", OCR_SECONDS),
+        ("queue_wait", QUEUE_WAIT_SECONDS),
+    ):
+        if stage in timings:
+            histogram.observe(timings[stage])
+
+
+def observe_document(report: Optional[Dict[str, Any]]) -> None:
+    """Count a finished PDF; ``report`` is None when it failed outright."""
+    if report is None:
+        DOCUMENTS.inc(status="failed")
+    else:
+        DOCUMENTS.inc(status="incomplete" if report["pages"]["failed"] else "ok")
+
+
+def write_textfile(path: str, registry: MetricsRegistry = REGISTRY) -> None:
+    """
+    Write the metrics to a file for node_exporter's textfile collector.
+
+    The file is replaced atomically, so the collector never reads a partly
+    written file. Its name must end in ``.prom``.
+
+    Args:
+        path (str): Output file.
+        registry (MetricsRegistry): Metrics to write.
+    """
+    partial_file: str = f"{path}.{os.getpid()}.part"
+    with open(partial_file, "w", encoding="utf-8") as file:
+        file.write(registry.render())
+    os.replace(partial_file, path)
+
+
+def start_http_server(
+    port: int, address: str = "127.0.0.1", registry: MetricsRegistry = REGISTRY
+) -> "HTTPServer":
+    """
+    Serve the metrics at ``http://address:port/metrics`` from a daemon thread.
+
+    Args:
+        port (int): TCP port; 0 picks a free one (see ``server_address``).
+        address (str): Interface to listen on (default: localhost only).
+        registry (MetricsRegistry): Metrics to serve.
+
+    Returns:
+        HTTPServer: The running server; call ``shutdown()`` to stop it.
+    """
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            if self.path.split("?")[0] not in ("/metrics", "/"):
+                self.send_error(404)
+                return
+            body: bytes = registry.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            logger.debug(f"Metrics request: {format % args}")
+
+    class MetricsServer(ThreadingMixIn, HTTPServer):
+        daemon_threads = True
+
+    server: MetricsServer = MetricsServer((address, port), MetricsHandler)
+    thread: threading.Thread = threading.Thread(
+        target=server.serve_forever, name="metrics-server", daemon=True
+    )
+    thread.start()
+    logger.info(
+        f"Serving metrics at http://{address}:{server.server_address[1]}/metrics"
+    )
+    return server
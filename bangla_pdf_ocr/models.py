@@ -0,0 +1,364 @@
+import os
+import re
+import struct
+import hashlib
+import logging
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, List, NamedTuple, Optional, Set, Tuple
+
+from .toolchain import Toolchain, tessdata_dirs
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+TRAINEDDATA_SUFFIX: str = ".traineddata"
+# Extra directories searched for models, separated like PATH.
+TESSDATA_DIRS: Optional[str] = os.environ.get("OCR_TESSDATA_DIRS")
+# Sibling directories that commonly hold the tessdata_fast and tessdata_best
+# models next to a tessdata directory.
+VARIANT_DIRS: Tuple[str, ...] = ("tessdata_fast", "tessdata_best")
+# Model names shipped by the tessdata repositories that read Bengali script.
+STOCK_MODELS: Tuple[str, ...] = ("ben", "script/Bengali", "asm")
+# Traineddata files that do not recognize text on their own.
+AUXILIARY_MODELS: Tuple[str, ...] = ("osd", "equ")
+# Script name that unicharset lines carry for Bengali characters.
+BENGALI_SCRIPT: bytes = b" Bengali "
+
+# Components of a traineddata file, by their index in its offset table.
+UNICHARSET: int = 1
+INTTEMP: int = 3
+LSTM: int = 17
+LSTM_UNICHARSET: int = 21
+VERSION: int = 23
+# Bytes read from the end of the LSTM component to find its training flags.
+LSTM_TAIL_BYTES: int = 512 * 1024
+# LSTMRecognizer training flag of integer (tessdata_fast style) weights.
+TF_INT_MODE: int = 1
+# The network spec, e.g. [1,36,0,1Ct3,3,16Mp3,3Lfys48Lfx96Lrx96Lfx192O1c1].
+NETWORK_SPEC: "re.Pattern[bytes]" = re.compile(rb"\[\d+,[^\]\x00]{1,500}\]")
+
+
+class ModelInfo(NamedTuple):
+    """
+    An installed Tesseract model (traineddata file).
+
+    Attributes:
+        name (str): Language name given to Tesseract with ``-l``, relative
+            to the tessdata directory, e.g. "ben" or "script/Bengali".
+        path (str): Path of the traineddata file.
+        tessdata_dir (str): Directory given to Tesseract with --tessdata-dir.
+        size (int): File size in bytes.
+        variant (str): "fast" (integer LSTM weights only, as in
+            tessdata_fast), "best" (floating-point LSTM weights, as in
+            tessdata_best and most fine-tuned models), "standard" (integer
+            LSTM plus the legacy engine, as in tessdata and distribution
+            packages), "legacy" (legacy engine only) or "unknown".
+        engines (Tuple[str, ...]): Engines the model supports: "lstm", "legacy".
+        bengali (bool): The model's character set covers Bengali script.
+        custom (bool): The name is not one of ``STOCK_MODELS``, e.g. a
+            fine-tuned model.
+        version (Optional[str]): Version string stored in the model.
+    """
+
+    name: str
+    path: str
+    tessdata_dir: str
+    size: int
+    variant: str
+    engines: Tuple[str, ...]
+    bengali: bool
+    custom: bool
+    version: Optional[str]
+
+    def digest(self) -> str:
+        """Return the SHA-256 of the model file, to tell models apart in caches."""
+        digest = hashlib.sha256()
+        with open(self.path, "rb") as file:
+            for block in iter(lambda: file.read(1024 * 1024), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def settings(self) -> Dict[str, Any]:
+        """Describe the model for run reports."""
+        return {
+            "name": self.name,
+            "path": self.path,
+            "variant": self.variant,
+            "size": self.size,
+            "version": self.version,
+        }
+
+
+def read_offsets(file: BinaryIO, size: int) -> Dict[int, Tuple[int, int]]:
+    """
+    Read the offset table of a traineddata file.
+
+    Args:
+        file (BinaryIO): The open traineddata file.
+        size (int): Its size in bytes.
+
+    Returns:
+        Dict[int, Tuple[int, int]]: Start and end offset of every component
+        present in the file, by component index.
+
+    Raises:
+        ValueError: If the file is not a traineddata file.
+    """
+    header: bytes = file.read(4)
+    count: int = struct.unpack("<i", header)[0] if len(header) == 4 else 0
+    if not 0 < count <= 64:
+        raise ValueError("not a traineddata file")
+    table: bytes = file.read(8 * count)
+    if len(table) != 8 * count:
+        raise ValueError("truncated traineddata header")
+    offsets: Tuple[int, ...] = struct.unpack(f"<{count}q", table)
+    starts: List[int] = sorted(offset for offset in offsets if offset >= 0)
+    if starts and (starts[0] < 4 + 8 * count or starts[-1] > size):
+        raise ValueError("invalid traineddata offsets")
+    components: Dict[int, Tuple[int, int]] = {}
+    for index, offset in enumerate(offsets):
+        if offset < 0:
+            continue
+        end: int = next((start for start in starts if start > offset), size)
+        components[index] = (offset, end)
+    return components
+
+
+def _read_range(file: BinaryIO, start: int, end: int) -> bytes:
+    """Read the bytes between two file offsets."""
+    file.seek(start)
+    return file.read(end - start)
+
+
+def lstm_int_mode(lstm: bytes) -> Optional[bool]:
+    """
+    Tell whether serialized LSTM weights are integers, from the model's flags.
+
+    The recognizer stores its network spec as a length-prefixed string,
+    followed by its training flags, near the end of the LSTM component.
+
+    Args:
+        lstm (bytes): The LSTM component, or the end of it.
+
+    Returns:
+        Optional[bool]: True for integer weights, False for floating point,
+        None if the flags could not be found.
+    """
+    for match in reversed(list(NETWORK_SPEC.finditer(lstm))):
+        start: int = match.start()
+        end: int = match.end()
+        if start < 4 or len(lstm) < end + 4:
+            continue
+        if struct.unpack_from("<I", lstm, start - 4)[0] != end - start:
+            continue
+        return bool(struct.unpack_from("<i", lstm, end)[0] & TF_INT_MODE)
+    return None
+
+
+def _name_hint(path: Path) -> Optional[str]:
+    """Guess "fast" or "best" from a model's file or directory name."""
+    for part in (path.stem, path.parent.name, path.parent.parent.name):
+        words: List[str] = re.split(r"[^a-z]+", part.lower())
+        for variant in ("fast", "best"):
+            if variant in words:
+                return variant
+    return None
+
+
+def inspect_model(tessdata_dir: Path, name: str) -> ModelInfo:
+    """
+    Read what a traineddata file contains without loading it into Tesseract.
+
+    Only the offset table, the character sets, the version string and the end
+    of the LSTM component are read, so large models are inspected quickly.
+
+    Args:
+        tessdata_dir (Path): Directory holding the model.
+        name (str): Model name relative to the directory, without suffix.
+
+    Returns:
+        ModelInfo: The model's variant, engines and script coverage.
+    """
+    path: Path = tessdata_dir / f"{name}{TRAINEDDATA_SUFFIX}"
+    size: int = path.stat().st_size
+    engines: List[str] = []
+    bengali: bool = False
+    version: Optional[str] = None
+    int_mode: Optional[bool] = None
+    try:
+        with open(path, "rb") as file:
+            components: Dict[int, Tuple[int, int]] = read_offsets(file, size)
+            if LSTM in components:
+                engines.append("lstm")
+            if INTTEMP in components:
+                engines.append("legacy")
+            for index in (LSTM_UNICHARSET, UNICHARSET):
+                if index in components:
+                    bengali = bengali or BENGALI_SCRIPT in _read_range(
+                        file, *components[index]
+                    )
+            if LSTM in components:
+                start, end = components[LSTM]
+                tail: bytes = _read_range(file, max(start, end - LSTM_TAIL_BYTES), end)
+                int_mode = lstm_int_mode(tail)
+                # Older models keep their character set inside the LSTM component.
+                bengali = bengali or BENGALI_SCRIPT in tail
+            if VERSION in components:
+                version = (
+                    _read_range(file, *components[VERSION])
+                    .decode("utf-8", errors="replace")
+                    .strip("\0")
+                    .strip()
+                    or None
+                )
+    except (OSError, ValueError, struct.error) as e:
+        logger.warning(f"Could not read model {path}: {e}")
+
+    variant: str
+    if not engines:
+        variant = "unknown"
+    elif "lstm" not in engines:
+        variant = "legacy"
+    elif int_mode is None:
+        variant = _name_hint(path) or "unknown"
+    elif not int_mode:
+        variant = "best"
+    else:
+        variant = "standard" if "legacy" in engines else "fast"
+    if not engines:
+        # Unreadable files are only counted as Bengali by name.
+        bengali = name in STOCK_MODELS or name.lower().startswith(("ben", "bangla"))
+    return ModelInfo(
+        name,
+        str(path),
+        str(tessdata_dir),
+        size,
+        variant,
+        tuple(engines),
+        bengali,
+        name not in STOCK_MODELS,
+        version,
+    )
+
+
+def model_dirs(
+    tessdata_dir: Optional[str] = None, toolchain: Optional[Toolchain] = None
+) -> List[Path]:
+    """
+    List the existing directories searched for models, in order of preference.
+
+    Args:
+        tessdata_dir (Optional[str]): Only search this directory.
+        toolchain (Optional[Toolchain]): Resolved toolchain (default: the
+            process-wide one).
+
+    Returns:
+        List[Path]: The directories, without duplicates. Without
+        ``tessdata_dir`` these are the tessdata directories Tesseract may use
+        (its default first), the tessdata_fast and tessdata_best directories
+        next to them, then the directories listed in $OCR_TESSDATA_DIRS.
+    """
+    candidates: List[Path]
+    if tessdata_dir is not None:
+        candidates = [Path(tessdata_dir)]
+    else:
+        candidates = []
+        for directory in tessdata_dirs(toolchain):
+            candidates.append(directory)
+            candidates += [directory.parent / name for name in VARIANT_DIRS]
+        if TESSDATA_DIRS:
+            candidates += [
+                Path(path) for path in TESSDATA_DIRS.split(os.pathsep) if path
+            ]
+    directories: List[Path] = []
+    seen: Set[Path] = set()
+    for directory in candidates:
+        if not directory.is_dir():
+            continue
+        resolved: Path = directory.resolve()
+        if resolved not in seen:
+            seen.add(resolved)
+            directories.append(directory)
+    return directories
+
+
+def discover_models(
+    tessdata_dir: Optional[str] = None,
+    toolchain: Optional[Toolchain] = None,
+    bengali_only: bool = True,
+) -> List[ModelInfo]:
+    """
+    Find the installed models that read Bengali script.
+
+    Traineddata files directly in each directory of :func:`model_dirs` and
+    one level below (e.g. script/Bengali) are inspected.
+
+    Args:
+        tessdata_dir (Optional[str]): Only search this directory.
+        toolchain (Optional[Toolchain]): Resolved toolchain (default: the
+            process-wide one).
+        bengali_only (bool): Leave out models for other scripts.
+
+    Returns:
+        List[ModelInfo]: The models, by directory and name.
+    """
+    models: List[ModelInfo] = []
+    for directory in model_dirs(tessdata_dir, toolchain):
+        files: List[Path] = sorted(directory.glob(f"*{TRAINEDDATA_SUFFIX}")) + sorted(
+            directory.glob(f"*/*{TRAINEDDATA_SUFFIX}")
+        )
+        for path in files:
+            name: str = path.relative_to(directory).with_suffix("").as_posix()
+            if name in AUXILIARY_MODELS or not path.is_file():
+                continue
+            model: ModelInfo = inspect_model(directory, name)
+            if model.bengali or not bengali_only:
+                models.append(model)
+    return models
+
+
+def resolve_model(
+    model: str,
+    tessdata_dir: Optional[str] = None,
+    toolchain: Optional[Toolchain] = None,
+) -> ModelInfo:
+    """
+    Find the model to run OCR with.
+
+    Args:
+        model (str): A model name such as "ben", "script/Bengali" or
+            "ben_custom", looked up in :func:`model_dirs`, or the path of a
+            traineddata file.
+        tessdata_dir (Optional[str]): Only look for model names in this
+            directory.
+        toolchain (Optional[Toolchain]): Resolved toolchain (default: the
+            process-wide one).
+
+    Returns:
+        ModelInfo: The model, with the directory Tesseract must load it from.
+
+    Raises:
+        ValueError: If the model cannot be found.
+    """
+    path: Path = Path(model)
+    if model.endswith(TRAINEDDATA_SUFFIX):
+        if not path.is_file():
+            raise ValueError(f"Model file not found: {model}")
+        if tessdata_dir is not None and (
+            Path(tessdata_dir).resolve() != path.parent.resolve()
+        ):
+            raise ValueError(f"Model file {model} is not in {tessdata_dir}")
+        return inspect_model(path.parent, path.name[: -len(TRAINEDDATA_SUFFIX)])
+
+    directories: List[Path] = model_dirs(tessdata_dir, toolchain)
+    for directory in directories:
+        if (directory / f"{model}{TRAINEDDATA_SUFFIX}").is_file():
+            return inspect_model(directory, model)
+    searched: str = ", ".join(str(directory) for directory in directories)
+    installed: str = ", ".join(
+        f"{found.name} ({found.tessdata_dir})"
+        for found in discover_models(tessdata_dir, toolchain)
+    )
+    raise ValueError(
+        f"Model '{model}' not found in {searched or 'any tessdata directory'}. "
+        f"Installed Bengali models: {installed or 'none'}"
+    )
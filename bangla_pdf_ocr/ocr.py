@@ -1,31 +1,341 @@
+import io
 import os
 import sys
+import time
+import queue
+import shutil
+import tempfile
 import subprocess
+import threading
 import logging
 from pathlib import Path
-from typing import Optional, List, Dict
-from concurrent.futures import ThreadPoolExecutor, as_completed, Future
-import argparse
-from tqdm import tqdm
-from colorama import init, Fore, Style
-import platform
-import pkgutil
-
-init(autoreset=True)
-
-TESSERACT_PATH: Optional[str] = os.environ.get("TESSERACT_PATH")
-POPPLER_PATH: Optional[str] = os.environ.get("POPPLER_PATH")
-DEFAULT_LANGUAGE: str = os.environ.get("OCR_LANGUAGE", "ben")
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Collection,
+    Optional,
+    List,
+    Dict,
+    Generator,
+    Iterator,
+    NamedTuple,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+from concurrent.futures import (
+    CancelledError,
+    Executor,
+    ThreadPoolExecutor,
+    Future,
+    wait,
+    FIRST_COMPLETED,
+)
 
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+from . import metrics
+from .cache import DEFAULT_CACHE_SIZE, PageCache
+from .engines import (
+    ENGINES,
+    NO_DICTIONARY_VARIABLES,
+    OCREngine,
+    OCREngineError,
+    PageImage,
+    TesseractConfig,
+    get_engine,
+    make_tesseract_config,
+    normalize_text,
+)
+from .imaging import (
+    DEFAULT_BLANK_THRESHOLD,
+    PreprocessStep,
+    blank_page_details,
+    matches_rendering,
+    numpy_available,
+    preprocess_image,
+    read_pnm,
+    resolve_steps,
+    step_name,
 )
+from .journal import PageJournal
+from .models import ModelInfo, discover_models, resolve_model
+from .report import RunStats, build_report, format_report_summary, write_report
+from .toolchain import (
+    Toolchain,
+    find_program,
+    find_traineddata,
+    get_tool_paths,
+    get_toolchain,
+)
+
+if TYPE_CHECKING:
+    import argparse
+
+DEFAULT_LANGUAGE: str = os.environ.get("OCR_LANGUAGE", "ben")
+DEFAULT_BACKEND: str = os.environ.get("OCR_BACKEND", "subprocess")
+EXECUTORS: Tuple[str, ...] = ("thread", "process")
+# pdftoppm flags and file extension for each rasterization format. Uncompressed
+# PNM output skips zlib in poppler and in Tesseract for files that only live
+# until their page is recognized.
+RASTER_FORMATS: Dict[str, Tuple[List[str], str]] = {
+    "gray": (["-gray"], "pgm"),
+    "mono": (["-mono"], "pbm"),
+    "ppm": ([], "ppm"),
+    "png": (["-png"], "png"),
+    "tiff": (["-tiff"], "tif"),
+}
+DEFAULT_RASTER_FORMAT: str = "gray"
+# Formats pdftoppm can stream through a pipe: a range's pages are written back
+# to back and split by their PNM headers, so no page touches the disk.
+STREAM_FORMATS: Tuple[str, ...] = ("gray", "mono", "ppm")
+# Adaptive resolution: pages without embedded images are rendered at
+# ADAPTIVE_TEXT_DPI, scanned pages at their image resolution, clamped to
+# [min_dpi, max_dpi] and to MAX_PAGE_PIXELS so oversized pages stay affordable.
+ADAPTIVE_TEXT_DPI: int = 300
+DEFAULT_MIN_DPI: int = 200
+DEFAULT_MAX_DPI: int = 400
+MAX_PAGE_PIXELS: int = 12_000_000
+DPI_STEP: int = 50
+# Fraction of the page a single embedded image must cover to be extracted
+# directly instead of rendering the page.
+EXTRACT_MIN_COVERAGE: float = 0.9
+# Longest side, in pixels, of the page thumbnails extracted images are
+# checked against.
+THUMBNAIL_SIZE: int = 128
+# Seconds between checks for cancellation while a pipeline waits.
+CANCEL_POLL_INTERVAL: float = 0.1
+# Rendering a page costs a fraction of recognizing it, so by default one
+# rasterizer thread is started for every this many OCR workers.
+OCR_WORKERS_PER_RASTERIZER: int = 4
+# Pages rasterized per pdftoppm invocation in pipelined mode.
+DEFAULT_CHUNK_SIZE: int = 8
+# Rasterized pages allowed to wait for OCR before pdftoppm is paused.
+DEFAULT_MAX_PENDING: int = 16
+# Pages recognized per tesseract process by the "batch" backend.
+DEFAULT_BATCH_SIZE: int = 8
+# Minimum number of non-space characters for a page's text layer to be used
+# instead of OCR.
+MIN_TEXT_LAYER_CHARS: int = 20
+BENGALI_CHARS: range = range(0x0980, 0x0A00)
+# Upper estimate of one rasterized page on disk, used to check that a
+# RAM-backed temp directory has room for every page in flight.
+PAGE_IMAGE_ESTIMATE: int = 10 * 1024 * 1024
+
 logger: logging.Logger = logging.getLogger(__name__)
 
 
-def type_text(text: str, color: str = Fore.WHITE) -> None:
+class _Colors:
+    """
+    Stand-in for a colorama palette (``Fore`` or ``Style``).
+
+    colorama is only imported when a colour is first looked up, so importing
+    the package for library use does not load it.
+    """
+
+    def __init__(self, palette: str) -> None:
+        self._palette: str = palette
+
+    def __getattr__(self, name: str) -> str:
+        import colorama
+
+        return getattr(getattr(colorama, self._palette), name)
+
+
+Fore: _Colors = _Colors("Fore")
+Style: _Colors = _Colors("Style")
+_console_configured: bool = False
+
+
+def configure_console() -> None:
+    """
+    Set up colour output and logging for the command-line tools.
+
+    Library users keep control of logging: nothing is configured on import,
+    only when one of the console entry points runs.
+    """
+    global _console_configured
+    if _console_configured:
+        return
+    _console_configured = True
+    import colorama
+
+    colorama.init(autoreset=True)
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+
+
+class PageResult(NamedTuple):
+    """OCR output for one page: its number, recognized text and metadata."""
+
+    page_num: int
+    text: str
+    metadata: Dict[str, Any]
+
+
+def format_page(result: PageResult) -> str:
+    """Render a page result the way it appears in the output text file."""
+    if "error" in result.metadata:
+        return f"\n--- Page {result.page_num} ---\nError: {result.metadata['error']}\n"
+    return f"\n--- Page {result.page_num} ---\n{result.text}"
+
+
+class DocumentResult(NamedTuple):
+    """Outcome of one PDF in a batch run."""
+
+    pdf_path: Path
+    output_file: Path
+    pages: int
+    failed_pages: int
+    error: Optional[str]
+    report: Optional[Dict[str, Any]]
+
+
+class PageGeometry(NamedTuple):
+    """Size in points and rotation in degrees of a PDF page."""
+
+    width: float
+    height: float
+    rotation: int
+
+
+class PageImageInfo(NamedTuple):
+    """One row of ``pdfimages -list`` output."""
+
+    page_num: int
+    type: str
+    width: int
+    height: int
+    color: str
+    components: int
+    bits_per_component: int
+    encoding: str
+    x_ppi: int
+    y_ppi: int
+
+
+def page_ranges(
+    page_numbers: List[int],
+    chunk_size: int,
+    page_groups: Optional[Dict[int, Any]] = None,
+) -> List[Tuple[int, int]]:
+    """
+    Group sorted page numbers into contiguous (first, last) ranges.
+
+    Ranges hold at most ``chunk_size`` pages and, when ``page_groups`` is
+    given, only pages with the same group (e.g. the same rendering plan).
+    """
+    page_groups = page_groups or {}
+    ranges: List[Tuple[int, int]] = []
+    for page_num in page_numbers:
+        if ranges:
+            first_page, last_page = ranges[-1]
+            if (
+                page_num == last_page + 1
+                and page_num - first_page < chunk_size
+                and page_groups.get(page_num) == page_groups.get(first_page)
+            ):
+                ranges[-1] = (first_page, page_num)
+                continue
+        ranges.append((page_num, page_num))
+    return ranges
+
+
+def check_rendered(rendered: int, first_page: int, last_page: int) -> None:
+    """Raise ValueError if pdftoppm produced fewer pages than a range holds."""
+    if rendered < last_page - first_page + 1:
+        raise ValueError(
+            f"pdftoppm rendered {rendered} of pages {first_page}-{last_page}"
+        )
+
+
+def choose_temp_base(required_bytes: int) -> str:
+    """
+    Pick the directory in which per-job temp directories are created.
+
+    Prefers the RAM-backed /dev/shm when it exists, is writable and has room
+    for ``required_bytes``; otherwise uses $TMPDIR (tempfile.gettempdir()).
+    """
+    shm: str = "/dev/shm"
+    if os.path.isdir(shm) and os.access(shm, os.W_OK):
+        try:
+            if shutil.disk_usage(shm).free >= required_bytes:
+                return shm
+        except OSError:
+            pass
+    return tempfile.gettempdir()
+
+
+def remove_file(path: Path) -> None:
+    """Remove a file, ignoring it if it is already gone."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def discard_image(image: PageImage) -> None:
+    """Remove a page image file; in-memory images need no cleanup."""
+    if not isinstance(image, bytes):
+        remove_file(image)
+
+
+def physical_cpu_count() -> int:
+    """
+    Return the number of physical CPU cores available to this process.
+
+    Uses psutil when it is installed, falls back to /proc/cpuinfo on Linux and
+    to os.cpu_count() elsewhere. Hyper-threads are not counted because each
+    Tesseract engine saturates a full core.
+    """
+    available: int = os.cpu_count() or 1
+    if hasattr(os, "sched_getaffinity"):
+        available = len(os.sched_getaffinity(0)) or available
+
+    try:
+        import psutil
+
+        physical: Optional[int] = psutil.cpu_count(logical=False)
+        if physical:
+            return max(1, min(physical, available))
+    except ImportError:
+        pass
+
+    try:
+        with open("/proc/cpuinfo", encoding="utf-8") as cpuinfo:
+            cores: set = set()
+            physical_id: str = ""
+            for line in cpuinfo:
+                key, _, value = line.partition(":")
+                key = key.strip()
+                if key == "physical id":
+                    physical_id = value.strip()
+                elif key == "core id":
+                    cores.add((physical_id, value.strip()))
+        if cores:
+            return max(1, min(len(cores), available))
+    except OSError:
+        pass
+
+    return max(1, available)
+
+
+def _init_worker(omp_thread_limit: Optional[int]) -> None:
+    """Process pool initializer: cap the OpenMP threads of in-process Tesseract."""
+    if omp_thread_limit:
+        os.environ["OMP_THREAD_LIMIT"] = str(omp_thread_limit)
+
+
+def progress_bar(items: Iterator[Any], **options: Any) -> Iterator[Any]:
+    """Wrap an iterator in a tqdm progress bar, importing tqdm on first use."""
+    from tqdm import tqdm
+
+    return tqdm(items, **options)
+
+
+def type_text(text: str, color: Optional[str] = None) -> None:
     """Print colored text to the console."""
-    print(color + text + Style.RESET_ALL)
+    print((color or Fore.WHITE) + text + Style.RESET_ALL)
 
 
 class OCRProcessor:
@@ -36,14 +346,263 @@ class OCRProcessor:
         language (str): The language for OCR processing.
         tesseract_path (str): Path to the Tesseract executable.
         poppler_path (str): Path to the Poppler utilities.
+        pipeline (bool): Rasterize pages in chunks while OCR is running instead
+            of rendering the whole PDF up front.
+        chunk_size (int): Number of pages rasterized per pdftoppm call in
+            pipelined mode.
+        max_pending (int): Maximum number of rasterized pages waiting for OCR.
+        backend (str): OCR engine backend: "subprocess" runs one tesseract
+            process per page, "batch" one tesseract process per batch of
+            pages, "capi" and "tesserocr" keep one initialized Tesseract
+            handle per worker.
+        executor (str): "thread" or "process" worker pool.
+        workers (int): Number of OCR workers (default: one per physical core).
+        omp_thread_limit (Optional[int]): OMP_THREAD_LIMIT given to
+            Tesseract; 1 keeps it single-threaded so workers do not
+            oversubscribe the CPU. None leaves the environment untouched.
+            The subprocess and batch backends pass it to each tesseract
+            process, and process workers set it at startup. The capi and
+            tesserocr backends in thread mode cannot apply it: set
+            OMP_THREAD_LIMIT before starting Python instead.
+        force_ocr (bool): OCR every page, even pages that already carry a
+            usable text layer.
+        temp_dir (Optional[str]): Directory in which each job creates its
+            own temporary directory for page images (default: /dev/shm when
+            it has room, else $TMPDIR).
+        image_format (str): Page image format: "gray" (uncompressed PGM),
+            "mono" (1-bit PBM, for clean text scans), "ppm" (uncompressed
+            colour), "png" or "tiff".
+        in_memory (bool): Pass rendered pages from pdftoppm to the OCR
+            engine through pipes and memory instead of temporary files.
+            Only the formats in STREAM_FORMATS can be rendered this way.
+        dpi (Optional[int]): Rendering resolution (default: pdftoppm's 150).
+        scale_to (Optional[int]): Scale every page so its longest side has
+            this many pixels, instead of using a fixed DPI.
+        adaptive_dpi (bool): Pick the resolution per page from its embedded
+            image resolution and physical size, between min_dpi and max_dpi.
+        extract_images (bool): For pages that are a single embedded scan,
+            pull the image out with pdfimages at its native resolution
+            instead of re-rendering the page.
+        raster_workers (Optional[int]): Number of page ranges rasterized
+            concurrently (default: tuned to the OCR worker count).
+        batch_size (int): Pages handed to one tesseract process by the
+            "batch" backend.
+        skip_blank (bool): Check every page image for blankness (needs
+            NumPy) and skip OCR for blank pages.
+        blank_threshold (float): Largest share of ink pixels on a page
+            treated as blank.
+        preprocess (Tuple[PreprocessStep, ...]): Image preprocessing steps
+            (needs NumPy) applied to every page before OCR, given as names
+            from ``PREPROCESS_STEPS`` ("crop", "deskew", "denoise",
+            "binarize"), "all", or callables on grayscale arrays.
+        tesseract_config (TesseractConfig): Page segmentation mode, OCR
+            engine mode, variables, config files and tessdata directory
+            passed to Tesseract by every backend.
+        model (Optional[ModelInfo]): The traineddata model chosen with the
+            ``model`` argument: a model name found by
+            :func:`models.resolve_model` or a traineddata file path. It
+            replaces ``language``.
+        cache (Optional[Union[bool, str, PageCache]]): Page OCR cache. True
+            uses the default per-user location, a string is a database path.
+        cache_size (int): Size cap in bytes for a cache created here.
+        cache_stats (Dict[str, int]): Cache hits and misses of the last run
+            (one PDF, or every PDF of a batch).
+        last_report (Optional[Dict[str, Any]]): Timing report of the last
+            PDF processed by :meth:`extract_text_from_pdf`.
     """
 
-    def __init__(self, language: str = DEFAULT_LANGUAGE) -> None:
+    def __init__(
+        self,
+        language: str = DEFAULT_LANGUAGE,
+        pipeline: bool = True,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        backend: str = DEFAULT_BACKEND,
+        executor: str = "thread",
+        workers: Optional[int] = None,
+        omp_thread_limit: Optional[int] = 1,
+        cache: Optional[Union[bool, str, PageCache]] = None,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        force_ocr: bool = False,
+        temp_dir: Optional[str] = None,
+        image_format: str = DEFAULT_RASTER_FORMAT,
+        in_memory: bool = True,
+        dpi: Optional[int] = None,
+        scale_to: Optional[int] = None,
+        adaptive_dpi: bool = False,
+        min_dpi: int = DEFAULT_MIN_DPI,
+        max_dpi: int = DEFAULT_MAX_DPI,
+        extract_images: bool = True,
+        raster_workers: Optional[int] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        skip_blank: bool = False,
+        blank_threshold: float = DEFAULT_BLANK_THRESHOLD,
+        preprocess: Optional[Union[str, Sequence[Union[str, PreprocessStep]]]] = None,
+        tesseract_config: Optional[TesseractConfig] = None,
+        model: Optional[str] = None,
+        tessdata_dir: Optional[str] = None,
+    ) -> None:
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        if max_pending < 1:
+            raise ValueError("max_pending must be at least 1")
+        if executor not in EXECUTORS:
+            raise ValueError(
+                f"Unknown executor '{executor}'. Choose from: {', '.join(EXECUTORS)}"
+            )
+        if workers is not None and workers < 1:
+            raise ValueError("workers must be at least 1")
+        if raster_workers is not None and raster_workers < 1:
+            raise ValueError("raster_workers must be at least 1")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if image_format not in RASTER_FORMATS:
+            raise ValueError(
+                f"Unknown image format '{image_format}'. "
+                f"Choose from: {', '.join(RASTER_FORMATS)}"
+            )
+        if scale_to is not None and (dpi is not None or adaptive_dpi):
+            raise ValueError("scale_to cannot be combined with dpi or adaptive_dpi")
+        if not 0 < min_dpi <= max_dpi:
+            raise ValueError("min_dpi must be positive and not above max_dpi")
+        if not 0 <= blank_threshold < 1:
+            raise ValueError("blank_threshold must be between 0 and 1")
+        if skip_blank and not numpy_available():
+            raise EnvironmentError(
+                "Blank page detection requires NumPy: "
+                "pip install bangla-pdf-ocr[imaging]"
+            )
+        steps: Tuple[PreprocessStep, ...] = resolve_steps(preprocess)
+        if steps and not numpy_available():
+            raise EnvironmentError(
+                "Image preprocessing requires NumPy: "
+                "pip install bangla-pdf-ocr[imaging]"
+            )
+        selected: Optional[ModelInfo] = None
+        if model is not None:
+            selected = resolve_model(model, tessdata_dir)
+            language = selected.name
+            tessdata_dir = selected.tessdata_dir
+        config: TesseractConfig = tesseract_config or TesseractConfig()
+        if tessdata_dir is not None:
+            config = config._replace(tessdata_dir=str(tessdata_dir))
+        config = make_tesseract_config(*config)
         self.language: str = language
-        self.tesseract_path: str = TESSERACT_PATH or self.find_tesseract()
-        self.poppler_path: str = POPPLER_PATH or self.find_poppler()
+        self.pipeline: bool = pipeline
+        self.chunk_size: int = chunk_size
+        self.max_pending: int = max_pending
+        discovery_started: float = time.monotonic()
+        self.tesseract_path: str = self.find_tesseract()
+        self.poppler_path: str = self.find_poppler()
+        if backend not in ENGINES:
+            raise ValueError(
+                f"Unknown OCR backend '{backend}'. Choose from: {', '.join(ENGINES)}"
+            )
+        if not ENGINES[backend].is_available(self.tesseract_path):
+            raise EnvironmentError(
+                f"OCR backend '{backend}' is not available on this system."
+            )
+        self.backend: str = backend
+        self.discovery_seconds: float = time.monotonic() - discovery_started
+        self.executor: str = executor
+        self.workers: int = workers or physical_cpu_count()
+        self.omp_thread_limit: Optional[int] = omp_thread_limit
+        self.cache: Optional[PageCache]
+        if isinstance(cache, PageCache):
+            self.cache = cache
+        elif cache:
+            self.cache = PageCache(None if cache is True else cache, cache_size)
+        else:
+            self.cache = None
+        self.cache_stats: Dict[str, int] = {"hits": 0, "misses": 0}
+        self._stats_lock: Optional[threading.Lock] = threading.Lock()
+        self.force_ocr: bool = force_ocr
+        self.temp_dir: Optional[str] = temp_dir
+        self.image_format: str = image_format
+        self.in_memory: bool = in_memory
+        self.dpi: Optional[int] = dpi
+        self.scale_to: Optional[int] = scale_to
+        self.adaptive_dpi: bool = adaptive_dpi
+        self.min_dpi: int = min_dpi
+        self.max_dpi: int = max_dpi
+        self.extract_images: bool = extract_images
+        self.raster_workers: Optional[int] = raster_workers
+        self.batch_size: int = batch_size
+        self.skip_blank: bool = skip_blank
+        self.blank_threshold: float = blank_threshold
+        self.preprocess: Tuple[PreprocessStep, ...] = steps
+        self.tesseract_config: TesseractConfig = config
+        self.model: Optional[ModelInfo] = selected
+        self._model_digest: Optional[str] = (
+            None if selected is None else selected.digest()
+        )
+        self.last_report: Optional[Dict[str, Any]] = None
+        self._executor: Optional[Executor] = None
         type_text(f"Tesseract path: {self.tesseract_path}", Fore.CYAN)
         type_text(f"Poppler path: {self.poppler_path}", Fore.CYAN)
+        type_text(
+            f"OCR backend: {self.backend} ({self.workers} {self.executor} workers)",
+            Fore.CYAN,
+        )
+        if self.model is not None:
+            type_text(
+                f"OCR model: {self.model.name} ({self.model.variant}, "
+                f"{self.model.size / (1024 * 1024):.1f} MB) "
+                f"from {self.model.tessdata_dir}",
+                Fore.CYAN,
+            )
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Process workers receive the processor's settings only: not its
+        # pool, nor the report and counters of the run in progress, which
+        # are kept by the parent and can be large.
+        state: Dict[str, Any] = self.__dict__.copy()
+        state["_executor"] = None
+        state["_stats_lock"] = None
+        state["last_report"] = None
+        state["cache_stats"] = {"hits": 0, "misses": 0}
+        return state
+
+    def __enter__(self) -> "OCRProcessor":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the worker pool and the engines it holds."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+            metrics.WORKERS.dec(self.workers)
+
+    def get_executor(self) -> Executor:
+        """
+        Return the processor's worker pool, creating it on first use.
+
+        The pool is kept across extract_text_from_pdf calls so that warm
+        per-worker engines are reused from one PDF to the next.
+        """
+        if self._executor is None:
+            if self.executor == "process":
+                from concurrent.futures import ProcessPoolExecutor
+
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    initializer=_init_worker,
+                    initargs=(self.omp_thread_limit,),
+                )
+                # Start the workers now, before rasterizer threads run poppler.
+                # A worker forked while another thread is inside
+                # subprocess.run inherits that child's exec-status pipe and
+                # keeps it open, so the thread would wait for it forever.
+                self._executor.submit(os.getpid).result()
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="ocr-worker"
+                )
+            metrics.WORKERS.inc(self.workers)
+        return self._executor
 
     @staticmethod
     def find_program(program: str) -> Optional[str]:
@@ -56,53 +615,20 @@ class OCRProcessor:
         Returns:
             Optional[str]: The path to the program if found, None otherwise.
         """
-        logger.info(f"Searching for {program}")
-        if sys.platform.startswith("win"):
-            program += ".exe"
-
-        for path in os.environ["PATH"].split(os.pathsep):
-            exe_file: Path = Path(path) / program
-            if exe_file.is_file() and os.access(str(exe_file), os.X_OK):
-                logger.info(f"Found {program} in PATH: {exe_file}")
-                return str(exe_file)
-
-        common_dirs: List[Path] = [
-            Path(os.environ.get("ProgramFiles", "C:/Program Files")),
-            Path(os.environ.get("ProgramFiles(x86)", "C:/Program Files (x86)")),
-            Path(os.environ.get("USERPROFILE", "~")) / "Downloads",
-            Path("C:/Program Files/Tesseract-OCR"),
-            Path("C:/Program Files/poppler/Library/bin"),
-            Path("C:/Program Files/poppler/poppler-24.08.0/Library/bin"),
-            Path("/usr/share/poppler"),
-            Path("/usr/share/tesseract-ocr/5/tessdata"),
-            Path("/usr/bin"),
-            Path("/usr/local/bin"),
-            Path("/usr/share"),
-            Path("/opt"),
-            Path.home() / "Downloads",
-        ]
-
-        for directory in common_dirs:
-            exe_file = directory / program
-            if exe_file.is_file() and os.access(str(exe_file), os.X_OK):
-                logger.info(f"Found {program} in common directory: {exe_file}")
-                return str(exe_file)
-
-        logger.warning(f"{program} not found")
-        return None
+        return find_program(program)
 
     def find_poppler(self) -> str:
         """Find the Poppler executable."""
-        pdftoppm: Optional[str] = self.find_program("pdftoppm")
-        if not pdftoppm:
+        poppler_path: Optional[str] = get_tool_paths()[1]
+        if not poppler_path:
             raise EnvironmentError(
                 "Poppler (pdftoppm) not found. Please install it and make sure it's in your PATH."
             )
-        return str(Path(pdftoppm).parent)
+        return poppler_path
 
     def find_tesseract(self) -> str:
         """Find the Tesseract executable."""
-        tesseract: Optional[str] = self.find_program("tesseract")
+        tesseract: Optional[str] = get_tool_paths()[0]
         if not tesseract:
             raise EnvironmentError(
                 "Tesseract not found. Please install it and make sure it's in your PATH."
@@ -110,112 +636,1363 @@ class OCRProcessor:
         return tesseract
 
     def find_bengali_traineddata(self) -> Optional[str]:
-        """Find the Bengali traineddata file."""
-        possible_locations = [
-            Path(self.tesseract_path).parent / "tessdata" / "ben.traineddata",
-            Path("/usr/share/tesseract-ocr/5/tessdata/ben.traineddata"),
-            Path("/usr/share/tesseract-ocr/4.00/tessdata/ben.traineddata"),
-            Path("/usr/local/share/tessdata/ben.traineddata"),
-            Path.home() / ".local/share/tessdata/ben.traineddata",
+        """Find the Bengali traineddata file, the chosen model if there is one."""
+        if self.model is not None:
+            return self.model.path
+        return find_traineddata("ben")
+
+    def run_poppler(self, tool: str, arguments: List[str]) -> str:
+        """Run a Poppler utility and return its standard output."""
+        tool_path: str = os.path.join(self.poppler_path, tool)
+        try:
+            result: subprocess.CompletedProcess = subprocess.run(
+                [tool_path, *arguments],
+                check=True,
+                capture_output=True,
+                encoding="utf-8",
+                errors="replace",
+            )
+        except subprocess.CalledProcessError as e:
+            logger.error(f"Error running {tool}: {e}")
+            logger.error(f"{tool} stderr: {e.stderr}")
+            raise
+        return result.stdout
+
+    def get_page_count(self, pdf_path: Path) -> int:
+        """Return the number of pages in a PDF file using pdfinfo."""
+        for line in self.run_poppler("pdfinfo", [str(pdf_path)]).splitlines():
+            if line.startswith("Pages:"):
+                return int(line.split(":", 1)[1])
+        raise ValueError(f"Could not determine the page count of {pdf_path}")
+
+    def get_page_geometry(
+        self, pdf_path: Path, page_count: int
+    ) -> Dict[int, PageGeometry]:
+        """Return the size in points and the rotation of every page, using pdfinfo."""
+        output: str = self.run_poppler(
+            "pdfinfo", ["-f", "1", "-l", str(page_count), str(pdf_path)]
+        )
+        sizes: Dict[int, Tuple[float, float]] = {}
+        rotations: Dict[int, int] = {}
+        for line in output.splitlines():
+            # "Page    3 size: 595.276 x 841.89 pts (A4)" / "Page    3 rot:  90"
+            fields: List[str] = line.split()
+            if len(fields) < 4 or fields[0] != "Page" or not fields[1].isdigit():
+                continue
+            if fields[2] == "size:" and len(fields) >= 6:
+                sizes[int(fields[1])] = (float(fields[3]), float(fields[5]))
+            elif fields[2] == "rot:":
+                rotations[int(fields[1])] = int(float(fields[3]))
+        return {
+            page_num: PageGeometry(width, height, rotations.get(page_num, 0))
+            for page_num, (width, height) in sizes.items()
+        }
+
+    def list_page_images(self, pdf_path: Path) -> Dict[int, List[PageImageInfo]]:
+        """Return the images embedded in each page, using pdfimages -list."""
+        output: str = self.run_poppler("pdfimages", ["-list", str(pdf_path)])
+        images: Dict[int, List[PageImageInfo]] = {}
+        # Columns: page num type width height color comp bpc enc interp
+        # object ID(2 fields) x-ppi y-ppi size ratio
+        for line in output.splitlines()[2:]:
+            fields: List[str] = line.split()
+            if len(fields) < 14 or not fields[0].isdigit():
+                continue
+            info: PageImageInfo = PageImageInfo(
+                page_num=int(fields[0]),
+                type=fields[2],
+                width=int(fields[3]),
+                height=int(fields[4]),
+                color=fields[5],
+                components=int(fields[6]),
+                bits_per_component=int(fields[7]),
+                encoding=fields[8],
+                x_ppi=int(fields[12]),
+                y_ppi=int(fields[13]),
+            )
+            images.setdefault(info.page_num, []).append(info)
+        return images
+
+    def adaptive_page_dpi(
+        self, images: List[PageImageInfo], geometry: Optional[PageGeometry]
+    ) -> int:
+        """
+        Choose a rendering resolution for one page in adaptive mode.
+
+        Scanned pages are rendered at the resolution of their largest
+        embedded image, so no pixels are invented or thrown away; pages
+        without images are rendered at ``dpi`` (or ADAPTIVE_TEXT_DPI). The
+        result is clamped to [min_dpi, max_dpi], capped so a page never
+        exceeds MAX_PAGE_PIXELS, and rounded down to DPI_STEP so that
+        neighbouring pages can share a pdftoppm call.
+        """
+        page_images: List[PageImageInfo] = [
+            image for image in images if image.type == "image"
         ]
+        dpi: float
+        if page_images:
+            largest: PageImageInfo = max(
+                page_images, key=lambda image: image.width * image.height
+            )
+            dpi = max(largest.x_ppi, largest.y_ppi)
+        else:
+            dpi = self.dpi or ADAPTIVE_TEXT_DPI
+        dpi = min(max(dpi, self.min_dpi), self.max_dpi)
+        if geometry is not None:
+            square_inches: float = (geometry.width / 72) * (geometry.height / 72)
+            if square_inches > 0:
+                dpi = min(dpi, (MAX_PAGE_PIXELS / square_inches) ** 0.5)
+        return max(DPI_STEP, int(dpi) // DPI_STEP * DPI_STEP)
+
+    def can_extract_image(
+        self, images: List[PageImageInfo], geometry: Optional[PageGeometry]
+    ) -> bool:
+        """
+        Return True if a page is a single scan that pdfimages can pull out as is.
 
-        for location in possible_locations:
-            if location.is_file():
-                logger.info(f"Found Bengali traineddata at: {location}")
-                return str(location)
+        The page must hold exactly one image (no soft masks or overlays),
+        unrotated, covering at least EXTRACT_MIN_COVERAGE of the page, with a
+        resolution between ``min_dpi`` and ``max_dpi`` and a colour space
+        Tesseract reads correctly. Whether the image is drawn rotated or
+        mirrored is not known until it is extracted (see _extract_range).
+        """
+        if len(images) != 1 or geometry is None or geometry.rotation % 360:
+            return False
+        image: PageImageInfo = images[0]
+        if image.type != "image" or image.components not in (1, 3):
+            return False
+        if image.color in ("cmyk", "lab", "sep", "devn"):
+            return False
+        if min(image.x_ppi, image.y_ppi) < self.min_dpi:
+            return False
+        if max(image.x_ppi, image.y_ppi) > self.max_dpi:
+            return False
+        image_area: float = (image.width / image.x_ppi * 72) * (
+            image.height / image.y_ppi * 72
+        )
+        page_area: float = geometry.width * geometry.height
+        return page_area > 0 and image_area >= EXTRACT_MIN_COVERAGE * page_area
 
-        logger.warning("Bengali traineddata not found")
-        return None
+    def plan_pages(
+        self, pdf_path: Path, page_count: int, page_numbers: List[int]
+    ) -> Dict[int, Tuple[str, Optional[int]]]:
+        """
+        Decide how each page is turned into an image.
 
-    def convert_pdf_to_images(self, pdf_path: Path) -> List[Path]:
-        """Convert a PDF file to a list of image files."""
-        image_prefix: str = f"temp_image_{os.getpid()}"
-        pdftoppm_path: str = os.path.join(self.poppler_path, "pdftoppm")
-        logger.info(f"Converting PDF to images using {pdftoppm_path}")
+        Returns:
+            Dict[int, Tuple[str, Optional[int]]]: ("extract", None) for pages
+            whose embedded scan is pulled out with pdfimages, ("render", dpi)
+            for pages rendered by pdftoppm. Pages rendered at the default
+            resolution are left out.
+        """
+        if not page_numbers or not (self.adaptive_dpi or self.extract_images):
+            return {}
+        geometry: Dict[int, PageGeometry] = self.get_page_geometry(
+            pdf_path, page_count
+        )
         try:
-            subprocess.run(
-                [pdftoppm_path, "-png", str(pdf_path), image_prefix],
-                check=True,
-                capture_output=True,
-                text=True,
+            images: Dict[int, List[PageImageInfo]] = self.list_page_images(pdf_path)
+        except (OSError, subprocess.CalledProcessError) as e:
+            logger.warning(f"Could not list page images: {e}")
+            images = {}
+
+        plan: Dict[int, Tuple[str, Optional[int]]] = {}
+        for page_num in page_numbers:
+            page_images: List[PageImageInfo] = images.get(page_num, [])
+            if self.extract_images and self.can_extract_image(
+                page_images, geometry.get(page_num)
+            ):
+                plan[page_num] = ("extract", None)
+            elif self.adaptive_dpi:
+                plan[page_num] = (
+                    "render",
+                    self.adaptive_page_dpi(page_images, geometry.get(page_num)),
+                )
+        extracted: int = sum(method == "extract" for method, _ in plan.values())
+        logger.info(
+            f"{extracted} of {len(page_numbers)} pages will use their embedded image"
+        )
+        return plan
+
+    def extract_page_images(
+        self, pdf_path: Path, first_page: int, last_page: int, output_dir: Path
+    ) -> List[Tuple[int, Path]]:
+        """
+        Pull the embedded scan of each page in a range out with pdfimages.
+
+        JPEG images are written unchanged; everything else (CCITT, JBIG2,
+        Flate, JPEG 2000) is decoded to uncompressed PNM.
+
+        Returns:
+            List[Tuple[int, Path]]: (page number, image file) pairs in page order.
+        """
+        image_prefix: Path = output_dir / f"image_{first_page}"
+        logger.info(f"Extracting embedded images of pages {first_page}-{last_page}")
+        self.run_poppler(
+            "pdfimages",
+            [
+                "-j",
+                "-p",
+                "-f",
+                str(first_page),
+                "-l",
+                str(last_page),
+                str(pdf_path),
+                str(image_prefix),
+            ],
+        )
+        # With -p, files are named <prefix>-<page>-<image number>.<ext>.
+        images: List[Tuple[int, Path]] = [
+            (int(image.name.split("-")[-2]), image)
+            for image in output_dir.glob(f"{image_prefix.name}-*")
+        ]
+        return sorted(images)
+
+    def render_thumbnails(
+        self, pdf_path: Path, first_page: int, last_page: int
+    ) -> Dict[int, bytes]:
+        """Render small grayscale PNM copies of a page range, by page number."""
+        pdftoppm_path: str = os.path.join(self.poppler_path, "pdftoppm")
+        result: subprocess.CompletedProcess = subprocess.run(
+            [
+                pdftoppm_path,
+                "-gray",
+                "-scale-to",
+                str(THUMBNAIL_SIZE),
+                "-f",
+                str(first_page),
+                "-l",
+                str(last_page),
+                str(pdf_path),
+            ],
+            check=True,
+            capture_output=True,
+        )
+        stream: io.BytesIO = io.BytesIO(result.stdout)
+        thumbnails: Dict[int, bytes] = {}
+        for page_num in range(first_page, last_page + 1):
+            image: Optional[bytes] = read_pnm(stream)
+            if image is None:
+                break
+            thumbnails[page_num] = image
+        return thumbnails
+
+    def _extract_range(
+        self, pdf_path: Path, first_page: int, last_page: int, job_dir: Path
+    ) -> Tuple[List[Tuple[int, Path]], Set[int]]:
+        """
+        Extract the embedded scans of a page range, rendering pages they do not fit.
+
+        pdfimages -list does not say how an image is placed on its page, so
+        each extracted image is compared with a thumbnail of the page (see
+        matches_rendering). Pages whose image is drawn rotated or mirrored,
+        or that pdfimages did not write, are rendered by pdftoppm instead.
+
+        Returns:
+            Tuple[List[Tuple[int, Path]], Set[int]]: (page number, image
+            file) pairs in page order, and the pages that were rendered.
+        """
+        extracted: List[Tuple[int, Path]] = self.extract_page_images(
+            pdf_path, first_page, last_page, job_dir
+        )
+        thumbnails: Dict[int, bytes] = self.render_thumbnails(
+            pdf_path, first_page, last_page
+        )
+        images: Dict[int, Path] = {}
+        for page_num, image in extracted:
+            if matches_rendering(image, thumbnails.get(page_num, b"")):
+                images[page_num] = image
+            else:
+                discard_image(image)
+        rendered: Set[int] = set()
+        for page_num in range(first_page, last_page + 1):
+            if page_num in images:
+                continue
+            logger.info(
+                f"Page {page_num}: embedded image does not match the page, "
+                "rendering it instead"
+            )
+            rendered.add(page_num)
+            images.update(
+                self._render_files(pdf_path, page_num, page_num, job_dir, None)
             )
+        return sorted(images.items()), rendered
+
+    def rasterize_pages(
+        self,
+        pdf_path: Path,
+        first_page: Optional[int] = None,
+        last_page: Optional[int] = None,
+        output_dir: Optional[Path] = None,
+        dpi: Optional[int] = None,
+    ) -> List[Tuple[int, Path]]:
+        """
+        Rasterize a range of PDF pages to image files.
+
+        Args:
+            pdf_path (Path): Path to the input PDF file.
+            first_page (Optional[int]): First page to render (default: first page).
+            last_page (Optional[int]): Last page to render (default: last page).
+            output_dir (Optional[Path]): Directory for the images (default: a
+                new job temp directory, see make_job_dir).
+            dpi (Optional[int]): Resolution for this range (default: self.dpi).
+
+        Returns:
+            List[Tuple[int, Path]]: (page number, image file) pairs in page order.
+
+        Raises:
+            subprocess.CalledProcessError: If pdftoppm fails.
+            ValueError: If pdftoppm wrote fewer pages than the range holds.
+        """
+        if output_dir is None:
+            output_dir = self.make_job_dir()
+        images: List[Tuple[int, Path]] = self._render_files(
+            pdf_path, first_page, last_page, output_dir, dpi
+        )
+        if first_page is not None and last_page is not None:
+            check_rendered(len(images), first_page, last_page)
+        return images
+
+    def _render_files(
+        self,
+        pdf_path: Path,
+        first_page: Optional[int],
+        last_page: Optional[int],
+        output_dir: Path,
+        dpi: Optional[int],
+    ) -> List[Tuple[int, Path]]:
+        """Run pdftoppm into a directory and return the pages it wrote."""
+        image_prefix: Path = output_dir / f"page_{first_page or 1}"
+        extension: str = RASTER_FORMATS[self.image_format][1]
+        command: List[str] = self.pdftoppm_command(first_page, last_page, dpi)
+        command += [str(pdf_path), str(image_prefix)]
+        try:
+            subprocess.run(command, check=True, capture_output=True, text=True)
         except subprocess.CalledProcessError as e:
             logger.error(f"Error converting PDF to images: {e}")
             logger.error(f"pdftoppm stderr: {e.stderr}")
             raise
-        return sorted(Path().glob(f"{image_prefix}-*.png"))
+        # pdftoppm zero-pads page numbers to the width of the document's page
+        # count, so parse the number instead of relying on lexical order.
+        images: List[Tuple[int, Path]] = [
+            (int(image.stem.rsplit("-", 1)[1]), image)
+            for image in output_dir.glob(f"{image_prefix.name}-*.{extension}")
+        ]
+        return sorted(images)
+
+    def pdftoppm_command(
+        self,
+        first_page: Optional[int] = None,
+        last_page: Optional[int] = None,
+        dpi: Optional[int] = None,
+    ) -> List[str]:
+        """Return the pdftoppm command for a page range, without its file arguments."""
+        pdftoppm_path: str = os.path.join(self.poppler_path, "pdftoppm")
+        command: List[str] = [pdftoppm_path, *RASTER_FORMATS[self.image_format][0]]
+        dpi = dpi or self.dpi
+        if self.scale_to is not None:
+            command += ["-scale-to", str(self.scale_to)]
+        elif dpi is not None:
+            command += ["-r", str(dpi)]
+        if first_page is not None:
+            command += ["-f", str(first_page)]
+        if last_page is not None:
+            command += ["-l", str(last_page)]
+        logger.info(
+            f"Rasterizing pages {first_page or 1}-{last_page or 'end'} "
+            f"at {dpi or 'default'} DPI using {pdftoppm_path}"
+        )
+        return command
+
+    def renders_in_memory(self) -> bool:
+        """Return True if rendered pages are passed around in memory."""
+        return self.in_memory and self.image_format in STREAM_FORMATS
+
+    def iter_rendered_pages(
+        self,
+        pdf_path: Path,
+        first_page: int,
+        last_page: int,
+        dpi: Optional[int] = None,
+    ) -> Generator[Tuple[int, bytes], None, None]:
+        """
+        Render a range of PDF pages into memory, yielding each page when ready.
+
+        pdftoppm writes the pages to a pipe instead of files, and every page
+        is yielded as soon as it has been read, while the rest of the range
+        is still rendering. Only the formats in STREAM_FORMATS can be split
+        this way. Closing the generator early stops pdftoppm.
+
+        Args:
+            pdf_path (Path): Path to the input PDF file.
+            first_page (int): First page to render.
+            last_page (int): Last page to render.
+            dpi (Optional[int]): Resolution for this range (default: self.dpi).
+
+        Yields:
+            Tuple[int, bytes]: (page number, PNM image) pairs in page order.
 
-    def process_image(self, image_file: Path, page_num: int) -> str:
-        """Process a single image file using OCR."""
+        Raises:
+            subprocess.CalledProcessError: If pdftoppm fails.
+            ValueError: If pdftoppm's output is not the expected PNM pages.
+        """
+        command: List[str] = self.pdftoppm_command(first_page, last_page, dpi)
+        command.append(str(pdf_path))
+        process: subprocess.Popen = subprocess.Popen(
+            command, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        )
+        # Drain stderr alongside, so a chatty pdftoppm cannot block on it.
+        errors: List[bytes] = []
+        drain: threading.Thread = threading.Thread(
+            target=lambda: errors.append(process.stderr.read()), daemon=True
+        )
+        drain.start()
+        try:
+            rendered: int = 0
+            problem: Optional[ValueError] = None
+            for page_num in range(first_page, last_page + 1):
+                try:
+                    image: Optional[bytes] = read_pnm(process.stdout)
+                except ValueError as e:
+                    problem = e
+                    break
+                if image is None:
+                    break
+                rendered += 1
+                yield page_num, image
+            process.wait()
+            drain.join()
+            if process.returncode:
+                stderr: str = b"".join(errors).decode("utf-8", errors="replace")
+                logger.error(
+                    f"Error converting PDF to images: exit status {process.returncode}"
+                )
+                logger.error(f"pdftoppm stderr: {stderr}")
+                raise subprocess.CalledProcessError(
+                    process.returncode, command, stderr=stderr
+                )
+            if problem is not None:
+                raise problem
+            check_rendered(rendered, first_page, last_page)
+        finally:
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+            process.stdout.close()
+            drain.join()
+            process.stderr.close()
+
+    def make_job_dir(self) -> Path:
+        """Create a private temporary directory for one job's page images."""
+        base: str = self.temp_dir or choose_temp_base(
+            (self.max_pending + 2 * self.workers + self.chunk_size)
+            * PAGE_IMAGE_ESTIMATE
+        )
+        return Path(tempfile.mkdtemp(prefix="bangla-pdf-ocr-", dir=base))
+
+    def convert_pdf_to_images(self, pdf_path: Path) -> List[Path]:
+        """
+        Convert a PDF file to a list of image files.
+
+        The images are written to a new temporary directory; the caller is
+        responsible for removing it.
+        """
+        return [image for _, image in self.rasterize_pages(pdf_path)]
+
+    def extract_text_layer(self, pdf_path: Path, page_count: int) -> Dict[int, str]:
+        """
+        Find pages whose embedded text layer can be used instead of OCR.
+
+        Runs pdftotext once over the document and keeps pages with at least
+        MIN_TEXT_LAYER_CHARS characters. For Bengali the text must also be
+        mostly Unicode Bengali, so pages set in legacy ANSI fonts (whose text
+        layer is Latin gibberish) are still sent to OCR.
+
+        Args:
+            pdf_path (Path): Path to the input PDF file.
+            page_count (int): Number of pages in the PDF.
+
+        Returns:
+            Dict[int, str]: Text of every born-digital page, by page number.
+        """
+        pdftotext_path: str = os.path.join(self.poppler_path, "pdftotext")
         try:
-            logger.info(f"Processing page {page_num}")
             result: subprocess.CompletedProcess = subprocess.run(
-                [self.tesseract_path, str(image_file), "stdout", "-l", self.language],
-                capture_output=True,
+                [pdftotext_path, "-layout", "-enc", "UTF-8", str(pdf_path), "-"],
                 check=True,
+                capture_output=True,
                 encoding="utf-8",
+                errors="replace",
+            )
+        except (OSError, subprocess.CalledProcessError) as e:
+            logger.warning(f"Could not read text layer, OCRing every page: {e}")
+            return {}
+
+        needs_bengali: bool = "ben" in self.language.split("+") or (
+            self.model is not None and self.model.bengali
+        )
+        text_pages: Dict[int, str] = {}
+        for page_num, text in enumerate(result.stdout.split("\f")[:page_count], 1):
+            letters: List[str] = [char for char in text if not char.isspace()]
+            if len(letters) < MIN_TEXT_LAYER_CHARS:
+                continue
+            if needs_bengali:
+                bengali: int = sum(ord(char) in BENGALI_CHARS for char in letters)
+                if bengali * 2 < len(letters):
+                    continue
+            text_pages[page_num] = text
+        logger.info(
+            f"{len(text_pages)} of {page_count} pages have a usable text layer"
+        )
+        return text_pages
+
+    def raster_shard_count(self, range_count: int) -> int:
+        """
+        Return how many page ranges are rasterized concurrently.
+
+        Uses ``raster_workers`` when set; otherwise one rasterizer for every
+        OCR_WORKERS_PER_RASTERIZER OCR workers, since rendering a page is much
+        cheaper than recognizing it. Never more than there are ranges.
+        """
+        shards: int = self.raster_workers or -(
+            -self.workers // OCR_WORKERS_PER_RASTERIZER
+        )
+        return max(1, min(shards, range_count))
+
+    def _rasterize_into(
+        self,
+        pdf_path: Path,
+        page_count: int,
+        page_numbers: List[int],
+        job_dir: Path,
+        pages: "queue.Queue[Union[Tuple[int, PageImage], PageResult, BaseException, None]]",
+        stop: threading.Event,
+        stats: RunStats,
+    ) -> None:
+        """
+        Producer: rasterize page ranges and hand each page to the OCR queue.
+
+        Ranges are taken in page order from a shared iterator by several
+        rasterizer threads (see raster_shard_count), so rendering runs in
+        parallel while early pages still reach OCR first.
+        """
+        try:
+            with stats.stage("plan"):
+                plan: Dict[int, Tuple[str, Optional[int]]] = self.plan_pages(
+                    pdf_path, page_count, page_numbers
+                )
+            shards: int = self.raster_shard_count(
+                len(page_ranges(page_numbers, self.chunk_size, plan))
+            )
+            chunk_size: int = self.chunk_size
+            if not self.pipeline:
+                # Render everything up front, one range per rasterizer.
+                chunk_size = max(1, -(-len(page_numbers) // shards))
+            ranges: Iterator[Tuple[int, int]] = iter(
+                page_ranges(page_numbers, chunk_size, plan)
+            )
+            ranges_lock: threading.Lock = threading.Lock()
+
+            def rasterize_shard() -> None:
+                try:
+                    while not stop.is_set():
+                        with ranges_lock:
+                            page_range: Optional[Tuple[int, int]] = next(ranges, None)
+                        if page_range is None:
+                            return
+                        self._rasterize_range(
+                            pdf_path, page_range, plan, job_dir, pages, stop, stats
+                        )
+                except BaseException as exc:
+                    stop.set()
+                    pages.put(exc)
+
+            helpers: List[threading.Thread] = [
+                threading.Thread(
+                    target=rasterize_shard, name=f"pdf-rasterizer-{index}", daemon=True
+                )
+                for index in range(1, shards)
+            ]
+            for helper in helpers:
+                helper.start()
+            rasterize_shard()
+            for helper in helpers:
+                helper.join()
+        except BaseException as exc:
+            pages.put(exc)
+        finally:
+            pages.put(None)
+
+    def _rasterize_range(
+        self,
+        pdf_path: Path,
+        page_range: Tuple[int, int],
+        plan: Dict[int, Tuple[str, Optional[int]]],
+        job_dir: Path,
+        pages: "queue.Queue[Union[Tuple[int, PageImage], PageResult, BaseException, None]]",
+        stop: threading.Event,
+        stats: RunStats,
+    ) -> None:
+        """
+        Render or extract one page range and queue its pages for OCR.
+
+        Pages rendered in memory are queued one by one as pdftoppm produces
+        them; pages written to files are queued once the range is done. If
+        pdftoppm produces fewer pages than the range holds, the pages it did
+        not deliver are queued as failed PageResults, so they are reported
+        and retried by --resume.
+        """
+        first_page, last_page = page_range
+        method, dpi = plan.get(first_page, ("render", None))
+        started: float = time.monotonic()
+        stream: Optional[Generator[Tuple[int, bytes], None, None]] = None
+        chunk: List[Tuple[int, PageImage]] = []
+        queued: Set[int] = set()
+        # Pages of an "extract" range that had to be rendered after all.
+        fallback: Set[int] = set()
+
+        def offer(item: Union[Tuple[int, PageImage], PageResult]) -> bool:
+            # Wait for room in the queue; False once the run is stopping.
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        try:
+            if method == "extract":
+                chunk, fallback = self._extract_range(
+                    pdf_path, first_page, last_page, job_dir
+                )
+            elif self.renders_in_memory():
+                stream = self.iter_rendered_pages(pdf_path, first_page, last_page, dpi)
+            else:
+                chunk = self._render_files(
+                    pdf_path, first_page, last_page, job_dir, dpi
+                )
+            # One poppler call writes a whole chunk; split its time evenly.
+            rendered_at: float = time.monotonic()
+            share: float = (rendered_at - started) / max(len(chunk), 1)
+            for index, (page_num, image) in enumerate(stream or chunk):
+                if stream is not None:
+                    rendered_at = time.monotonic()
+                    share = rendered_at - started
+                stats.set_page(
+                    page_num,
+                    raster=share,
+                    rendered_at=rendered_at,
+                    method="render" if page_num in fallback else method,
+                    dpi=dpi,
+                    image_bytes=(
+                        len(image) if isinstance(image, bytes) else image.stat().st_size
+                    ),
+                )
+                # Counted before the put, so the consumer never takes the
+                # page out of the gauge before it was added.
+                metrics.QUEUE_DEPTH.inc()
+                if not offer((page_num, image)):
+                    metrics.QUEUE_DEPTH.dec()
+                    for _, leftover in chunk[index:]:
+                        discard_image(leftover)
+                    return
+                queued.add(page_num)
+                # Time the next streamed page from here, not counting the wait
+                # for room in the queue.
+                started = time.monotonic()
+            if stream is None:
+                check_rendered(len(chunk), first_page, last_page)
+        except ValueError as e:
+            logger.error(f"Pages {first_page}-{last_page} were not all rendered: {e}")
+            for page_num in range(first_page, last_page + 1):
+                if page_num in queued:
+                    continue
+                stats.pop_page(page_num)
+                if not offer(PageResult(page_num, "", {"error": str(e)})):
+                    return
+        finally:
+            if stream is not None:
+                stream.close()
+
+    def _iter_pipeline(
+        self,
+        pdf_path: Path,
+        page_count: int,
+        executor: Executor,
+        only_pages: Optional[Collection[int]] = None,
+        stats: Optional[RunStats] = None,
+        cancel: Optional[threading.Event] = None,
+    ) -> Iterator[PageResult]:
+        """
+        Yield page results as OCR finishes.
+
+        Producer threads rasterize the PDF in ranges and feed a bounded
+        queue; pages are submitted to the executor as soon as they land, with
+        at most ``max_pending`` rendered pages waiting in the queue and two
+        pages per worker handed to the pool. Pages with a usable text layer
+        are yielded first and never rasterized, unless ``force_ocr`` is set.
+        When ``only_pages`` is given, every other page is skipped. Rendered
+        pages are held in memory (see ``in_memory``); page images that are
+        written to files live in a private temp directory that is removed
+        when the generator finishes, fails or is closed.
+
+        Every OCR result carries ``metadata["timings"]`` (seconds spent
+        rasterizing the page, waiting for a worker and recognizing it) along
+        with how the page image was made; stage totals go to ``stats``.
+
+        Setting ``cancel`` stops the pipeline from another thread: the
+        rasterizers stop, queued pages are dropped and CancelledError is
+        raised once the pages being recognized are done.
+        """
+        stats = stats or RunStats()
+        wanted: List[int] = [
+            page_num
+            for page_num in range(1, page_count + 1)
+            if only_pages is None or page_num in only_pages
+        ]
+        text_pages: Dict[int, str] = {}
+        if not self.force_ocr and wanted:
+            with stats.stage("text_layer"):
+                text_pages = self.extract_text_layer(pdf_path, page_count)
+        page_numbers: List[int] = []
+        for page_num in wanted:
+            if page_num in text_pages:
+                metrics.observe_page({"source": "text-layer"})
+                yield PageResult(
+                    page_num, text_pages[page_num], {"source": "text-layer"}
+                )
+            else:
+                page_numbers.append(page_num)
+
+        in_flight_limit: int = 2 * self.workers
+        pages: "queue.Queue[Union[Tuple[int, PageImage], PageResult, BaseException, None]]" = (
+            queue.Queue(maxsize=self.max_pending)
+        )
+        stop: threading.Event = threading.Event()
+        job_dir: Path = self.make_job_dir()
+        producer: threading.Thread = threading.Thread(
+            target=self._rasterize_into,
+            args=(pdf_path, page_count, page_numbers, job_dir, pages, stop, stats),
+            name="pdf-rasterizer-0",
+            daemon=True,
+        )
+        producer.start()
+
+        batch_size: int = self.batch_size if ENGINES[self.backend].batched else 1
+        in_flight: Dict[Future, List[Tuple[int, PageImage]]] = {}
+        producing: bool = True
+        # Producer error or failed page read while filling a batch, handled
+        # on the next round.
+        held: Optional[Union[PageResult, BaseException]] = None
+        # Blocking waits wake up this often to look at ``cancel``.
+        poll: Optional[float] = None if cancel is None else CANCEL_POLL_INTERVAL
+        try:
+            while producing or in_flight:
+                if cancel is not None and cancel.is_set():
+                    raise CancelledError(f"Processing of {pdf_path} was cancelled")
+                if in_flight:
+                    has_room: bool = producing and len(in_flight) < in_flight_limit
+                    done, _ = wait(
+                        in_flight,
+                        timeout=0 if has_room else poll,
+                        return_when=FIRST_COMPLETED,
+                    )
+                    for future in done:
+                        batch: List[Tuple[int, PageImage]] = in_flight.pop(future)
+                        try:
+                            results: List[PageResult] = future.result()
+                        except Exception as exc:
+                            results = []
+                            for page_num, _ in batch:
+                                logger.error(
+                                    f"Page {page_num} processing generated an exception: {exc}"
+                                )
+                                results.append(
+                                    PageResult(page_num, "", {"error": str(exc)})
+                                )
+                        for result in results:
+                            result = self._add_page_details(result, stats)
+                            metrics.observe_page(result.metadata)
+                            yield result
+                if not producing or len(in_flight) >= in_flight_limit:
+                    continue
+                if held is not None:
+                    item, held = held, None
+                else:
+                    try:
+                        item = pages.get(timeout=0.05 if in_flight else poll)
+                    except queue.Empty:
+                        continue
+                if item is None:
+                    producing = False
+                elif isinstance(item, BaseException):
+                    raise item
+                elif isinstance(item, PageResult):
+                    metrics.observe_page(item.metadata)
+                    yield item
+                else:
+                    metrics.QUEUE_DEPTH.dec()
+                    batch = [item]
+                    # Take whatever else is already rendered, up to batch_size.
+                    while len(batch) < batch_size:
+                        try:
+                            extra = pages.get_nowait()
+                        except queue.Empty:
+                            break
+                        if extra is None:
+                            producing = False
+                            break
+                        if isinstance(extra, (PageResult, BaseException)):
+                            held = extra
+                            break
+                        metrics.QUEUE_DEPTH.dec()
+                        batch.append(extra)
+                    future = executor.submit(self._ocr_pages, batch)
+                    metrics.OCR_TASKS_IN_FLIGHT.inc()
+                    future.add_done_callback(
+                        lambda _: metrics.OCR_TASKS_IN_FLIGHT.dec()
+                    )
+                    in_flight[future] = batch
+        finally:
+            stop.set()
+            for future, batch in in_flight.items():
+                if future.cancel():
+                    for _, image in batch:
+                        discard_image(image)
+            while producer.is_alive() or not pages.empty():
+                try:
+                    item = pages.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                if isinstance(item, tuple) and not isinstance(item, PageResult):
+                    metrics.QUEUE_DEPTH.dec()
+                    discard_image(item[1])
+            # Running workers may still hold images; wait for them before
+            # removing the directory.
+            wait(in_flight)
+            shutil.rmtree(job_dir, ignore_errors=True)
+
+    @staticmethod
+    def _add_page_details(result: PageResult, stats: RunStats) -> PageResult:
+        """Merge the rasterization details of a page into its OCR result."""
+        details: Dict[str, Any] = stats.pop_page(result.page_num)
+        ocr_started: Optional[float] = result.metadata.pop("ocr_started", None)
+        rendered_at: Optional[float] = details.pop("rendered_at", None)
+        timings: Dict[str, float] = {}
+        if "raster" in details:
+            timings["raster"] = details.pop("raster")
+        if ocr_started is not None and rendered_at is not None:
+            timings["queue_wait"] = max(0.0, ocr_started - rendered_at)
+        timings.update(result.metadata.get("timings", {}))
+        if timings:
+            result.metadata["timings"] = timings
+        result.metadata.update(details)
+        return result
+
+    def cache_settings(self) -> Dict[str, Any]:
+        """Return the settings that change OCR output, for use in cache keys."""
+        settings: Dict[str, Any] = {
+            "language": self.language,
+            "dpi": self.dpi,
+            "scale_to": self.scale_to,
+            "adaptive_dpi": self.adaptive_dpi,
+            "extract_images": self.extract_images,
+        }
+        if self.preprocess:
+            settings["preprocess"] = [step_name(step) for step in self.preprocess]
+        if self.tesseract_config != TesseractConfig():
+            settings["tesseract"] = self.tesseract_config.settings()
+        if self._model_digest is not None:
+            settings["model"] = self._model_digest
+        return settings
+
+    def _preprocess_page(
+        self, page_num: int, image: PageImage
+    ) -> Tuple[PageImage, Dict[str, Any]]:
+        """
+        Run the preprocessing steps over a page image.
+
+        Images that cannot be decoded or processed are left as they are, so
+        they still reach OCR.
+
+        Args:
+            page_num (int): Page number, for log messages.
+            image (PageImage): Page image file, which is replaced, or
+                in-memory image.
+
+        Returns:
+            Tuple[PageImage, Dict[str, Any]]: The image to recognize and
+            metadata for the page result: pixel counts before and after
+            preprocessing.
+        """
+        try:
+            data, details = preprocess_image(
+                image if isinstance(image, bytes) else Path(image).read_bytes(),
+                self.preprocess,
             )
-            text: str = result.stdout
-            os.remove(image_file)
-            return f"\n--- Page {page_num} ---\n{text}"
+        except Exception as e:
+            logger.warning(f"Could not preprocess page {page_num}: {e}")
+            return image, {}
+        if isinstance(image, bytes):
+            return data, details
+        Path(image).write_bytes(data)
+        return image, details
+
+    def _ocr_pages(self, items: List[Tuple[int, PageImage]]) -> List[PageResult]:
+        """
+        Recognize a batch of page images, consulting the page cache when enabled.
+
+        With ``skip_blank``, blank pages are detected first and get empty text
+        with source "blank". Pages missing from the cache are preprocessed,
+        then handed to the engine together, so the batch backend can
+        recognize them with a single model load; if the batch fails, its
+        pages are retried one by one. Every image file is removed afterwards.
+        Each result records its recognition time in
+        ``metadata["timings"]["ocr"]`` and its preprocessing time in
+        ``metadata["timings"]["preprocess"]``; the time of a batch is split
+        evenly between its pages.
+
+        Args:
+            items (List[Tuple[int, PageImage]]): (page number, image file or
+                in-memory image) pairs.
+
+        Returns:
+            List[PageResult]: One result per item, in the same order.
+        """
+        results: Dict[int, PageResult] = {}
+        pending: List[Tuple[int, PageImage, Optional[str]]] = []
+        started: float = time.monotonic()
+        seconds: Dict[int, float] = {}
+        prepared: Dict[int, Dict[str, Any]] = {}
+        retried: bool = False
+        try:
+            for page_num, image in items:
+                lookup_started: float = time.monotonic()
+                if self.skip_blank:
+                    details: Dict[str, Any] = blank_page_details(
+                        image, self.blank_threshold
+                    )
+                    if details.pop("blank"):
+                        seconds[page_num] = time.monotonic() - lookup_started
+                        results[page_num] = PageResult(
+                            page_num, "", {"source": "blank", **details}
+                        )
+                        continue
+                key: Optional[str] = None
+                if self.cache is not None:
+                    key = self.cache.make_key(
+                        image if isinstance(image, bytes) else Path(image).read_bytes(),
+                        **self.cache_settings(),
+                    )
+                    text: Optional[str] = self.cache.get(key)
+                    seconds[page_num] = time.monotonic() - lookup_started
+                    if text is not None:
+                        results[page_num] = PageResult(
+                            page_num,
+                            normalize_text(text),
+                            {"source": "ocr", "cached": True},
+                        )
+                        continue
+                pending.append((page_num, image, key))
+
+            if self.preprocess:
+                for index, (page_num, image, key) in enumerate(pending):
+                    preprocess_started: float = time.monotonic()
+                    image, prepared[page_num] = self._preprocess_page(page_num, image)
+                    prepared[page_num]["timings"] = {
+                        "preprocess": time.monotonic() - preprocess_started
+                    }
+                    pending[index] = (page_num, image, key)
+
+            if len(pending) > 1:
+                logger.info(
+                    f"Processing pages {', '.join(str(page[0]) for page in pending)}"
+                )
+                batch_started: float = time.monotonic()
+                engine: OCREngine = get_engine(
+                    self.backend,
+                    self.tesseract_path,
+                    self.language,
+                    self.tesseract_config,
+                    self.omp_thread_limit,
+                )
+                try:
+                    texts: List[str] = engine.recognize_batch(
+                        [image for _, image, _ in pending]
+                    )
+                except (subprocess.CalledProcessError, OCREngineError) as e:
+                    logger.warning(
+                        f"Batch of {len(pending)} pages failed ({e}); "
+                        "retrying page by page"
+                    )
+                    retried = True
+                share: float = (time.monotonic() - batch_started) / len(pending)
+                for page_num, _, _ in pending:
+                    seconds[page_num] = seconds.get(page_num, 0.0) + share
+                if not retried:
+                    for (page_num, _, key), text in zip(pending, texts):
+                        results[page_num] = self._page_done(page_num, text, key)
+                    pending = []
+
+            for page_num, image, key in pending:
+                page_started: float = time.monotonic()
+                results[page_num] = self._ocr_single(page_num, image, key)
+                seconds[page_num] = (
+                    seconds.get(page_num, 0.0) + time.monotonic() - page_started
+                )
+                if retried:
+                    results[page_num].metadata["retries"] = 1
+        finally:
+            for _, image in items:
+                discard_image(image)
+        for page_num, result in results.items():
+            page_details: Dict[str, Any] = prepared.get(page_num, {})
+            result.metadata["timings"] = {
+                **page_details.pop("timings", {}),
+                "ocr": seconds.get(page_num, 0.0),
+            }
+            result.metadata.update(page_details)
+            # Read back by _iter_pipeline to work out how long the page waited.
+            result.metadata["ocr_started"] = started
+        return [results[page_num] for page_num, _ in items]
+
+    def _ocr_single(
+        self, page_num: int, image: PageImage, key: Optional[str]
+    ) -> PageResult:
+        """Recognize one page image, turning engine errors into a failed result."""
+        metadata: Dict[str, Any] = {} if key is None else {"cached": False}
+        try:
+            logger.info(f"Processing page {page_num}")
+            text: str = get_engine(
+                self.backend,
+                self.tesseract_path,
+                self.language,
+                self.tesseract_config,
+                self.omp_thread_limit,
+            ).recognize(image)
+            return self._page_done(page_num, text, key)
         except subprocess.CalledProcessError as e:
             logger.error(f"Error processing page {page_num}: {e}")
             logger.error(f"Tesseract stderr: {e.stderr}")
-            return f"\n--- Page {page_num} ---\nError: {e}\n"
+            metadata["error"] = str(e)
+        except OCREngineError as e:
+            logger.error(f"Error processing page {page_num}: {e}")
+            metadata["error"] = str(e)
+        return PageResult(page_num, "", metadata)
+
+    def _page_done(self, page_num: int, text: str, key: Optional[str]) -> PageResult:
+        """Store a freshly recognized page in the cache and wrap it as a result."""
+        text = normalize_text(text)
+        metadata: Dict[str, Any] = {"source": "ocr"}
+        if key is not None:
+            self.cache.put(key, text)
+            metadata["cached"] = False
+        return PageResult(page_num, text, metadata)
+
+    def _ocr_page(self, image: PageImage, page_num: int) -> PageResult:
+        """Recognize one page image, consulting the page cache when enabled."""
+        return self._ocr_pages([(page_num, image)])[0]
+
+    def process_image(self, image_file: PageImage, page_num: int) -> str:
+        """Process a single image file, or an encoded image in memory, using OCR."""
+        result: PageResult = self._ocr_page(image_file, page_num)
+        # Pipeline pages are counted as they are yielded, with their
+        # rasterization timings; this is the only other way into OCR.
+        metrics.observe_page(result.metadata)
+        return format_page(result)
+
+    def iter_pages(
+        self, pdf_path: Union[str, Path], ordered: bool = True
+    ) -> Iterator[PageResult]:
+        """
+        Stream OCR results page by page without building the full text.
+
+        Args:
+            pdf_path (Union[str, Path]): Path to the input PDF file.
+            ordered (bool): Yield pages in page order, each as soon as it and
+                all earlier pages are done. With False, pages are yielded the
+                moment they finish, for maximum throughput.
+
+        Yields:
+            PageResult: (page_num, text, metadata) for every page.
+        """
+        pdf_path_obj: Path = Path(pdf_path)
+        page_count: int = self.get_page_count(pdf_path_obj)
+        results: Iterator[PageResult] = self._iter_pipeline(
+            pdf_path_obj, page_count, self.get_executor()
+        )
+        if not ordered:
+            yield from results
+            return
+
+        waiting: Dict[int, PageResult] = {}
+        next_page: int = 1
+        for result in results:
+            waiting[result.page_num] = result
+            while next_page in waiting:
+                yield waiting.pop(next_page)
+                next_page += 1
+
+    def journal_header(self, pdf_path: Path) -> Dict[str, Any]:
+        """Describe a job so that a journal is only resumed for the same input."""
+        stat: os.stat_result = pdf_path.stat()
+        return {
+            "pdf": str(pdf_path.resolve()),
+            "size": stat.st_size,
+            "mtime": stat.st_mtime_ns,
+            "settings": {**self.cache_settings(), "force_ocr": self.force_ocr},
+        }
 
     def extract_text_from_pdf(
-        self, pdf_path: str, output_file: Optional[str] = None
+        self, pdf_path: str, output_file: Optional[str] = None, resume: bool = False
     ) -> str:
         """
         Extract text from a PDF file using OCR.
 
+        Finished pages are journaled next to the output file as they complete,
+        so an interrupted run can be continued with ``resume=True``.
+
         Args:
             pdf_path (str): Path to the input PDF file.
             output_file (Optional[str]): Path to save the extracted text.
+            resume (bool): Reuse pages recorded by an earlier, interrupted run
+                and only process the missing ones.
 
         Returns:
             str: The extracted text.
         """
         pdf_path_obj: Path = Path(pdf_path)
-        output_file_obj: Path = (
-            Path(output_file) if output_file else pdf_path_obj.with_suffix(".txt")
-        )
+        self.cache_stats = {"hits": 0, "misses": 0}
+        metrics.DOCUMENTS_IN_PROGRESS.inc()
+        try:
+            full_text, self.last_report = self._extract_document(
+                pdf_path_obj,
+                Path(output_file) if output_file else pdf_path_obj.with_suffix(".txt"),
+                resume,
+            )
+        except Exception:
+            metrics.observe_document(None)
+            raise
+        finally:
+            metrics.DOCUMENTS_IN_PROGRESS.dec()
+        metrics.observe_document(self.last_report)
+        return full_text
 
-        logger.info(f"Extracting text from {pdf_path_obj}")
-        images: List[Path] = self.convert_pdf_to_images(pdf_path_obj)
-        full_book: List[str] = [""] * len(images)
+    def _extract_document(
+        self,
+        pdf_path: Path,
+        output_file: Path,
+        resume: bool,
+        progress: bool = True,
+        cancel: Optional[threading.Event] = None,
+    ) -> Tuple[str, Dict[str, Any]]:
+        """
+        OCR one PDF into its output file, journaling pages as they finish.
 
-        with ThreadPoolExecutor() as executor:
-            futures: Dict[Future[str], int] = {
-                executor.submit(self.process_image, img, i): i
-                for i, img in enumerate(images, start=1)
-            }
-            for future in tqdm(
-                as_completed(futures), total=len(futures), desc="Processing pages"
-            ):
-                page_num: int = futures[future]
-                try:
-                    page_text: str = future.result()
-                    full_book[page_num - 1] = page_text
-                except Exception as exc:
-                    logger.error(
-                        f"Page {page_num} processing generated an exception: {exc}"
-                    )
-                    full_book[page_num - 1] = (
-                        f"\n--- Page {page_num} ---\nError: {exc}\n"
+        Safe to call from several threads at once; all of them share the
+        processor's worker pool. Every stage is timed and the timings are
+        returned as a report (see :func:`report.build_report`).
+
+        Args:
+            pdf_path (Path): Path to the input PDF file.
+            output_file (Path): Path to save the extracted text.
+            resume (bool): Reuse pages recorded by an earlier, interrupted run.
+            progress (bool): Show a per-page progress bar.
+            cancel (Optional[threading.Event]): When set, stop early and
+                raise CancelledError, keeping the journal for --resume.
+
+        Returns:
+            Tuple[str, Dict[str, Any]]: The extracted text and the run report.
+        """
+        logger.info(f"Extracting text from {pdf_path}")
+        stats: RunStats = RunStats()
+        stats.add("discovery", self.discovery_seconds)
+        with stats.stage("page_count"):
+            page_count: int = self.get_page_count(pdf_path)
+        full_book: List[str] = [""] * page_count
+
+        journal: PageJournal = PageJournal(
+            PageJournal.path_for(output_file), self.journal_header(pdf_path)
+        )
+        missing: List[int] = list(range(1, page_count + 1))
+        if resume:
+            for page_num, (text, metadata) in journal.load().items():
+                if 1 <= page_num <= page_count and "error" not in metadata:
+                    full_book[page_num - 1] = format_page(
+                        PageResult(page_num, text, metadata)
                     )
+            missing = [page_num for page_num in missing if not full_book[page_num - 1]]
+            if progress:
+                type_text(
+                    f"Resuming: {page_count - len(missing)} of {page_count} pages "
+                    "already done",
+                    Fore.CYAN,
+                )
+
+        failed: int = 0
+        cache_stats: Dict[str, int] = {"hits": 0, "misses": 0}
+        pages: List[Dict[str, Any]] = []
+        results: Iterator[PageResult] = self._iter_pipeline(
+            pdf_path, page_count, self.get_executor(), missing, stats, cancel
+        )
+        if progress:
+            results = progress_bar(
+                results, total=len(missing), desc="Processing pages"
+            )
+        journal.open(resume)
+        try:
+            for result in results:
+                with stats.stage("journal"):
+                    journal.record(*result)
+                pages.append({"page": result.page_num, **result.metadata})
+                full_book[result.page_num - 1] = format_page(result)
+                failed += "error" in result.metadata
+                if "cached" in result.metadata:
+                    cache_stats["hits" if result.metadata["cached"] else "misses"] += 1
+        finally:
+            journal.close()
+            with self._stats_lock:
+                for name, count in cache_stats.items():
+                    self.cache_stats[name] += count
 
         full_text: str = "".join(full_book)
 
-        with open(output_file_obj, "w", encoding="utf-8") as file:
-            file.write(full_text)
+        with stats.stage("output"):
+            partial_file: Path = output_file.with_name(output_file.name + ".part")
+            with open(partial_file, "w", encoding="utf-8") as file:
+                file.write(full_text)
+            os.replace(partial_file, output_file)
+        if failed:
+            # Keep the journal so that --resume only retries the failed pages.
+            logger.warning(
+                f"{failed} pages of {pdf_path} failed; "
+                "run again with --resume to retry them"
+            )
+        else:
+            journal.remove()
+
+        logger.info(f"Text extracted and saved to {output_file}")
+        report: Dict[str, Any] = build_report(
+            stats,
+            pages,
+            pdf=str(pdf_path),
+            output=str(output_file),
+            page_count=page_count,
+            resumed_pages=page_count - len(missing),
+            settings={
+                **self.cache_settings(),
+                "backend": self.backend,
+                "executor": self.executor,
+                "workers": self.workers,
+                "batch_size": self.batch_size,
+                "image_format": self.image_format,
+                "in_memory": self.renders_in_memory(),
+                "pipeline": self.pipeline,
+                "chunk_size": self.chunk_size,
+                "max_pending": self.max_pending,
+                "force_ocr": self.force_ocr,
+                "skip_blank": self.skip_blank,
+                "blank_threshold": self.blank_threshold,
+                "preprocess": [step_name(step) for step in self.preprocess],
+                "tesseract": self.tesseract_config.settings(),
+                "model": None if self.model is None else self.model.settings(),
+            },
+        )
+        return full_text, report
+
+    def process_documents(
+        self,
+        documents: List[Tuple[Path, Path]],
+        resume: bool = False,
+        max_documents: Optional[int] = None,
+    ) -> Iterator[DocumentResult]:
+        """
+        OCR many PDFs, scheduling the pages of all of them on one worker pool.
 
-        logger.info(f"Text extracted and saved to {output_file_obj}")
-        return full_text
+        Several documents are in flight at once, so the pages of small PDFs
+        keep every worker busy instead of the pool draining at the end of
+        each file. Every output file is written as soon as its document is
+        done, and a PDF that fails does not stop the batch. If the caller
+        stops early (an exception, KeyboardInterrupt or closing the
+        generator), documents not yet started are dropped and those in
+        progress stop after their current pages, keeping their journals.
+
+        Args:
+            documents (List[Tuple[Path, Path]]): (input PDF, output file) pairs.
+            resume (bool): Continue interrupted documents from their journals.
+            max_documents (Optional[int]): PDFs processed at the same time
+                (default: one for every two OCR workers, at least two).
+
+        Yields:
+            DocumentResult: One result per document, in completion order.
+        """
+        self.cache_stats = {"hits": 0, "misses": 0}
+        # Create the shared pool before the document threads race for it.
+        self.get_executor()
+        limit: int = max_documents or max(2, self.workers // 2)
+        remaining: Iterator[Tuple[Path, Path]] = iter(documents)
+        running: Dict[Future, Tuple[Path, Path]] = {}
+        cancel: threading.Event = threading.Event()
+        with ThreadPoolExecutor(
+            max_workers=limit, thread_name_prefix="pdf-document"
+        ) as document_pool:
+            try:
+                while True:
+                    for pdf_path, output_file in remaining:
+                        future: Future = document_pool.submit(
+                            self._extract_document,
+                            pdf_path,
+                            output_file,
+                            resume,
+                            False,
+                            cancel,
+                        )
+                        metrics.DOCUMENTS_IN_PROGRESS.inc()
+                        future.add_done_callback(
+                            lambda _: metrics.DOCUMENTS_IN_PROGRESS.dec()
+                        )
+                        running[future] = (pdf_path, output_file)
+                        if len(running) >= limit:
+                            break
+                    if not running:
+                        return
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        pdf_path, output_file = running.pop(future)
+                        try:
+                            _, report = future.result()
+                        except Exception as exc:
+                            logger.error(f"Failed to process {pdf_path}: {exc}")
+                            metrics.observe_document(None)
+                            yield DocumentResult(
+                                pdf_path, output_file, 0, 0, str(exc), None
+                            )
+                        else:
+                            metrics.observe_document(report)
+                            yield DocumentResult(
+                                pdf_path,
+                                output_file,
+                                report["page_count"],
+                                report["pages"]["failed"],
+                                None,
+                                report,
+                            )
+            finally:
+                # Stops the documents still running after an early exit.
+                cancel.set()
+                for future in running:
+                    future.cancel()
 
 
 def process_pdf(
-    pdf_path: str, output_file: Optional[str] = None, language: str = "ben"
+    pdf_path: str,
+    output_file: Optional[str] = None,
+    language: str = "ben",
+    resume: bool = False,
+    report_file: Optional[str] = None,
+    metrics_file: Optional[str] = None,
+    **processor_options: Any,
 ) -> str:
     """
     Process a PDF file and extract text using OCR.
@@ -224,13 +2001,35 @@ def process_pdf(
         pdf_path (str): Path to the input PDF file.
         output_file (Optional[str]): Path to save the extracted text.
         language (str): Language for OCR processing.
+        resume (bool): Continue an interrupted run from its journal.
+        report_file (Optional[str]): Write the run's timing report (per-stage
+            wall and CPU time, per-page timings, image sizes and retries) to
+            this JSON file.
+        metrics_file (Optional[str]): Write the Prometheus metrics of the
+            process to this file when done (see :mod:`metrics`).
+        **processor_options: Extra keyword arguments passed to OCRProcessor.
 
     Returns:
         str: The extracted text.
     """
-    processor: OCRProcessor = OCRProcessor(language)
-    type_text("Starting PDF processing...", Fore.GREEN)
-    extracted_text: str = processor.extract_text_from_pdf(pdf_path, output_file)
+    with OCRProcessor(language, **processor_options) as processor:
+        type_text("Starting PDF processing...", Fore.GREEN)
+        extracted_text: str = processor.extract_text_from_pdf(
+            pdf_path, output_file, resume
+        )
+        if processor.cache is not None:
+            type_text(
+                f"Page cache: {processor.cache_stats['hits']} hits, "
+                f"{processor.cache_stats['misses']} misses",
+                Fore.CYAN,
+            )
+        report: Dict[str, Any] = processor.last_report
+    type_text(format_report_summary(report), Fore.CYAN)
+    if report_file:
+        write_report(report_file, report)
+        type_text(f"Run report saved to: {report_file}", Fore.CYAN)
+    if metrics_file:
+        metrics.write_textfile(metrics_file)
     type_text(
         f"Extraction completed successfully. Processed file: {pdf_path}",
         Fore.GREEN,
@@ -238,8 +2037,459 @@ def process_pdf(
     return extracted_text
 
 
+def iter_pdf_pages(
+    pdf_path: str,
+    language: str = "ben",
+    ordered: bool = True,
+    **processor_options: Any,
+) -> Iterator[PageResult]:
+    """
+    Stream the pages of a PDF as they are recognized.
+
+    Args:
+        pdf_path (str): Path to the input PDF file.
+        language (str): Language for OCR processing.
+        ordered (bool): Yield pages in page order (True) or as they finish.
+        **processor_options: Extra keyword arguments passed to OCRProcessor.
+
+    Yields:
+        PageResult: (page_num, text, metadata) for every page.
+    """
+    with OCRProcessor(language, **processor_options) as processor:
+        yield from processor.iter_pages(pdf_path, ordered)
+
+
+def find_pdfs(
+    inputs: List[str], output_dir: Optional[str] = None
+) -> List[Tuple[Path, Path]]:
+    """
+    Expand batch inputs into PDF files and the text files they are saved to.
+
+    Each input is a PDF, a directory (searched recursively), a glob pattern,
+    or ``@list.txt``: a file with one input per line.
+
+    Args:
+        inputs (List[str]): Paths, directories, patterns and list files.
+        output_dir (Optional[str]): Directory for the text files. PDFs keep
+            their path relative to the directory they were found in, the
+            fixed part of their glob pattern, or the common parent of the
+            PDFs of a list file. By default each text file is written next
+            to its PDF.
+
+    Returns:
+        List[Tuple[Path, Path]]: (input PDF, output file) pairs, without
+        duplicates.
+
+    Raises:
+        ValueError: If two different PDFs would be saved to the same file.
+    """
+    import glob
+
+    found: List[Tuple[Path, Path]] = []
+    for item in inputs:
+        if item.startswith("@"):
+            with open(item[1:], encoding="utf-8") as file:
+                lines: List[str] = [
+                    line.strip()
+                    for line in file
+                    if line.strip() and not line.strip().startswith("#")
+                ]
+            try:
+                parent: Optional[str] = os.path.commonpath(
+                    [os.path.dirname(line) or "." for line in lines]
+                )
+            except ValueError:
+                # Absolute and relative paths mixed: fall back to file names.
+                parent = None
+            found.extend(
+                (
+                    Path(line),
+                    Path(
+                        os.path.relpath(line, parent)
+                        if parent is not None
+                        else Path(line).name
+                    ),
+                )
+                for line in lines
+            )
+        elif Path(item).is_dir():
+            root: Path = Path(item)
+            found.extend(
+                (path, path.relative_to(root))
+                for path in sorted(root.rglob("*"))
+                if path.suffix.lower() == ".pdf" and path.is_file()
+            )
+        elif glob.has_magic(item):
+            # Matches keep their path below the pattern's leading directories.
+            parts: Tuple[str, ...] = Path(item).parts
+            fixed: int = next(
+                index for index, part in enumerate(parts) if glob.has_magic(part)
+            )
+            pattern_root: str = os.path.join(*parts[:fixed]) if fixed else "."
+            found.extend(
+                (Path(path), Path(os.path.relpath(path, pattern_root)))
+                for path in sorted(glob.glob(item, recursive=True))
+                if Path(path).suffix.lower() == ".pdf" and Path(path).is_file()
+            )
+        else:
+            found.append((Path(item), Path(Path(item).name)))
+
+    documents: List[Tuple[Path, Path]] = []
+    seen: Set[Path] = set()
+    outputs: Dict[Path, Path] = {}
+    for pdf_path, relative_path in found:
+        key: Path = pdf_path.resolve()
+        if key in seen:
+            continue
+        seen.add(key)
+        if output_dir:
+            output_file: Path = Path(output_dir) / relative_path.with_suffix(".txt")
+        else:
+            output_file = pdf_path.with_suffix(".txt")
+        other: Path = outputs.setdefault(output_file.resolve(), pdf_path)
+        if other != pdf_path:
+            raise ValueError(
+                f"{other} and {pdf_path} would both be saved to {output_file}"
+            )
+        documents.append((pdf_path, output_file))
+    return documents
+
+
+def process_batch(
+    inputs: List[str],
+    output_dir: Optional[str] = None,
+    language: str = "ben",
+    resume: bool = False,
+    skip_existing: bool = False,
+    max_documents: Optional[int] = None,
+    report_file: Optional[str] = None,
+    metrics_file: Optional[str] = None,
+    **processor_options: Any,
+) -> List[DocumentResult]:
+    """
+    Process many PDF files with one shared pool of OCR workers.
+
+    Args:
+        inputs (List[str]): PDFs, directories, glob patterns or ``@list``
+            files, see :func:`find_pdfs`.
+        output_dir (Optional[str]): Directory for the text files (default:
+            next to each PDF).
+        language (str): Language for OCR processing.
+        resume (bool): Continue interrupted documents from their journals.
+        skip_existing (bool): Skip PDFs whose text file already exists and
+            has no journal left by an unfinished run.
+        max_documents (Optional[int]): PDFs processed at the same time.
+        report_file (Optional[str]): Write the timing reports of all PDFs to
+            this JSON file.
+        metrics_file (Optional[str]): Keep the Prometheus metrics of the
+            process in this file, rewritten after every PDF.
+        **processor_options: Extra keyword arguments passed to OCRProcessor.
+
+    Returns:
+        List[DocumentResult]: One result per processed PDF, in completion order.
+    """
+    documents: List[Tuple[Path, Path]] = find_pdfs(inputs, output_dir)
+    if skip_existing:
+        documents = [
+            (pdf_path, output_file)
+            for pdf_path, output_file in documents
+            if not output_file.exists()
+            or PageJournal.path_for(output_file).exists()
+        ]
+    for directory in {output_file.parent for _, output_file in documents}:
+        directory.mkdir(parents=True, exist_ok=True)
+    type_text(f"Found {len(documents)} PDF files to process", Fore.CYAN)
+
+    results: List[DocumentResult] = []
+    with OCRProcessor(language, **processor_options) as processor:
+        for result in progress_bar(
+            processor.process_documents(documents, resume, max_documents),
+            total=len(documents),
+            desc="Processing PDFs",
+            unit="pdf",
+        ):
+            results.append(result)
+            if metrics_file:
+                metrics.write_textfile(metrics_file)
+        if processor.cache is not None:
+            type_text(
+                f"Page cache: {processor.cache_stats['hits']} hits, "
+                f"{processor.cache_stats['misses']} misses",
+                Fore.CYAN,
+            )
+
+    failed: int = sum(
+        1 for result in results if result.error or result.failed_pages
+    )
+    type_text(
+        f"Batch completed: {len(results) - failed} of {len(results)} PDFs "
+        "processed without errors",
+        Fore.GREEN if not failed else Fore.YELLOW,
+    )
+    if report_file:
+        write_report(
+            report_file,
+            [
+                result.report
+                or {
+                    "pdf": str(result.pdf_path),
+                    "output": str(result.output_file),
+                    "error": result.error,
+                }
+                for result in results
+            ],
+        )
+        type_text(f"Run report saved to: {report_file}", Fore.CYAN)
+    return results
+
+
+def add_processor_arguments(parser: "argparse.ArgumentParser") -> None:
+    """Add the command-line options that configure OCRProcessor to a parser."""
+    parser.add_argument(
+        "--backend",
+        choices=sorted(ENGINES),
+        default=DEFAULT_BACKEND,
+        help=f"OCR engine backend (default: {DEFAULT_BACKEND})",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help="Pages per tesseract process with --backend batch (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--executor",
+        choices=EXECUTORS,
+        default="thread",
+        help="Run OCR workers as threads or processes (default: thread)",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of OCR workers (default: one per physical CPU core)",
+    )
+    parser.add_argument(
+        "--force-ocr",
+        action="store_true",
+        help="OCR every page, even pages that already contain a text layer",
+    )
+    parser.add_argument(
+        "--image-format",
+        choices=sorted(RASTER_FORMATS),
+        default=DEFAULT_RASTER_FORMAT,
+        help=f"Page image format handed to Tesseract (default: {DEFAULT_RASTER_FORMAT})",
+    )
+    parser.add_argument(
+        "--no-in-memory",
+        dest="in_memory",
+        action="store_false",
+        help="Write rendered pages to --temp-dir instead of piping them to OCR",
+    )
+    parser.add_argument(
+        "--dpi",
+        type=int,
+        default=None,
+        help="Rendering resolution in DPI (default: 150)",
+    )
+    parser.add_argument(
+        "--scale-to",
+        type=int,
+        default=None,
+        help="Render pages so their longest side has this many pixels",
+    )
+    parser.add_argument(
+        "--adaptive-dpi",
+        action="store_true",
+        help="Choose the resolution per page from its embedded images and size",
+    )
+    parser.add_argument(
+        "--no-extract-images",
+        dest="extract_images",
+        action="store_false",
+        help="Always render pages with pdftoppm, even single-image scanned pages",
+    )
+    parser.add_argument(
+        "--temp-dir",
+        default=None,
+        help="Directory for temporary page images (default: /dev/shm or $TMPDIR)",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse OCR results for pages that were already processed",
+    )
+    parser.add_argument(
+        "--cache-path",
+        default=None,
+        help="Page cache database (default: per-user cache directory)",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=DEFAULT_CACHE_SIZE // (1024 * 1024),
+        help="Page cache size limit in MB (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--raster-workers",
+        type=int,
+        default=None,
+        help="Page ranges rasterized in parallel (default: one per 4 OCR workers)",
+    )
+    parser.add_argument(
+        "--omp-thread-limit",
+        type=int,
+        default=1,
+        help="OMP_THREAD_LIMIT for each Tesseract worker, 0 to leave unset (default: 1)",
+    )
+    parser.add_argument(
+        "--skip-blank",
+        action="store_true",
+        help="Detect blank pages and skip OCR for them (requires NumPy)",
+    )
+    parser.add_argument(
+        "--blank-threshold",
+        type=float,
+        default=DEFAULT_BLANK_THRESHOLD,
+        help="Largest share of ink pixels on a blank page (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--preprocess",
+        default=None,
+        metavar="STEPS",
+        help="Clean up page images before OCR (requires NumPy): comma-separated "
+        "steps from crop, deskew, denoise, binarize, or 'all'",
+    )
+    parser.add_argument(
+        "--psm",
+        type=int,
+        default=None,
+        help="Tesseract page segmentation mode, e.g. 4 or 6 for single-column "
+        "books (default: Tesseract's 3)",
+    )
+    parser.add_argument(
+        "--oem",
+        type=int,
+        default=None,
+        help="Tesseract OCR engine mode: 0 legacy, 1 LSTM only, 2 both, 3 default",
+    )
+    parser.add_argument(
+        "-c",
+        "--tesseract-var",
+        dest="tesseract_variables",
+        action="append",
+        default=[],
+        metavar="NAME=VALUE",
+        help="Set a Tesseract variable; may be repeated",
+    )
+    parser.add_argument(
+        "--tesseract-config",
+        dest="tesseract_config_files",
+        action="append",
+        default=[],
+        metavar="FILE",
+        help="Read Tesseract variables from a config file; may be repeated",
+    )
+    parser.add_argument(
+        "--no-dictionary",
+        action="store_true",
+        help="Do not load Tesseract's word lists (load_system_dawg=0, load_freq_dawg=0)",
+    )
+    parser.add_argument(
+        "--model",
+        default=None,
+        metavar="NAME",
+        help="Traineddata model to use instead of --language: a name such as "
+        "ben or script/Bengali, or a .traineddata file (see --list-models)",
+    )
+    parser.add_argument(
+        "--tessdata-dir",
+        default=None,
+        metavar="DIR",
+        help="Load models from this directory, e.g. a tessdata_fast or "
+        "tessdata_best checkout",
+    )
+
+
+def add_metrics_arguments(parser: "argparse.ArgumentParser") -> None:
+    """Add the command-line options that expose Prometheus metrics to a parser."""
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=None,
+        help="Serve Prometheus metrics at http://ADDRESS:PORT/metrics while running",
+    )
+    parser.add_argument(
+        "--metrics-address",
+        default="127.0.0.1",
+        help="Interface for --metrics-port (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--metrics-file",
+        default=None,
+        help="Write Prometheus metrics to this file for the textfile collector",
+    )
+
+
+def processor_options(args: "argparse.Namespace") -> Dict[str, Any]:
+    """Turn the options added by add_processor_arguments into OCRProcessor kwargs."""
+    return {
+        "backend": args.backend,
+        "batch_size": args.batch_size,
+        "executor": args.executor,
+        "workers": args.workers,
+        "raster_workers": args.raster_workers,
+        "omp_thread_limit": args.omp_thread_limit or None,
+        "cache": (args.cache_path or True) if args.cache else None,
+        "cache_size": args.cache_size * 1024 * 1024,
+        "force_ocr": args.force_ocr,
+        "temp_dir": args.temp_dir,
+        "image_format": args.image_format,
+        "in_memory": args.in_memory,
+        "dpi": args.dpi,
+        "scale_to": args.scale_to,
+        "adaptive_dpi": args.adaptive_dpi,
+        "extract_images": args.extract_images,
+        "skip_blank": args.skip_blank,
+        "blank_threshold": args.blank_threshold,
+        "preprocess": args.preprocess,
+        "tesseract_config": make_tesseract_config(
+            args.psm,
+            args.oem,
+            [
+                *(NO_DICTIONARY_VARIABLES if args.no_dictionary else ()),
+                *args.tesseract_variables,
+            ],
+            args.tesseract_config_files,
+        ),
+        "model": args.model,
+        "tessdata_dir": args.tessdata_dir,
+    }
+
+
+def list_models(tessdata_dir: Optional[str] = None) -> None:
+    """Print the installed Bengali models with their variant and size."""
+    models: List[ModelInfo] = discover_models(tessdata_dir)
+    if not models:
+        type_text("No Bengali traineddata models found.", Fore.RED)
+        return
+    type_text(f"{'model':<20} {'variant':<9} {'engines':<12} {'size':>9}  directory")
+    for model in models:
+        type_text(
+            f"{model.name:<20} {model.variant:<9} {'+'.join(model.engines):<12} "
+            f"{model.size / (1024 * 1024):>6.1f} MB  {model.tessdata_dir}"
+            + ("  (custom)" if model.custom else ""),
+            Fore.CYAN,
+        )
+
+
 def main() -> None:
     """Main function to handle command-line interface."""
+    import argparse
+    import pkgutil
+
+    configure_console()
     parser: argparse.ArgumentParser = argparse.ArgumentParser(
         description="Extract text from PDF using OCR"
     )
@@ -255,10 +2505,32 @@ def main() -> None:
     parser.add_argument(
         "-l", "--language", default="ben", help="Language for OCR (default: ben)"
     )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted run, only processing pages it did not finish",
+    )
+    parser.add_argument(
+        "--report",
+        default=None,
+        help="Write per-stage timings and page details to this JSON file",
+    )
+    parser.add_argument(
+        "--list-models",
+        action="store_true",
+        help="List the installed Bengali traineddata models and exit",
+    )
+    add_metrics_arguments(parser)
+
+    add_processor_arguments(parser)
 
     args: argparse.Namespace
     args, _ = parser.parse_known_args()
 
+    if args.list_models:
+        list_models(args.tessdata_dir)
+        return
+
     if not args.pdf_path:
         try:
             default_pdf = pkgutil.get_data(__package__, "data/Freedom Fight.pdf")
@@ -285,7 +2557,17 @@ def main() -> None:
     try:
         type_text("Bangla PDF OCR", Fore.YELLOW)
         type_text("----------------", Fore.YELLOW)
-        extracted_text: str = process_pdf(args.pdf_path, args.output, args.language)
+        if args.metrics_port is not None:
+            metrics.start_http_server(args.metrics_port, args.metrics_address)
+        extracted_text: str = process_pdf(
+            args.pdf_path,
+            args.output,
+            args.language,
+            resume=args.resume,
+            report_file=args.report,
+            metrics_file=args.metrics_file,
+            **processor_options(args),
+        )
         type_text(
             f"Extraction completed successfully. Processed file: {args.pdf_path}",
             Fore.GREEN,
@@ -299,8 +2581,96 @@ def main() -> None:
         type_text("An error occurred. Please check the log for details.", Fore.RED)
 
 
+def batch_main() -> None:
+    """Command-line interface for processing many PDFs with one worker pool."""
+    import argparse
+
+    configure_console()
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description="Extract text from many PDFs using OCR with a shared worker pool"
+    )
+    parser.add_argument(
+        "inputs",
+        nargs="+",
+        help="PDF files, directories, glob patterns or @file lists",
+    )
+    parser.add_argument(
+        "-o",
+        "--output-dir",
+        default=None,
+        help="Directory for the text files (default: next to each PDF)",
+    )
+    parser.add_argument(
+        "-l", "--language", default="ben", help="Language for OCR (default: ben)"
+    )
+    parser.add_argument(
+        "-j",
+        "--documents",
+        type=int,
+        default=None,
+        help="PDFs processed at the same time (default: one per two OCR workers)",
+    )
+    parser.add_argument(
+        "--skip-existing",
+        action="store_true",
+        help="Skip PDFs whose text file already exists",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue interrupted documents, only processing unfinished pages",
+    )
+    parser.add_argument(
+        "--report",
+        default=None,
+        help="Write per-stage timings of every PDF to this JSON file",
+    )
+    add_metrics_arguments(parser)
+
+    add_processor_arguments(parser)
+
+    args: argparse.Namespace = parser.parse_args()
+    if args.documents is not None and args.documents < 1:
+        parser.error("--documents must be at least 1")
+
+    type_text("Bangla PDF OCR", Fore.YELLOW)
+    type_text("----------------", Fore.YELLOW)
+    try:
+        if args.metrics_port is not None:
+            metrics.start_http_server(args.metrics_port, args.metrics_address)
+        results: List[DocumentResult] = process_batch(
+            args.inputs,
+            args.output_dir,
+            args.language,
+            resume=args.resume,
+            skip_existing=args.skip_existing,
+            max_documents=args.documents,
+            report_file=args.report,
+            metrics_file=args.metrics_file,
+            **processor_options(args),
+        )
+    except Exception as e:
+        logger.error(f"An error occurred during batch processing: {e}")
+        type_text("An error occurred. Please check the log for details.", Fore.RED)
+        sys.exit(1)
+    for result in results:
+        if result.error:
+            type_text(f"Failed: {result.pdf_path}: {result.error}", Fore.RED)
+        elif result.failed_pages:
+            type_text(
+                f"Incomplete: {result.pdf_path}: {result.failed_pages} of "
+                f"{result.pages} pages failed",
+                Fore.YELLOW,
+            )
+    if any(result.error or result.failed_pages for result in results):
+        sys.exit(1)
+
+
 def setup_dependencies():
     """Set up and verify system dependencies for OCR processing."""
+    import platform
+
+    configure_console()
     system = platform.system().lower()
     print(Fore.YELLOW + Style.BRIGHT + "\nSystem Information:")
     print(
@@ -312,8 +2682,9 @@ def setup_dependencies():
 
     print(Fore.YELLOW + Style.BRIGHT + "\nChecking system dependencies:")
 
-    tesseract = OCRProcessor.find_program("tesseract")
-    pdftoppm = OCRProcessor.find_program("pdftoppm")
+    toolchain: Toolchain = get_toolchain()
+    tesseract = toolchain.tesseract_path
+    pdftoppm = toolchain.poppler_path
 
     if system.startswith("win"):
         install_windows_dependencies(tesseract, pdftoppm)
@@ -329,7 +2700,8 @@ def setup_dependencies():
         show_manual_install_instructions()
 
     print(Fore.YELLOW + "\nVerifying installation:")
-    verify_installation()
+    # The installers may have changed what is on the system.
+    verify_installation(get_toolchain(refresh=True))
 
 
 def install_windows_dependencies(tesseract, pdftoppm):
@@ -401,22 +2773,46 @@ def install_macos_dependencies(tesseract, pdftoppm):
         show_manual_install_instructions()
 
 
-def verify_installation():
+def verify_installation(toolchain: Optional[Toolchain] = None):
     """Verify the installation of Poppler and Tesseract, including Bengali language files."""
-    pdftoppm = OCRProcessor.find_program("pdftoppm")
-    tesseract = OCRProcessor.find_program("tesseract")
+    import platform
+
+    configure_console()
+    toolchain = toolchain or get_toolchain()
+    pdftoppm = toolchain.poppler_path
+    tesseract = toolchain.tesseract_path
     system = platform.system().lower()
 
     if pdftoppm:
-        print(Fore.GREEN + f"Poppler (pdftoppm) found at: {pdftoppm}")
+        print(
+            Fore.GREEN
+            + f"Poppler (pdftoppm) found in: {pdftoppm}"
+            + f" (version {toolchain.poppler_version or 'unknown'})"
+        )
     else:
         print(
             Fore.RED + "Poppler (pdftoppm) not found. Please check your installation."
         )
 
     if tesseract:
-        print(Fore.GREEN + f"Tesseract found at: {tesseract}")
-        bengali_lang = OCRProcessor().find_bengali_traineddata()
+        print(
+            Fore.GREEN
+            + f"Tesseract found at: {tesseract}"
+            + f" (version {toolchain.tesseract_version or 'unknown'})"
+        )
+        if toolchain.languages:
+            print(Fore.GREEN + f"Languages: {', '.join(toolchain.languages)}")
+        bengali_models: List[ModelInfo] = discover_models(toolchain=toolchain)
+        if bengali_models:
+            print(
+                Fore.GREEN
+                + "Bengali models: "
+                + ", ".join(
+                    f"{model.name} ({model.variant}, {model.tessdata_dir})"
+                    for model in bengali_models
+                )
+            )
+        bengali_lang = find_traineddata("ben", toolchain)
         if system.startswith("win"):
             tessdata_dir = Path(tesseract).parent / "tessdata"
             bengali_script = tessdata_dir / "script" / "Bengali.traineddata"
@@ -459,6 +2855,8 @@ def verify_installation():
 
 def show_manual_install_instructions():
     """Display manual installation instructions for the current operating system."""
+    import platform
+
     system = platform.system().lower()
     print(Fore.YELLOW + "\nManual Installation Instructions:")
 
@@ -512,6 +2910,7 @@ def show_manual_install_instructions():
 
 def verify_setup():
     """Verify the Bangla PDF OCR setup."""
+    configure_console()
     print(Fore.YELLOW + Style.BRIGHT + "\nVerifying Bangla PDF OCR Setup:")
     verify_installation()
 
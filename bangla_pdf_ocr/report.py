@@ -0,0 +1,191 @@
+import os
+import json
+import time
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+# Per-page timings collected in PageResult metadata["timings"].
+PAGE_STAGES: List[str] = ["raster", "queue_wait", "preprocess", "ocr"]
+# Number of pages listed in a report's "slowest_pages".
+SLOWEST_PAGES: int = 10
+
+
+def children_cpu_time() -> Optional[float]:
+    """Return the CPU seconds of finished child processes, or None on Windows."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Return the nearest-rank percentile of a non-empty list."""
+    ordered: List[float] = sorted(values)
+    index: int = min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarize(values: List[float]) -> Dict[str, float]:
+    """Total, mean, median, 95th percentile and maximum of stage timings."""
+    if not values:
+        return {"seconds": 0.0, "pages": 0}
+    return {
+        "seconds": sum(values),
+        "pages": len(values),
+        "mean": sum(values) / len(values),
+        "p50": percentile(values, 0.5),
+        "p95": percentile(values, 0.95),
+        "max": max(values),
+    }
+
+
+class RunStats:
+    """
+    Timings gathered while one PDF is processed.
+
+    Stage times are wall-clock seconds summed over every thread that ran the
+    stage, so stages that run in parallel (rasterization, OCR) can add up to
+    more than the run's elapsed time. Page details are filled in by the
+    rasterizer threads and read back when the page's OCR result arrives.
+    Safe to use from several threads.
+
+    Attributes:
+        stages (Dict[str, float]): Seconds spent per stage.
+        pages (Dict[int, Dict[str, Any]]): Rasterization details per page.
+    """
+
+    def __init__(self) -> None:
+        self.stages: Dict[str, float] = {}
+        self.pages: Dict[int, Dict[str, Any]] = {}
+        self._lock: threading.Lock = threading.Lock()
+        self._started: float = time.monotonic()
+        self._cpu_started: float = time.process_time()
+        self._children_started: Optional[float] = children_cpu_time()
+
+    def add(self, stage: str, seconds: float) -> None:
+        """Add time to a stage."""
+        with self._lock:
+            self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+
+    @contextmanager
+    def stage(self, stage: str) -> Iterator[None]:
+        """Time the body of a ``with`` block as part of a stage."""
+        start: float = time.monotonic()
+        try:
+            yield
+        finally:
+            self.add(stage, time.monotonic() - start)
+
+    def set_page(self, page_num: int, **details: Any) -> None:
+        """Record details about a page, e.g. its rasterization time."""
+        with self._lock:
+            self.pages.setdefault(page_num, {}).update(details)
+
+    def pop_page(self, page_num: int) -> Dict[str, Any]:
+        """Remove and return the details recorded for a page."""
+        with self._lock:
+            return self.pages.pop(page_num, {})
+
+    def elapsed(self) -> Dict[str, Optional[float]]:
+        """
+        Wall time of the run and CPU time of the process so far.
+
+        CPU times are process-wide: they include any other work the process
+        and its finished children did meanwhile, such as other documents
+        processed concurrently, so they are exact only when a single run is
+        in progress.
+        """
+        children: Optional[float] = children_cpu_time()
+        return {
+            "wall": time.monotonic() - self._started,
+            "process_cpu": time.process_time() - self._cpu_started,
+            "process_children_cpu": (
+                None
+                if children is None or self._children_started is None
+                else children - self._children_started
+            ),
+        }
+
+
+def build_report(
+    stats: RunStats,
+    pages: List[Dict[str, Any]],
+    **fields: Any,
+) -> Dict[str, Any]:
+    """
+    Assemble the JSON-serializable report of one run.
+
+    Args:
+        stats (RunStats): Stage timings of the run.
+        pages (List[Dict[str, Any]]): One entry per page processed in this
+            run: its number, source, timings, image size, retries and error.
+        **fields: Extra top-level fields (input, output, settings, ...).
+
+    Returns:
+        Dict[str, Any]: The report.
+    """
+    stages: Dict[str, Any] = {
+        name: {"seconds": seconds} for name, seconds in sorted(stats.stages.items())
+    }
+    for name in PAGE_STAGES:
+        stages[name] = summarize(
+            [
+                page["timings"][name]
+                for page in pages
+                if name in page.get("timings", {})
+            ]
+        )
+
+    def page_time(page: Dict[str, Any]) -> float:
+        # Time spent working on the page, not waiting for a worker.
+        timings: Dict[str, float] = page.get("timings", {})
+        return sum(
+            timings.get(name, 0.0) for name in ("raster", "preprocess", "ocr")
+        )
+
+    counts: Dict[str, int] = {
+        "processed": len(pages),
+        "ocr": sum(1 for page in pages if page.get("source") == "ocr"),
+        "text_layer": sum(1 for page in pages if page.get("source") == "text-layer"),
+        "blank": sum(1 for page in pages if page.get("source") == "blank"),
+        "cached": sum(1 for page in pages if page.get("cached")),
+        "retried": sum(1 for page in pages if page.get("retries")),
+        "failed": sum(1 for page in pages if page.get("error")),
+    }
+    return {
+        **fields,
+        "time": stats.elapsed(),
+        "pages": counts,
+        "stages": stages,
+        "blank_pages": sorted(
+            page["page"] for page in pages if page.get("source") == "blank"
+        ),
+        "slowest_pages": sorted(pages, key=page_time, reverse=True)[:SLOWEST_PAGES],
+        "page_details": sorted(pages, key=lambda page: page["page"]),
+    }
+
+
+def format_report_summary(report: Dict[str, Any]) -> str:
+    """One line with the run's page count, wall time and busiest stages."""
+    stages: Dict[str, Any] = report["stages"]
+    busiest: List[str] = sorted(
+        (name for name in stages if stages[name]["seconds"]),
+        key=lambda name: stages[name]["seconds"],
+        reverse=True,
+    )[:3]
+    parts: str = ", ".join(f"{name} {stages[name]['seconds']:.2f}s" for name in busiest)
+    return (
+        f"Processed {report['pages']['processed']} pages in "
+        f"{report['time']['wall']:.2f}s" + (f" ({parts})" if parts else "")
+    )
+
+
+def write_report(path: str, report: Any) -> None:
+    """Write a report as JSON, replacing the file atomically."""
+    partial_file: str = f"{path}.part"
+    with open(partial_file, "w", encoding="utf-8") as file:
+        json.dump(report, file, ensure_ascii=False, indent=2)
+    os.replace(partial_file, path)
@@ -0,0 +1,361 @@
+import os
+import sys
+import json
+import logging
+import subprocess
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from .cache import default_cache_dir
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+TESSERACT_PATH: Optional[str] = os.environ.get("TESSERACT_PATH")
+POPPLER_PATH: Optional[str] = os.environ.get("POPPLER_PATH")
+# Where the resolved toolchain is remembered between runs: "1" for the
+# per-user cache directory, or a file path. Unset or empty (the default)
+# keeps discovery memoized within the process only.
+TOOLCHAIN_CACHE: Optional[str] = os.environ.get("OCR_TOOLCHAIN_CACHE")
+# Bump when the stored format changes so old files are ignored.
+TOOLCHAIN_CACHE_VERSION: int = 1
+# Environment variables that change what discovery would find.
+TOOLCHAIN_ENVIRONMENT: Tuple[str, ...] = (
+    "PATH",
+    "TESSERACT_PATH",
+    "POPPLER_PATH",
+    "TESSDATA_PREFIX",
+)
+
+
+class Toolchain(NamedTuple):
+    """The external programs used for OCR and what they provide."""
+
+    tesseract_path: Optional[str]
+    tesseract_version: Optional[str]
+    poppler_path: Optional[str]
+    poppler_version: Optional[str]
+    tessdata_dir: Optional[str]
+    languages: Tuple[str, ...]
+
+
+_toolchain: Optional[Toolchain] = None
+# (tesseract path, poppler directory), found without running either program.
+_tool_paths: Optional[Tuple[Optional[str], Optional[str]]] = None
+_toolchain_lock: threading.Lock = threading.Lock()
+
+
+def find_program(program: str) -> Optional[str]:
+    """
+    Find the path of a program in the system.
+
+    Args:
+        program (str): The name of the program to find.
+
+    Returns:
+        Optional[str]: The path to the program if found, None otherwise.
+    """
+    logger.info(f"Searching for {program}")
+    if sys.platform.startswith("win"):
+        program += ".exe"
+
+    for path in os.environ["PATH"].split(os.pathsep):
+        exe_file: Path = Path(path) / program
+        if exe_file.is_file() and os.access(str(exe_file), os.X_OK):
+            logger.info(f"Found {program} in PATH: {exe_file}")
+            return str(exe_file)
+
+    common_dirs: List[Path] = [
+        Path(os.environ.get("ProgramFiles", "C:/Program Files")),
+        Path(os.environ.get("ProgramFiles(x86)", "C:/Program Files (x86)")),
+        Path(os.environ.get("USERPROFILE", "~")) / "Downloads",
+        Path("C:/Program Files/Tesseract-OCR"),
+        Path("C:/Program Files/poppler/Library/bin"),
+        Path("C:/Program Files/poppler/poppler-24.08.0/Library/bin"),
+        Path("/usr/share/poppler"),
+        Path("/usr/share/tesseract-ocr/5/tessdata"),
+        Path("/usr/bin"),
+        Path("/usr/local/bin"),
+        Path("/usr/share"),
+        Path("/opt"),
+        Path.home() / "Downloads",
+    ]
+
+    for directory in common_dirs:
+        exe_file = directory / program
+        if exe_file.is_file() and os.access(str(exe_file), os.X_OK):
+            logger.info(f"Found {program} in common directory: {exe_file}")
+            return str(exe_file)
+
+    logger.warning(f"{program} not found")
+    return None
+
+
+def tessdata_dirs(toolchain: Optional[Toolchain] = None) -> List[Path]:
+    """
+    List the directories that may hold traineddata files, most likely first.
+
+    Args:
+        toolchain (Optional[Toolchain]): Resolved toolchain (default: the
+            process-wide one).
+
+    Returns:
+        List[Path]: Candidate directories; they need not exist.
+    """
+    toolchain = toolchain or get_toolchain()
+    directories: List[Path] = []
+    if toolchain.tessdata_dir:
+        directories.append(Path(toolchain.tessdata_dir))
+    if toolchain.tesseract_path:
+        directories.append(Path(toolchain.tesseract_path).parent / "tessdata")
+    directories += [
+        Path("/usr/share/tesseract-ocr/5/tessdata"),
+        Path("/usr/share/tesseract-ocr/4.00/tessdata"),
+        Path("/usr/share/tessdata"),
+        Path("/usr/local/share/tessdata"),
+        Path("/opt/homebrew/share/tessdata"),
+        Path.home() / ".local/share/tessdata",
+    ]
+    return directories
+
+
+def find_traineddata(
+    language: str, toolchain: Optional[Toolchain] = None
+) -> Optional[str]:
+    """
+    Find the traineddata file of a language.
+
+    Args:
+        language (str): Tesseract language code, e.g. "ben".
+        toolchain (Optional[Toolchain]): Resolved toolchain (default: the
+            process-wide one).
+
+    Returns:
+        Optional[str]: Path to the traineddata file if found, None otherwise.
+    """
+    file_name: str = f"{language}.traineddata"
+    for directory in tessdata_dirs(toolchain):
+        location: Path = directory / file_name
+        if location.is_file():
+            logger.info(f"Found {language} traineddata at: {location}")
+            return str(location)
+
+    logger.warning(f"{language} traineddata not found")
+    return None
+
+
+def _run_version_command(arguments: List[str]) -> str:
+    """Run a tool's version or listing command and return all of its output."""
+    try:
+        result: subprocess.CompletedProcess = subprocess.run(
+            arguments,
+            capture_output=True,
+            encoding="utf-8",
+            errors="replace",
+            timeout=30,
+        )
+    except (OSError, subprocess.SubprocessError) as e:
+        logger.warning(f"Could not run {arguments[0]}: {e}")
+        return ""
+    # pdftoppm prints its version to stderr, older tesseracts do as well.
+    return result.stdout + result.stderr
+
+
+def locate_tools() -> Tuple[Optional[str], Optional[str]]:
+    """Return the tesseract executable and the poppler directory, if found."""
+    tesseract_path: Optional[str] = TESSERACT_PATH or find_program("tesseract")
+    poppler_path: Optional[str] = POPPLER_PATH
+    if not poppler_path:
+        pdftoppm: Optional[str] = find_program("pdftoppm")
+        poppler_path = str(Path(pdftoppm).parent) if pdftoppm else None
+    return tesseract_path, poppler_path
+
+
+def resolve_toolchain() -> Toolchain:
+    """Locate tesseract and poppler and ask them for versions and languages."""
+    tesseract_path, poppler_path = locate_tools()
+
+    tesseract_version: Optional[str] = None
+    tessdata_dir: Optional[str] = os.environ.get("TESSDATA_PREFIX")
+    languages: List[str] = []
+    if tesseract_path:
+        # tesseract 5.3.0
+        words: List[str] = _run_version_command(
+            [tesseract_path, "--version"]
+        ).split()
+        if len(words) > 1:
+            tesseract_version = words[1]
+        listing: List[str] = _run_version_command(
+            [tesseract_path, "--list-langs"]
+        ).splitlines()
+        for index, line in enumerate(listing):
+            # List of available languages in "/usr/share/tessdata/" (3):
+            if line.startswith("List of available languages"):
+                if '"' in line:
+                    tessdata_dir = line.split('"')[1].rstrip("/\\") or tessdata_dir
+                languages = [name.strip() for name in listing[index + 1 :]]
+                break
+
+    poppler_version: Optional[str] = None
+    if poppler_path:
+        pdftoppm_path: Path = Path(poppler_path) / (
+            "pdftoppm.exe" if sys.platform.startswith("win") else "pdftoppm"
+        )
+        # pdftoppm version 22.02.0
+        words = _run_version_command([str(pdftoppm_path), "-v"]).split()
+        if "version" in words[:-1]:
+            poppler_version = words[words.index("version") + 1]
+
+    return Toolchain(
+        tesseract_path,
+        tesseract_version,
+        poppler_path,
+        poppler_version,
+        tessdata_dir,
+        tuple(sorted(name for name in languages if name)),
+    )
+
+
+def toolchain_cache_file() -> Optional[Path]:
+    """Return the file the toolchain is remembered in, or None if disabled."""
+    if not TOOLCHAIN_CACHE:
+        return None
+    if TOOLCHAIN_CACHE == "1":
+        return default_cache_dir() / "toolchain.json"
+    return Path(TOOLCHAIN_CACHE)
+
+
+def _stamps(toolchain: Toolchain) -> Dict[str, int]:
+    """Modification times of the files and directories a toolchain points to."""
+    paths: List[str] = [
+        path
+        for path in (
+            toolchain.tesseract_path,
+            toolchain.poppler_path,
+            toolchain.tessdata_dir,
+        )
+        if path
+    ]
+    return {path: os.stat(path).st_mtime_ns for path in paths}
+
+
+def _environment() -> Dict[str, Optional[str]]:
+    return {name: os.environ.get(name) for name in TOOLCHAIN_ENVIRONMENT}
+
+
+def load_toolchain(cache_file: Path) -> Optional[Toolchain]:
+    """
+    Read a remembered toolchain if it still describes this system.
+
+    The entry is only used when the environment it was resolved in is
+    unchanged and the tesseract executable, the poppler directory and the
+    tessdata directory still have the modification times recorded with it,
+    so upgrades and newly installed languages are picked up.
+
+    Args:
+        cache_file (Path): The toolchain cache file.
+
+    Returns:
+        Optional[Toolchain]: The toolchain, or None if it must be resolved again.
+    """
+    try:
+        with open(cache_file, encoding="utf-8") as file:
+            entry: Dict[str, Any] = json.load(file)
+        if entry.get("version") != TOOLCHAIN_CACHE_VERSION:
+            return None
+        if entry["environment"] != _environment():
+            return None
+        fields: Dict[str, Any] = entry["toolchain"]
+        toolchain: Toolchain = Toolchain(
+            **{**fields, "languages": tuple(fields["languages"])}
+        )
+        if _stamps(toolchain) != entry["stamps"]:
+            return None
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    return toolchain
+
+
+def save_toolchain(cache_file: Path, toolchain: Toolchain) -> None:
+    """Remember a fully resolved toolchain for later processes."""
+    try:
+        # Stat everything first, so a vanished path leaves no partial file.
+        entry: Dict[str, Any] = {
+            "version": TOOLCHAIN_CACHE_VERSION,
+            "environment": _environment(),
+            "stamps": _stamps(toolchain),
+            "toolchain": toolchain._asdict(),
+        }
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        partial_file: Path = cache_file.with_name(
+            f"{cache_file.name}.{os.getpid()}.part"
+        )
+        with open(partial_file, "w", encoding="utf-8") as file:
+            json.dump(entry, file, indent=2)
+        os.replace(partial_file, cache_file)
+    except OSError as e:
+        logger.warning(f"Could not save toolchain cache {cache_file}: {e}")
+
+
+def get_toolchain(refresh: bool = False) -> Toolchain:
+    """
+    Return the process-wide toolchain, resolving it on first use.
+
+    Resolving runs tesseract and pdftoppm for their versions and languages,
+    so it is only done when those are needed (installation checks, model
+    lookup, benchmarks); the paths alone come from :func:`get_tool_paths`.
+    The result is memoized for the process and, when $OCR_TOOLCHAIN_CACHE
+    is set, remembered in :func:`toolchain_cache_file` for the next one.
+    Toolchains with a missing program are never written to disk, so a
+    fresh install is found without clearing anything.
+
+    Args:
+        refresh (bool): Ignore the memoized and remembered toolchain, e.g.
+            after installing dependencies.
+
+    Returns:
+        Toolchain: Paths, versions, tessdata directory and languages.
+    """
+    global _toolchain, _tool_paths
+    with _toolchain_lock:
+        if _toolchain is not None and not refresh:
+            return _toolchain
+        cache_file: Optional[Path] = toolchain_cache_file()
+        toolchain: Optional[Toolchain] = None
+        if cache_file is not None and not refresh:
+            toolchain = load_toolchain(cache_file)
+            if toolchain is not None:
+                logger.info(f"Using toolchain from {cache_file}")
+        if toolchain is None:
+            toolchain = resolve_toolchain()
+            if (
+                cache_file is not None
+                and toolchain.tesseract_path
+                and toolchain.poppler_path
+            ):
+                save_toolchain(cache_file, toolchain)
+        _toolchain = toolchain
+        _tool_paths = (toolchain.tesseract_path, toolchain.poppler_path)
+        return toolchain
+
+
+def get_tool_paths(refresh: bool = False) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Return the process-wide tesseract path and poppler directory.
+
+    Only PATH and the common install directories are searched; neither
+    program is started. The result is memoized for the process, and shared
+    with :func:`get_toolchain` once that has run.
+
+    Args:
+        refresh (bool): Search again, e.g. after installing dependencies.
+
+    Returns:
+        Tuple[Optional[str], Optional[str]]: The tesseract executable and
+        the directory holding pdftoppm, each None if not found.
+    """
+    global _tool_paths
+    with _toolchain_lock:
+        if _tool_paths is None or refresh:
+            _tool_paths = locate_tools()
+        return _tool_paths
@@ -0,0 +1,140 @@
+"""
+Measure how long importing bangla_pdf_ocr takes and what it pulls in.
+
+Every run imports the package in a fresh interpreter with ``-X importtime``
+and records the wall time of the import statement, the modules it loaded
+and whether it configured logging. Modules that only the command-line tools
+need (tqdm, colorama, argparse, multiprocessing, ...) must not be imported
+and root logging must stay untouched; with ``--max-ms`` the script also fails
+when the median import time exceeds a budget, so it can guard regressions
+in CI.
+
+Usage:
+    python benchmarks/import_time.py [--statement "from bangla_pdf_ocr import
+        process_pdf"] [--repeat 10] [--max-ms 150] [--top 10] [--json out.json]
+"""
+
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+REPO_ROOT: Path = Path(__file__).resolve().parent.parent
+
+DEFAULT_STATEMENT: str = "from bangla_pdf_ocr import process_pdf"
+# Modules that must only be loaded by the console entry points or on demand.
+FORBIDDEN_MODULES: Tuple[str, ...] = (
+    "tqdm",
+    "colorama",
+    "argparse",
+    "pkgutil",
+    "platform",
+    "multiprocessing",
+    "concurrent.futures.process",
+    "sqlite3",
+)
+
+# json and logging are imported after the measurement so they are only
+# counted when the package itself needs them.
+PROBE: str = """
+import sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+import json, logging
+json.dump({{
+    "seconds": elapsed,
+    "modules": sorted(sys.modules),
+    "root_handlers": len(logging.getLogger().handlers),
+}}, sys.stdout)
+"""
+
+
+def run_once(statement: str) -> Tuple[Dict[str, Any], List[Tuple[int, str]]]:
+    """Import in a fresh interpreter; return the probe result and importtime rows."""
+    environment: Dict[str, str] = dict(os.environ)
+    environment["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [str(REPO_ROOT), environment.get("PYTHONPATH")])
+    )
+    result: subprocess.CompletedProcess = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE.format(statement=statement)],
+        capture_output=True,
+        check=True,
+        encoding="utf-8",
+        env=environment,
+    )
+    # import time: self [us] | cumulative | imported package
+    rows: List[Tuple[int, str]] = []
+    for line in result.stderr.splitlines():
+        parts: List[str] = line.split("|")
+        if len(parts) == 3 and parts[1].strip().isdigit():
+            rows.append((int(parts[1]), parts[2].strip()))
+    return json.loads(result.stdout), rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--statement", default=DEFAULT_STATEMENT)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument(
+        "--max-ms", type=float, default=None, help="Fail above this median time"
+    )
+    parser.add_argument("--top", type=int, default=10, help="Slowest imports shown")
+    parser.add_argument("--json", help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    runs: List[Dict[str, Any]] = []
+    rows: List[Tuple[int, str]] = []
+    for _ in range(args.repeat):
+        probe, rows = run_once(args.statement)
+        runs.append(probe)
+
+    times: List[float] = sorted(run["seconds"] * 1000 for run in runs)
+    median: float = statistics.median(times)
+    loaded: List[str] = runs[-1]["modules"]
+    forbidden: List[str] = [name for name in FORBIDDEN_MODULES if name in loaded]
+    handlers: int = runs[-1]["root_handlers"]
+
+    print(f"{args.statement}")
+    print(
+        f"  median {median:.1f} ms, min {times[0]:.1f} ms, max {times[-1]:.1f} ms "
+        f"over {len(times)} runs, {len(loaded)} modules loaded"
+    )
+    print("  slowest imports (cumulative, last run):")
+    for cumulative, name in sorted(rows, reverse=True)[: args.top]:
+        print(f"    {cumulative / 1000:>8.1f} ms  {name}")
+
+    failures: List[str] = []
+    if forbidden:
+        failures.append(f"imported {', '.join(forbidden)}")
+    if handlers:
+        failures.append(f"configured {handlers} root logging handlers")
+    if args.max_ms is not None and median > args.max_ms:
+        failures.append(f"median {median:.1f} ms exceeds {args.max_ms:.1f} ms")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "statement": args.statement,
+                    "times_ms": times,
+                    "median_ms": median,
+                    "modules": len(loaded),
+                    "forbidden_modules": forbidden,
+                    "root_handlers": handlers,
+                },
+                file,
+                indent=2,
+            )
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
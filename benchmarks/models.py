@@ -0,0 +1,151 @@
+"""
+Measure load time and size of the installed Bengali Tesseract models.
+
+Every model found by bangla_pdf_ocr.models.discover_models (or given with
+``--models`` as names or traineddata paths) is loaded ``--repeat`` times:
+by a tesseract process recognizing a tiny blank page, which is what every
+page costs with the "subprocess" backend, and, when libtesseract can be
+loaded, by creating a "capi" engine, the one-off cost per worker. The
+process time of ``tesseract --version`` is reported as the baseline, so
+load time is process time minus startup.
+
+To compare the speed and accuracy of variants on real pages, pass model
+files to benchmarks/tuning.py:
+``--grid model=/usr/share/tessdata_fast/ben.traineddata,/usr/share/tessdata_best/ben.traineddata``.
+
+Usage:
+    python benchmarks/models.py [--models ben script/Bengali ...]
+        [--tessdata-dir DIR] [--repeat 5] [--json models.json]
+"""
+
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bangla_pdf_ocr.engines import CAPIEngine, TesseractConfig  # noqa: E402
+from bangla_pdf_ocr.models import (  # noqa: E402
+    ModelInfo,
+    discover_models,
+    resolve_model,
+)
+from bangla_pdf_ocr.toolchain import get_toolchain  # noqa: E402
+
+# A small white page: recognizing it costs little beyond loading the model.
+BLANK_PAGE: bytes = b"P5\n64 64\n255\n" + b"\xff" * 64 * 64
+
+
+def time_process(arguments: List[str], data: Optional[bytes], repeat: int) -> float:
+    """Median wall time of running a command to completion."""
+    times: List[float] = []
+    for _ in range(repeat):
+        start: float = time.monotonic()
+        subprocess.run(arguments, input=data, capture_output=True, check=True)
+        times.append(time.monotonic() - start)
+    return statistics.median(times)
+
+
+def time_capi(tesseract_path: str, model: ModelInfo, repeat: int) -> float:
+    """Median time to create and initialize a C API engine for a model."""
+    times: List[float] = []
+    for _ in range(repeat):
+        start: float = time.monotonic()
+        engine = CAPIEngine(
+            tesseract_path, model.name, TesseractConfig(tessdata_dir=model.tessdata_dir)
+        )
+        times.append(time.monotonic() - start)
+        engine.close()
+    return statistics.median(times)
+
+
+def measure_model(
+    tesseract_path: str, model: ModelInfo, startup: float, repeat: int
+) -> Dict[str, Any]:
+    """Size and load times of one model."""
+    process: float = time_process(
+        [
+            tesseract_path,
+            "stdin",
+            "stdout",
+            "--tessdata-dir",
+            model.tessdata_dir,
+            "-l",
+            model.name,
+        ],
+        BLANK_PAGE,
+        repeat,
+    )
+    capi: Optional[float] = None
+    if CAPIEngine.is_available(tesseract_path):
+        capi = time_capi(tesseract_path, model, repeat)
+    return {
+        **model._asdict(),
+        "process_seconds": process,
+        "load_seconds": max(process - startup, 0.0),
+        "capi_load_seconds": capi,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--models",
+        nargs="+",
+        default=None,
+        help="Model names or traineddata files (default: every Bengali model found)",
+    )
+    parser.add_argument("--tessdata-dir", default=None)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    tesseract_path: Optional[str] = get_toolchain().tesseract_path
+    if not tesseract_path:
+        parser.error("tesseract not found")
+    try:
+        models: List[ModelInfo] = (
+            [resolve_model(name, args.tessdata_dir) for name in args.models]
+            if args.models
+            else discover_models(args.tessdata_dir)
+        )
+    except ValueError as e:
+        parser.error(str(e))
+    if not models:
+        parser.error("no Bengali models found; use --models or --tessdata-dir")
+
+    startup: float = time_process([tesseract_path, "--version"], None, args.repeat)
+    results: List[Dict[str, Any]] = [
+        measure_model(tesseract_path, model, startup, args.repeat) for model in models
+    ]
+
+    print(f"tesseract startup: {startup * 1000:.0f} ms")
+    print(
+        f"{'model':<20} {'variant':<9} {'MiB':>7} {'load ms':>8} {'capi ms':>8}  "
+        f"directory"
+    )
+    for r in results:
+        capi: str = (
+            f"{r['capi_load_seconds'] * 1000:>8.0f}"
+            if r["capi_load_seconds"] is not None
+            else f"{'-':>8}"
+        )
+        print(
+            f"{r['name']:<20} {r['variant']:<9} {r['size'] / (1024 * 1024):>7.1f} "
+            f"{r['load_seconds'] * 1000:>8.0f} {capi}  {r['tessdata_dir']}"
+        )
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump(
+                {"startup_seconds": startup, "results": results}, file, indent=2
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""
+Measure what each image preprocessing step costs and how it changes accuracy.
+
+The bundled "Freedom Fight.pdf" (or another PDF with ``--pdf``/``--truth``)
+is rasterized once. For every entry of ``--steps`` the page images are
+preprocessed in memory, piped to one tesseract subprocess per page and
+compared with the ground truth. Per page it reports the preprocessing
+time, the pixels and bytes handed to Tesseract and Tesseract's CPU time,
+and over the document the character and word error rates.
+
+Step lists use the ``--preprocess`` syntax (e.g. ``crop+deskew``); ``none``
+is the unprocessed baseline. To measure the same settings through the full
+worker pipeline, vary them with benchmarks/tuning.py:
+``--grid preprocess=none,crop+deskew,all``.
+
+Usage:
+    python benchmarks/preprocessing.py [--steps none crop deskew all]
+        [--dpi 300] [--json results.json]
+
+Unix only (uses the resource module).
+"""
+
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from raster_formats import children_cpu  # noqa: E402
+from suite import DEFAULT_PDF, DEFAULT_TRUTH, OCRProcessor  # noqa: E402
+
+from bangla_pdf_ocr.engines import get_engine  # noqa: E402
+from bangla_pdf_ocr.evaluation import ErrorRates, compare_documents  # noqa: E402
+from bangla_pdf_ocr.imaging import (  # noqa: E402
+    PREPROCESS_STEPS,
+    preprocess_image,
+    resolve_steps,
+)
+from bangla_pdf_ocr.ocr import PageResult, format_page  # noqa: E402
+
+
+def render_pages(processor: OCRProcessor, pdf_path: Path) -> List[Tuple[int, bytes]]:
+    """Rasterize every page to grayscale PGM in memory."""
+    processor.image_format = "gray"
+    return list(
+        processor.iter_rendered_pages(
+            pdf_path, 1, processor.get_page_count(pdf_path)
+        )
+    )
+
+
+def measure_steps(
+    processor: OCRProcessor,
+    pages: List[Tuple[int, bytes]],
+    steps: str,
+    truth: Optional[str],
+) -> Dict[str, Any]:
+    """Preprocess and recognize every page with one step list."""
+    functions = resolve_steps(steps)
+    engine = get_engine(
+        "subprocess",
+        processor.tesseract_path,
+        processor.language,
+        processor.tesseract_config,
+    )
+    preprocess_seconds: float = 0.0
+    ocr_cpu: float = 0.0
+    pixels: int = 0
+    image_bytes: int = 0
+    output: List[str] = []
+    for page_num, data in pages:
+        start: float = time.process_time()
+        image, details = preprocess_image(data, functions)
+        preprocess_seconds += time.process_time() - start
+        pixels += details["ocr_pixels"]
+        image_bytes += len(image)
+        start = children_cpu()
+        text: str = engine.recognize(image)
+        ocr_cpu += children_cpu() - start
+        output.append(format_page(PageResult(page_num, text, {})))
+
+    count: int = max(len(pages), 1)
+    result: Dict[str, Any] = {
+        "steps": steps,
+        "pages": len(pages),
+        "preprocess_cpu_per_page": preprocess_seconds / count,
+        "ocr_cpu_per_page": ocr_cpu / count,
+        "total_cpu_per_page": (preprocess_seconds + ocr_cpu) / count,
+        "pixels_per_page": pixels / count,
+        "bytes_per_page": image_bytes / count,
+        "cer": None,
+        "wer": None,
+    }
+    if truth is not None:
+        rates: ErrorRates = compare_documents("".join(output), truth)
+        result["cer"] = rates.cer
+        result["wer"] = rates.wer
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pdf", default=str(DEFAULT_PDF))
+    parser.add_argument("--truth", default=None)
+    parser.add_argument("-l", "--language", default="ben")
+    parser.add_argument("--dpi", type=int, default=300)
+    parser.add_argument(
+        "--steps",
+        nargs="+",
+        default=["none", *PREPROCESS_STEPS, "all"],
+        help="Step lists to compare, as for --preprocess",
+    )
+    parser.add_argument("--json", help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    pdf_path: Path = Path(args.pdf)
+    truth_path: Optional[str] = args.truth
+    if truth_path is None and pdf_path.resolve() == DEFAULT_PDF.resolve():
+        truth_path = str(DEFAULT_TRUTH)
+    truth: Optional[str] = None
+    if truth_path is not None:
+        with open(truth_path, encoding="utf-8") as file:
+            truth = file.read()
+
+    try:
+        for steps in args.steps:
+            resolve_steps(steps)
+    except ValueError as e:
+        parser.error(str(e))
+
+    with OCRProcessor(args.language, workers=1, dpi=args.dpi) as processor:
+        pages: List[Tuple[int, bytes]] = render_pages(processor, pdf_path)
+        results: List[Dict[str, Any]] = [
+            measure_steps(processor, pages, steps, truth) for steps in args.steps
+        ]
+
+    print(
+        f"{'steps':<28} {'prep ms':>8} {'ocr ms':>8} {'total ms':>9} "
+        f"{'Mpx/page':>9} {'KiB/page':>9} {'CER':>7} {'WER':>7}"
+    )
+    for r in results:
+        accuracy: str = (
+            f"{r['cer']:>7.2%} {r['wer']:>7.2%}" if r["cer"] is not None else ""
+        )
+        print(
+            f"{r['steps']:<28} {r['preprocess_cpu_per_page'] * 1000:>8.1f} "
+            f"{r['ocr_cpu_per_page'] * 1000:>8.1f} "
+            f"{r['total_cpu_per_page'] * 1000:>9.1f} "
+            f"{r['pixels_per_page'] / 1e6:>9.2f} "
+            f"{r['bytes_per_page'] / 1024:>9.1f} {accuracy}"
+        )
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump(
+                {"pdf": str(pdf_path), "dpi": args.dpi, "results": results},
+                file,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Compare the CPU cost of the page image formats supported by OCRProcessor.
+
+For every format the bundled "Freedom Fight.pdf" (or another PDF) is
+rasterized with pdftoppm and each page is recognized with a tesseract
+subprocess. CPU time of both child processes is measured with getrusage, so
+the numbers show what zlib compression in poppler and decompression in
+Tesseract cost per page.
+
+Usage:
+    python benchmarks/raster_formats.py [pdf_path] [--formats gray png ...]
+        [--repeat 3] [--json results.json]
+
+Unix only (uses the resource module).
+"""
+
+import sys
+import json
+import shutil
+import argparse
+import resource
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bangla_pdf_ocr.engines import get_engine  # noqa: E402
+from bangla_pdf_ocr.ocr import RASTER_FORMATS, OCRProcessor  # noqa: E402
+
+DEFAULT_PDF: Path = (
+    Path(__file__).resolve().parent.parent
+    / "bangla_pdf_ocr"
+    / "data"
+    / "Freedom Fight.pdf"
+)
+
+
+def children_cpu() -> float:
+    """Return the user + system CPU seconds used by finished child processes."""
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+def measure_format(
+    processor: OCRProcessor, pdf_path: Path, image_format: str
+) -> Dict[str, Any]:
+    """Rasterize and OCR every page in one format, returning per-page costs."""
+    processor.image_format = image_format
+    job_dir: Path = processor.make_job_dir()
+    try:
+        start: float = children_cpu()
+        pages: List[Tuple[int, Path]] = processor.rasterize_pages(
+            pdf_path, output_dir=job_dir
+        )
+        raster_cpu: float = children_cpu() - start
+        image_bytes: int = sum(image.stat().st_size for _, image in pages)
+
+        engine = get_engine(
+            "subprocess",
+            processor.tesseract_path,
+            processor.language,
+            processor.tesseract_config,
+        )
+        start = children_cpu()
+        for _, image in pages:
+            engine.recognize(image)
+        ocr_cpu: float = children_cpu() - start
+    finally:
+        shutil.rmtree(job_dir, ignore_errors=True)
+
+    count: int = max(len(pages), 1)
+    return {
+        "format": image_format,
+        "pages": len(pages),
+        "raster_cpu_per_page": raster_cpu / count,
+        "ocr_cpu_per_page": ocr_cpu / count,
+        "total_cpu_per_page": (raster_cpu + ocr_cpu) / count,
+        "bytes_per_page": image_bytes / count,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("pdf_path", nargs="?", default=str(DEFAULT_PDF))
+    parser.add_argument(
+        "--formats", nargs="+", default=list(RASTER_FORMATS), choices=RASTER_FORMATS
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    processor = OCRProcessor()
+    pdf_path = Path(args.pdf_path)
+    results: List[Dict[str, Any]] = []
+    for image_format in args.formats:
+        runs = [
+            measure_format(processor, pdf_path, image_format)
+            for _ in range(args.repeat)
+        ]
+        best: Dict[str, Any] = min(runs, key=lambda run: run["total_cpu_per_page"])
+        results.append(best)
+
+    baseline: float = next(
+        (r["total_cpu_per_page"] for r in results if r["format"] == "png"),
+        results[0]["total_cpu_per_page"],
+    )
+    print(
+        f"{'format':<6} {'raster ms':>10} {'ocr ms':>10} {'total ms':>10} "
+        f"{'vs png':>8} {'KiB/page':>10}"
+    )
+    for r in results:
+        print(
+            f"{r['format']:<6} {r['raster_cpu_per_page'] * 1000:>10.1f} "
+            f"{r['ocr_cpu_per_page'] * 1000:>10.1f} "
+            f"{r['total_cpu_per_page'] * 1000:>10.1f} "
+            f"{(r['total_cpu_per_page'] - baseline) * 1000:>+8.1f} "
+            f"{r['bytes_per_page'] / 1024:>10.1f}"
+        )
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump({"pdf": str(pdf_path), "results": results}, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
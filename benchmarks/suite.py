@@ -0,0 +1,363 @@
+"""
+Benchmark throughput, latency, memory and accuracy of OCR configurations.
+
+Every combination of ``--backends``, ``--dpi``, ``--formats``, ``--workers``
+and ``--pages`` is run on the bundled "Freedom Fight.pdf" (or another PDF)
+in a fresh interpreter, so peak RSS is measured per configuration. For each
+run the suite records pages per second, per-page latency percentiles (from
+the run report), CPU time, peak RSS of the Python process and of the
+largest tesseract/poppler child, and the character and word error rates
+against the ground-truth text (see bangla_pdf_ocr.evaluation). ``--pages``
+replicates the PDF with pdfunite to show how a configuration scales to long
+books.
+
+Results are printed as a table and, with ``--json``, written in a
+machine-readable form together with the package, tool and machine versions,
+so runs of different releases can be compared with ``--baseline``.
+
+Usage:
+    python benchmarks/suite.py [--pdf PDF --truth TXT] [--backends subprocess
+        batch] [--dpi 150 300] [--formats gray png] [--workers 1 4]
+        [--pages 500] [--repeat 3] [--json results.json]
+        [--baseline old.json]
+
+Unix only (uses the resource module).
+"""
+
+import sys
+import json
+import math
+import argparse
+import platform
+import resource
+import itertools
+import subprocess
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+REPO_ROOT: Path = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from bangla_pdf_ocr.evaluation import ErrorRates, compare_documents  # noqa: E402
+from bangla_pdf_ocr.ocr import (  # noqa: E402
+    DEFAULT_BACKEND,
+    DEFAULT_RASTER_FORMAT,
+    ENGINES,
+    RASTER_FORMATS,
+    OCRProcessor,
+    physical_cpu_count,
+)
+from bangla_pdf_ocr.report import percentile  # noqa: E402
+from bangla_pdf_ocr.toolchain import get_toolchain  # noqa: E402
+
+DATA_DIR: Path = REPO_ROOT / "bangla_pdf_ocr" / "data"
+DEFAULT_PDF: Path = DATA_DIR / "Freedom Fight.pdf"
+DEFAULT_TRUTH: Path = DATA_DIR / "Freedom Fight.txt"
+# Settings that identify a configuration, in table order.
+CONFIG_KEYS: Tuple[str, ...] = ("backend", "dpi", "image_format", "workers", "pages")
+LATENCY_PERCENTILES: Tuple[float, ...] = (0.5, 0.9, 0.95, 0.99)
+
+
+def peak_rss_mb(who: int) -> float:
+    """Peak resident set size in MiB of this process or its largest child."""
+    peak: int = resource.getrusage(who).ru_maxrss
+    # Linux reports KiB, macOS bytes.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def replicate_pdf(
+    processor: OCRProcessor, pdf_path: Path, pages: int, output_dir: Path
+) -> Path:
+    """
+    Build a PDF of at least ``pages`` pages by concatenating copies of one.
+
+    Args:
+        processor (OCRProcessor): Processor whose poppler is used.
+        pdf_path (Path): PDF to replicate.
+        pages (int): Minimum number of pages.
+        output_dir (Path): Directory for the new PDF.
+
+    Returns:
+        Path: The replicated PDF.
+    """
+    copies: int = max(1, math.ceil(pages / processor.get_page_count(pdf_path)))
+    output: Path = output_dir / f"{pdf_path.stem} x{copies}.pdf"
+    subprocess.run(
+        [str(Path(processor.poppler_path) / "pdfunite")]
+        + [str(pdf_path)] * copies
+        + [str(output)],
+        check=True,
+        capture_output=True,
+    )
+    return output
+
+
+def run_config(config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Process one PDF with one configuration and measure it.
+
+    Runs in its own interpreter (see ``--run``), so the peak RSS values only
+    cover this configuration. ``config["options"]`` holds further
+    OCRProcessor keyword arguments.
+    """
+    with tempfile.TemporaryDirectory() as output_dir:
+        with OCRProcessor(
+            config["language"],
+            backend=config["backend"],
+            executor=config["executor"],
+            workers=config["workers"],
+            dpi=config["dpi"],
+            image_format=config["image_format"],
+            force_ocr=config["force_ocr"],
+            **config.get("options", {}),
+        ) as processor:
+            text: str = processor.extract_text_from_pdf(
+                config["pdf"], str(Path(output_dir) / "output.txt")
+            )
+            report: Dict[str, Any] = processor.last_report
+
+    latencies: List[float] = [
+        sum(page.get("timings", {}).values()) for page in report["page_details"]
+    ]
+    processed: int = report["pages"]["processed"]
+    wall: float = report["time"]["wall"]
+    rates: Optional[ErrorRates] = None
+    if config["truth"]:
+        with open(config["truth"], encoding="utf-8") as file:
+            rates = compare_documents(text, file.read())
+    return {
+        "pages_processed": processed,
+        "failed_pages": report["pages"]["failed"],
+        "wall_seconds": wall,
+        "pages_per_second": processed / wall if wall else None,
+        "latency_seconds": {
+            f"p{round(fraction * 100)}": percentile(latencies, fraction)
+            for fraction in LATENCY_PERCENTILES
+        }
+        if latencies
+        else {},
+        "cpu_seconds": report["time"]["process_cpu"],
+        "children_cpu_seconds": report["time"]["process_children_cpu"],
+        "peak_rss_mb": peak_rss_mb(resource.RUSAGE_SELF),
+        "peak_child_rss_mb": peak_rss_mb(resource.RUSAGE_CHILDREN),
+        "cer": rates.cer if rates else None,
+        "wer": rates.wer if rates else None,
+        "stages": {name: stage["seconds"] for name, stage in report["stages"].items()},
+    }
+
+
+def run_isolated(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Run one configuration in a fresh interpreter and return its results."""
+    with tempfile.TemporaryDirectory() as work_dir:
+        result_file: Path = Path(work_dir) / "result.json"
+        process: subprocess.CompletedProcess = subprocess.run(
+            [
+                sys.executable,
+                __file__,
+                "--run",
+                json.dumps(config),
+                "--result-file",
+                str(result_file),
+            ],
+            capture_output=True,
+            encoding="utf-8",
+            errors="replace",
+        )
+        if process.returncode != 0:
+            raise RuntimeError(
+                f"Configuration {config} failed:\n{process.stderr[-2000:]}"
+            )
+        with open(result_file, encoding="utf-8") as file:
+            return json.load(file)
+
+
+def environment() -> Dict[str, Any]:
+    """Versions of the package, tools, interpreter and machine."""
+    try:
+        from importlib.metadata import version
+
+        package_version: Optional[str] = version("bangla-pdf-ocr")
+    except Exception:
+        package_version = None
+    try:
+        commit: Optional[str] = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            check=True,
+            encoding="utf-8",
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    toolchain = get_toolchain()
+    return {
+        "package_version": package_version,
+        "commit": commit,
+        "tesseract_version": toolchain.tesseract_version,
+        "poppler_version": toolchain.poppler_version,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "physical_cores": physical_cpu_count(),
+    }
+
+
+def config_key(result: Dict[str, Any]) -> Tuple[Any, ...]:
+    return tuple(result["config"][key] for key in CONFIG_KEYS)
+
+
+def print_table(
+    results: List[Dict[str, Any]], baseline: Dict[Tuple[Any, ...], Dict[str, Any]]
+) -> None:
+    header: str = (
+        f"{'backend':<11} {'dpi':>5} {'format':<6} {'workers':>7} {'pages':>6} "
+        f"{'pages/s':>8} {'p50 s':>7} {'p95 s':>7} {'RSS MiB':>8} "
+        f"{'child MiB':>9} {'CER':>7} {'WER':>7}"
+    )
+    if baseline:
+        header += f" {'vs base':>8} {'CER diff':>9}"
+    print(header)
+    for result in results:
+        config: Dict[str, Any] = result["config"]
+        latency: Dict[str, float] = result["latency_seconds"]
+        cer: Optional[float] = result["cer"]
+        line: str = (
+            f"{config['backend']:<11} {config['dpi'] or '-':>5} "
+            f"{config['image_format']:<6} {config['workers']:>7} "
+            f"{result['pages_processed']:>6} {result['pages_per_second']:>8.2f} "
+            f"{latency.get('p50', 0.0):>7.2f} {latency.get('p95', 0.0):>7.2f} "
+            f"{result['peak_rss_mb']:>8.1f} {result['peak_child_rss_mb']:>9.1f} "
+            f"{'-' if cer is None else format(cer, '.2%'):>7} "
+            f"{'-' if result['wer'] is None else format(result['wer'], '.2%'):>7}"
+        )
+        base: Optional[Dict[str, Any]] = baseline.get(config_key(result))
+        if base:
+            speedup: float = result["pages_per_second"] / base["pages_per_second"]
+            cer_diff: str = (
+                "-"
+                if cer is None or base["cer"] is None
+                else format(cer - base["cer"], "+.2%")
+            )
+            line += f" {speedup:>7.2f}x {cer_diff:>9}"
+        print(line)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pdf", default=str(DEFAULT_PDF))
+    parser.add_argument(
+        "--truth",
+        default=None,
+        help="Ground-truth text in the output file format "
+        "(default: the bundled text for the bundled PDF)",
+    )
+    parser.add_argument("-l", "--language", default="ben")
+    parser.add_argument(
+        "--backends", nargs="+", default=[DEFAULT_BACKEND], choices=sorted(ENGINES)
+    )
+    parser.add_argument(
+        "--dpi", nargs="+", type=int, default=[0], help="0 uses the default"
+    )
+    parser.add_argument(
+        "--formats",
+        nargs="+",
+        default=[DEFAULT_RASTER_FORMAT],
+        choices=sorted(RASTER_FORMATS),
+    )
+    parser.add_argument(
+        "--workers", nargs="+", type=int, default=[physical_cpu_count()]
+    )
+    parser.add_argument(
+        "--pages",
+        nargs="+",
+        type=int,
+        default=[0],
+        help="Replicate the PDF to at least this many pages (0: as is)",
+    )
+    parser.add_argument("--executor", choices=("thread", "process"), default="thread")
+    parser.add_argument(
+        "--allow-text-layer",
+        action="store_true",
+        help="Use text layers instead of OCRing every page",
+    )
+    parser.add_argument("--repeat", type=int, default=1, help="Best of N runs")
+    parser.add_argument("--json", help="Write results to this JSON file")
+    parser.add_argument("--baseline", help="Compare with an earlier --json file")
+    parser.add_argument("--run", help=argparse.SUPPRESS)
+    parser.add_argument("--result-file", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        with open(args.result_file, "w", encoding="utf-8") as file:
+            json.dump(run_config(json.loads(args.run)), file)
+        return
+
+    pdf_path: Path = Path(args.pdf)
+    truth: Optional[str] = args.truth
+    if truth is None and pdf_path.resolve() == DEFAULT_PDF.resolve():
+        truth = str(DEFAULT_TRUTH)
+
+    baseline: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = {
+                config_key(result): result for result in json.load(file)["results"]
+            }
+
+    results: List[Dict[str, Any]] = []
+    with tempfile.TemporaryDirectory() as work_dir:
+        scaled: Dict[int, Path] = {0: pdf_path}
+        with OCRProcessor(args.language, workers=1) as processor:
+            original_pages: int = processor.get_page_count(pdf_path)
+            for pages in args.pages:
+                if pages and pages not in scaled:
+                    scaled[pages] = replicate_pdf(
+                        processor, pdf_path, pages, Path(work_dir)
+                    )
+
+        for backend, dpi, image_format, workers, pages in itertools.product(
+            args.backends, args.dpi, args.formats, args.workers, args.pages
+        ):
+            config: Dict[str, Any] = {
+                "pdf": str(scaled[pages]),
+                "truth": truth,
+                "language": args.language,
+                "backend": backend,
+                "executor": args.executor,
+                "dpi": dpi or None,
+                "image_format": image_format,
+                "workers": workers,
+                "pages": pages or original_pages,
+                "force_ocr": not args.allow_text_layer,
+            }
+            print(f"Running {', '.join(f'{k}={config[k]}' for k in CONFIG_KEYS)}")
+            runs: List[Dict[str, Any]] = [
+                run_isolated(config) for _ in range(args.repeat)
+            ]
+            best: Dict[str, Any] = max(
+                runs, key=lambda run: run["pages_per_second"] or 0.0
+            )
+            best["config"] = {**config, "pdf": str(pdf_path)}
+            best["runs_pages_per_second"] = [run["pages_per_second"] for run in runs]
+            results.append(best)
+
+    print()
+    print_table(results, baseline)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "environment": environment(),
+                    "pdf": str(pdf_path),
+                    "results": results,
+                },
+                file,
+                ensure_ascii=False,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,259 @@
+"""
+Trade accuracy against speed over a grid of OCR options.
+
+Every combination of the ``--grid`` values is run on the bundled
+"Freedom Fight.pdf" (or another PDF with ``--pdf``/``--truth``) through
+benchmarks/suite.py, measuring pages per second and the character and word
+error rates against the ground truth. The runs that are not beaten on both
+throughput and CER at once form the Pareto frontier. They are marked in the
+table, and with ``--plot`` drawn over all runs (needs matplotlib).
+
+Grid entries are OCRProcessor keyword arguments with comma-separated
+values, e.g. ``dpi=150,200,300 image_format=gray,mono adaptive_dpi=true,false``.
+Numbers, ``true``/``false`` and ``none`` are converted.
+
+Usage:
+    python benchmarks/tuning.py --grid dpi=150,200,300 image_format=gray,mono
+        [--workers 4] [--pages 100] [--json tuning.json] [--plot tuning.png]
+"""
+
+import sys
+import json
+import argparse
+import itertools
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from suite import (  # noqa: E402
+    DEFAULT_PDF,
+    DEFAULT_TRUTH,
+    OCRProcessor,
+    environment,
+    physical_cpu_count,
+    replicate_pdf,
+    run_isolated,
+)
+
+from bangla_pdf_ocr.ocr import DEFAULT_BACKEND, DEFAULT_RASTER_FORMAT  # noqa: E402
+
+# Grid keys that benchmarks/suite.py takes directly rather than as options.
+SUITE_KEYS: Tuple[str, ...] = ("backend", "dpi", "image_format", "workers")
+
+
+def parse_value(text: str) -> Any:
+    """Convert a grid value to int, float, bool or None where it looks like one."""
+    lowered: str = text.lower()
+    if lowered in ("true", "false"):
+        return lowered == "true"
+    if lowered == "none":
+        return None
+    for kind in (int, float):
+        try:
+            return kind(text)
+        except ValueError:
+            pass
+    return text
+
+
+def parse_grid(entries: List[str]) -> Dict[str, List[Any]]:
+    """Turn ``name=a,b,c`` entries into {name: [a, b, c]}."""
+    grid: Dict[str, List[Any]] = {}
+    for entry in entries:
+        name, separator, values = entry.partition("=")
+        if not separator or not values:
+            raise ValueError(f"Grid entry '{entry}' is not name=value[,value...]")
+        grid[name.replace("-", "_")] = [
+            parse_value(value) for value in values.split(",")
+        ]
+    return grid
+
+
+def measured(result: Dict[str, Any]) -> bool:
+    """True if a run has both a throughput and a CER to compare."""
+    return result["pages_per_second"] is not None and result["cer"] is not None
+
+
+def format_metric(value: Optional[float], spec: str, width: int) -> str:
+    """Format a metric, or "n/a" if the run could not measure it."""
+    return f"{'n/a':>{width}}" if value is None else f"{value:>{width}{spec}}"
+
+
+def pareto_frontier(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Return the runs no other run beats on both throughput and CER.
+
+    A run is dominated when another one is at least as fast and at least as
+    accurate, and strictly better in one of the two. Runs missing either
+    metric are left out.
+
+    Args:
+        results (List[Dict[str, Any]]): Runs with ``pages_per_second`` and
+            ``cer``.
+
+    Returns:
+        List[Dict[str, Any]]: The frontier, fastest first.
+    """
+    frontier: List[Dict[str, Any]] = []
+    best_cer: float = float("inf")
+    # Fastest first; among equally fast runs the most accurate first.
+    for result in sorted(
+        filter(measured, results),
+        key=lambda result: (-result["pages_per_second"], result["cer"]),
+    ):
+        if result["cer"] < best_cer:
+            frontier.append(result)
+            best_cer = result["cer"]
+    return frontier
+
+
+def label(settings: Dict[str, Any]) -> str:
+    return " ".join(f"{name}={value}" for name, value in settings.items())
+
+
+def plot(
+    results: List[Dict[str, Any]], frontier: List[Dict[str, Any]], path: str
+) -> None:
+    """Draw throughput against CER with the frontier highlighted."""
+    try:
+        import matplotlib
+
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+    except ImportError:
+        print("matplotlib is not installed; skipping the plot")
+        return
+    results = [result for result in results if measured(result)]
+    figure, axes = plt.subplots(figsize=(8, 5))
+    axes.scatter(
+        [result["cer"] * 100 for result in results],
+        [result["pages_per_second"] for result in results],
+        color="lightgray",
+        label="all runs",
+    )
+    axes.plot(
+        [result["cer"] * 100 for result in frontier],
+        [result["pages_per_second"] for result in frontier],
+        "o-",
+        color="tab:blue",
+        label="Pareto frontier",
+    )
+    for result in frontier:
+        axes.annotate(
+            label(result["settings"]),
+            (result["cer"] * 100, result["pages_per_second"]),
+            textcoords="offset points",
+            xytext=(5, 5),
+            fontsize=7,
+        )
+    axes.set_xlabel("Character error rate (%)")
+    axes.set_ylabel("Pages per second")
+    axes.legend()
+    figure.tight_layout()
+    figure.savefig(path, dpi=150)
+    print(f"Plot saved to {path}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--grid",
+        nargs="+",
+        required=True,
+        help="OCRProcessor options to vary, as name=value1,value2",
+    )
+    parser.add_argument("--pdf", default=str(DEFAULT_PDF))
+    parser.add_argument("--truth", default=None)
+    parser.add_argument("-l", "--language", default="ben")
+    parser.add_argument("--workers", type=int, default=physical_cpu_count())
+    parser.add_argument(
+        "--pages", type=int, default=0, help="Replicate the PDF to this many pages"
+    )
+    parser.add_argument("--repeat", type=int, default=1, help="Best of N runs")
+    parser.add_argument("--json", help="Write all runs and the frontier here")
+    parser.add_argument("--plot", help="Save a throughput vs CER chart here")
+    args = parser.parse_args()
+
+    try:
+        grid: Dict[str, List[Any]] = parse_grid(args.grid)
+    except ValueError as e:
+        parser.error(str(e))
+    pdf_path: Path = Path(args.pdf)
+    truth: Optional[str] = args.truth
+    if truth is None and pdf_path.resolve() == DEFAULT_PDF.resolve():
+        truth = str(DEFAULT_TRUTH)
+    if truth is None:
+        parser.error("--truth is required for PDFs other than the bundled one")
+
+    results: List[Dict[str, Any]] = []
+    with tempfile.TemporaryDirectory() as work_dir:
+        with OCRProcessor(args.language, workers=1) as processor:
+            page_count: int = processor.get_page_count(pdf_path)
+            run_pdf: Path = pdf_path
+            if args.pages:
+                run_pdf = replicate_pdf(processor, pdf_path, args.pages, Path(work_dir))
+        for values in itertools.product(*grid.values()):
+            settings: Dict[str, Any] = dict(zip(grid, values))
+            config: Dict[str, Any] = {
+                "pdf": str(run_pdf),
+                "truth": truth,
+                "language": args.language,
+                "backend": DEFAULT_BACKEND,
+                "executor": "thread",
+                "dpi": None,
+                "image_format": DEFAULT_RASTER_FORMAT,
+                "workers": args.workers,
+                "pages": args.pages or page_count,
+                "force_ocr": True,
+                "options": {},
+            }
+            for name, value in settings.items():
+                if name in SUITE_KEYS:
+                    config[name] = value
+                else:
+                    config["options"][name] = value
+            print(f"Running {label(settings)}")
+            runs: List[Dict[str, Any]] = [
+                run_isolated(config) for _ in range(args.repeat)
+            ]
+            best: Dict[str, Any] = max(
+                runs, key=lambda run: run["pages_per_second"] or 0.0
+            )
+            results.append({"settings": settings, **best})
+
+    frontier: List[Dict[str, Any]] = pareto_frontier(results)
+    print()
+    print(f"{'':2}{'pages/s':>8} {'CER':>7} {'WER':>7}  settings")
+    for result in sorted(
+        results, key=lambda result: -(result["pages_per_second"] or 0.0)
+    ):
+        marker: str = "* " if result in frontier else "  "
+        print(
+            f"{marker}{format_metric(result['pages_per_second'], '.2f', 8)} "
+            f"{format_metric(result['cer'], '.2%', 7)} "
+            f"{format_metric(result['wer'], '.2%', 7)}  {label(result['settings'])}"
+        )
+    print("* Pareto frontier: no other run is both faster and more accurate")
+
+    if args.plot:
+        plot(results, frontier, args.plot)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "environment": environment(),
+                    "pdf": str(pdf_path),
+                    "grid": grid,
+                    "results": results,
+                    "frontier": [result["settings"] for result in frontier],
+                },
+                file,
+                ensure_ascii=False,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
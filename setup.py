@@ -217,14 +217,19 @@ setup(
     },
     install_requires=[
         "tqdm",
-        "Pillow",
+        "Pillow>=9.1",
         "pdf2image",
         "pytesseract",
         "colorama",
     ],
+    extras_require={
+        "tesserocr": ["tesserocr"],
+        "imaging": ["numpy"],
+    },
     entry_points={
         "console_scripts": [
             "bangla-pdf-ocr=bangla_pdf_ocr.ocr:main",
+            "bangla-pdf-ocr-batch=bangla_pdf_ocr.ocr:batch_main",
             "bangla-pdf-ocr-setup=bangla_pdf_ocr.ocr:setup_dependencies",
             "bangla-pdf-ocr-verify=bangla_pdf_ocr.ocr:verify_installation",
         ],
@@ -237,5 +242,5 @@ setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
     ],
-    python_requires=">=3.6",
+    python_requires=">=3.7",
 )